@@ -16,8 +16,14 @@ Scientific Context:
 - Three properties: Host Quality, Optical Properties, Spin Coherence
 """
 
+import os
+from html import escape
+from pathlib import Path
+
 import streamlit as st
 
+import dashboard_data
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -29,16 +35,52 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Where test_dashboard_capture_FIXED.py wrote dashboard_summary.json
+DATA_DIR = Path(os.environ.get("COGNISYN_DATA_DIR", "data"))
 
 
 # ============================================================================
-# MAIN DASHBOARD
+# SECTION HELPERS
 # ============================================================================
 
-def main():
-    """Main dashboard application"""
+@st.cache_resource
+def image_bytes(path):
+    """PNG bytes read once per server process, shared by every session."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@st.cache_data
+def load_live_summary(path, mtime_ns):
+    """Parsed summary index. mtime_ns is only part of the cache key, so a new
+    capture run invalidates the cached copy without re-reading on every rerun."""
+    return dashboard_data.load_summary(path)
+
+
+def live_summary():
+    """Latest capture summary from DATA_DIR, or the illustrative numbers."""
+    path = DATA_DIR / dashboard_data.SUMMARY_FILE
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return dashboard_data.ILLUSTRATIVE_SUMMARY
+    return load_live_summary(str(path), mtime_ns)
 
-    # Custom CSS - larger fonts for Streamlit's low-res rendering
+
+def lazy_section(title, render, key):
+    """Header plus a toggle: render() only runs, and its content and images
+    are only sent to the browser, once the visitor opens the section."""
+    st.header(title)
+    if st.toggle(f"Show {title}", key=key):
+        render()
+
+
+# ============================================================================
+# STYLES
+# ============================================================================
+
+def render_styles():
+    """Custom CSS - larger fonts for Streamlit's low-res rendering"""
     st.markdown("""
         <style>
         .main {background-color: #0e1117;}
@@ -50,10 +92,12 @@ def main():
         </style>
     """, unsafe_allow_html=True)
 
-    # ========================================================================
-    # HEADER
-    # ========================================================================
 
+# ============================================================================
+# HEADER
+# ============================================================================
+
+def render_header():
     st.title("🔬 COGNISYN")
 
     st.markdown("""
@@ -76,10 +120,12 @@ def main():
     **What are host materials?** Crystals that Yb-171 ions are doped into (e.g., `CaWO₄:Yb³⁺` = Yb in calcium tungstate).
     """)
 
-    # ========================================================================
-    # THE PROBLEM: PICK TWO
-    # ========================================================================
 
+# ============================================================================
+# THE PROBLEM: PICK TWO
+# ============================================================================
+
+def render_problem():
     st.header("The Problem: Current Best Materials")
 
     st.markdown("""
@@ -125,10 +171,12 @@ def main():
 
     st.markdown("---")
 
-    # ========================================================================
-    # A DIFFERENT MATHEMATICS (from pitch deck slides 2 & 3)
-    # ========================================================================
 
+# ============================================================================
+# A DIFFERENT MATHEMATICS (from pitch deck slides 2 & 3)
+# ============================================================================
+
+def render_different_mathematics():
     st.header("A Different Mathematics")
 
     st.markdown("""
@@ -207,10 +255,12 @@ def main():
 
     st.markdown("---")
 
-    # ========================================================================
-    # THE STAG HUNT (from pitch deck slide 4)
-    # ========================================================================
 
+# ============================================================================
+# THE STAG HUNT (from pitch deck slide 4)
+# ============================================================================
+
+def render_stag_hunt():
     st.header("The Stag Hunt: Game Theory's Classic Cooperation Problem")
 
     st.markdown("""
@@ -322,10 +372,12 @@ def main():
 
     st.markdown("---")
 
-    # ========================================================================
-    # HOW IT WORKS: THREE AGENTS, ONE GRAMMAR
-    # ========================================================================
 
+# ============================================================================
+# HOW IT WORKS: THREE AGENTS, ONE GRAMMAR
+# ============================================================================
+
+def render_how_it_works():
     st.header("How It Works: Three Agents, One Grammar")
 
     st.markdown("""
@@ -414,10 +466,12 @@ def main():
 
     st.markdown("---")
 
-    # ========================================================================
-    # LLMs AS STRATEGIC OPERATORS (from pitch deck slide 10)
-    # ========================================================================
 
+# ============================================================================
+# LLMs AS STRATEGIC OPERATORS (from pitch deck slide 10)
+# ============================================================================
+
+def render_llm_operators():
     st.header("LLMs as Strategic Operators")
 
     st.markdown("""
@@ -448,10 +502,48 @@ Language emerges bottom-up — AI agents discover what works through doing
 
     st.markdown("---")
 
-    # ========================================================================
-    # REAL RESULTS: 5-EXAMPLE DISCOVERY PIPELINE
-    # ========================================================================
 
+# ============================================================================
+# REAL RESULTS: 5-EXAMPLE DISCOVERY PIPELINE
+# ============================================================================
+
+PIPELINE_EXAMPLES = [
+    ("Ex 1", "Cooperative Parallel Evaluation",
+     "[COMPOUNDS] [SUPERPOSE] [HOST-QUALITY]",
+     "Evaluate all 1,073 Yb compounds. H_total returns Care scores for each.",
+     "#00d4aa"),
+    ("Ex 2", "Scale Coupling Analysis",
+     "[HOST-QUALITY] [COUPLE] [OPTICAL]",
+     "Cross-scale coupling -- how does host quality affect optical properties?",
+     "#4dabf7"),
+    ("Ex 3", "Nuclear Spin Bath Analysis",
+     "[COMPOUNDS] [FILTER] [I=0]  [HOST-QUALITY] [ENTANGLE] [CARE-SYNERGY]",
+     "Two-stage pipeline: filter for zero-spin hosts, then find synergies across all three properties.",
+     "#da77f2"),
+    ("Ex 4", "Interference Pruning",
+     "[COMPOUNDS] [INTERFERE] [CARE-GUIDED]",
+     "Quantum interference: 1,073 compounds pruned to tractable set. Zero Care equilibria lost.",
+     "#ffd43b"),
+    ("Ex 5", "Full Pipeline Execution",
+     "[COMPOUNDS] [FILTER] [I=0]  [HOST-QUALITY] [COUPLE] [CROSS-SCALE]  [HOST-QUALITY] [ENTANGLE] [CARE-SYNERGY]",
+     "Three-stage pipeline: Filter -> Cross-scale coupling -> Care synergy. The full discovery workflow.",
+     "#ff6b6b"),
+]
+
+
+@st.cache_data
+def example_cards_html():
+    """All five example cards as one prebuilt HTML block."""
+    return "".join(f"""
+        <div style="background-color: #1e2130; padding: 20px; border-radius: 10px; border-left: 6px solid {color}; margin-bottom: 16px;">
+            <h4 style="color: {color}; font-size: 20px; margin-bottom: 8px;">{ex_num}: {title}</h4>
+            <code style="font-size: 16px; color: #00ffff; background-color: #0e1117; padding: 8px 12px; border-radius: 4px; display: block; margin-bottom: 12px;">{rule}</code>
+            <p style="font-size: 16px; color: #c0c0c0;">{desc}</p>
+        </div>
+        """ for ex_num, title, rule, desc, color in PIPELINE_EXAMPLES)
+
+
+def render_pipeline_examples():
     st.header("Real Results: A Discovery Pipeline Emerges")
 
     st.markdown("""
@@ -459,37 +551,7 @@ Language emerges bottom-up — AI agents discover what works through doing
     The grammar is **compositional** -- agents chain operations into pipelines:
     """)
 
-    examples = [
-        ("Ex 1", "Cooperative Parallel Evaluation",
-         "[COMPOUNDS] [SUPERPOSE] [HOST-QUALITY]",
-         "Evaluate all 1,073 Yb compounds. H_total returns Care scores for each.",
-         "#00d4aa"),
-        ("Ex 2", "Scale Coupling Analysis",
-         "[HOST-QUALITY] [COUPLE] [OPTICAL]",
-         "Cross-scale coupling -- how does host quality affect optical properties?",
-         "#4dabf7"),
-        ("Ex 3", "Nuclear Spin Bath Analysis",
-         "[COMPOUNDS] [FILTER] [I=0]  [HOST-QUALITY] [ENTANGLE] [CARE-SYNERGY]",
-         "Two-stage pipeline: filter for zero-spin hosts, then find synergies across all three properties.",
-         "#da77f2"),
-        ("Ex 4", "Interference Pruning",
-         "[COMPOUNDS] [INTERFERE] [CARE-GUIDED]",
-         "Quantum interference: 1,073 compounds pruned to tractable set. Zero Care equilibria lost.",
-         "#ffd43b"),
-        ("Ex 5", "Full Pipeline Execution",
-         "[COMPOUNDS] [FILTER] [I=0]  [HOST-QUALITY] [COUPLE] [CROSS-SCALE]  [HOST-QUALITY] [ENTANGLE] [CARE-SYNERGY]",
-         "Three-stage pipeline: Filter -> Cross-scale coupling -> Care synergy. The full discovery workflow.",
-         "#ff6b6b"),
-    ]
-
-    for ex_num, title, rule, desc, color in examples:
-        st.markdown(f"""
-        <div style="background-color: #1e2130; padding: 20px; border-radius: 10px; border-left: 6px solid {color}; margin-bottom: 16px;">
-            <h4 style="color: {color}; font-size: 20px; margin-bottom: 8px;">{ex_num}: {title}</h4>
-            <code style="font-size: 16px; color: #00ffff; background-color: #0e1117; padding: 8px 12px; border-radius: 4px; display: block; margin-bottom: 12px;">{rule}</code>
-            <p style="font-size: 16px; color: #c0c0c0;">{desc}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(example_cards_html(), unsafe_allow_html=True)
 
     st.markdown("""
     <div style="text-align: center; padding: 24px; background-color: #1e2130; border-radius: 8px; margin-top: 20px;">
@@ -502,99 +564,131 @@ Language emerges bottom-up — AI agents discover what works through doing
 
     st.markdown("---")
 
-    # ========================================================================
-    # PIPELINE OUTPUT: COMPUTED FROM MATERIALS PROJECT DATA
-    # ========================================================================
 
-    st.header("Pipeline Output: Illustrative Examples")
+# ============================================================================
+# PIPELINE OUTPUT: COMPUTED FROM MATERIALS PROJECT DATA
+# ============================================================================
 
-    st.markdown("""
-    The following output illustrates how the COGNISYN orchestration pipeline evaluates
-    **1,073 Yb-containing compounds** cached from the
-    [Materials Project](https://materialsproject.org/).
-    Compound names and crystal structures are real. Scores are computed by H_total
-    from real structure data. These are illustrative pipeline examples, not experimental discoveries.
-    """)
+def _fmt(x, spec=".2f"):
+    return "—" if x is None else format(x, spec)
 
-    # SUPERPOSE results
-    st.markdown("""
+
+def _compound_lines(rows, text, numbered=False, color="#00d4aa"):
+    """One line per compound: '1. <name>: <text(row)>' joined with <br/>."""
+    lines = []
+    for n, row in enumerate(rows, 1):
+        prefix = f"{n}. " if numbered else "• "
+        note = f" — {escape(row['note'])}" if row.get("note") else ""
+        lines.append(f'{prefix}<span style="color: {color};">{escape(row["name"])}</span>: {text(row)}{note}')
+    return "<br/>\n                ".join(lines)
+
+
+@st.cache_data
+def pipeline_output_html(summary):
+    """The SUPERPOSE, FILTER → ENTANGLE and INTERFERE cards for one summary."""
+    d = summary
+    n = d["compounds_evaluated"]
+    flt, syn, itf = d["filter"], d["synergy"], d["interfere"]
+    preserved = itf.get("preserved")
+    preserved_text = (f"All {preserved} Care equilibria preserved. Zero false negatives."
+                      if preserved is not None else "Care equilibria preserved.")
+
+    superpose = f"""
     <div style="background-color: #1e2130; padding: 24px; border-radius: 10px; border-left: 6px solid #00d4aa; margin-bottom: 20px;">
-        <h4 style="color: #00d4aa; font-size: 20px; margin-bottom: 12px;">SUPERPOSE: 1,073 Compounds Evaluated</h4>
+        <h4 style="color: #00d4aa; font-size: 20px; margin-bottom: 12px;">SUPERPOSE: {n:,} Compounds Evaluated</h4>
         <p style="font-size: 15px; color: #c0c0c0; margin-bottom: 12px;">
-            H_total identified <span style="color: #00d4aa; font-weight: bold;">26 Care equilibria</span>
-            (all three properties high) out of 1,073 compounds.
-            The remaining 1,047 are Nash equilibria (trade-offs).
+            H_total identified <span style="color: #00d4aa; font-weight: bold;">{d['care_equilibria']:,} Care equilibria</span>
+            (all three properties high) out of {n:,} compounds.
+            The remaining {n - d['care_equilibria']:,} are Nash equilibria (trade-offs).
         </p>
         <div style="background-color: #0e1117; padding: 16px; border-radius: 6px; font-family: monospace;">
-            <div style="color: #00ffff; font-size: 14px; margin-bottom: 8px;">TOP 5 — Care Equilibria (Beyond Pareto Frontier):</div>
+            <div style="color: #00ffff; font-size: 14px; margin-bottom: 8px;">TOP {len(d['care_top'])} — Care Equilibria (Beyond Pareto Frontier):</div>
             <div style="font-size: 14px; color: #e0e0e0; line-height: 2;">
-                1. <span style="color: #00d4aa;">YbOF</span>: care=0.94 — tetragonal structure<br/>
-                2. <span style="color: #00d4aa;">YbSiO₃</span>: care=0.94<br/>
-                3. <span style="color: #00d4aa;">YbCl₃</span>: care=0.94<br/>
-                4. <span style="color: #00d4aa;">Ba₂YbMoO₆</span>: care=0.93 — Ba-138 I=0 (71.7%) + heavy elements<br/>
-                5. <span style="color: #00d4aa;">Cs₂YbCl₄</span>: care=0.93 — tetragonal structure
+                {_compound_lines(d['care_top'], lambda r: f"care={_fmt(r['care'])}", numbered=True)}
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
-    # FILTER + ENTANGLE results
-    st.markdown("""
+    filter_entangle = f"""
     <div style="background-color: #1e2130; padding: 24px; border-radius: 10px; border-left: 6px solid #da77f2; margin-bottom: 20px;">
         <h4 style="color: #da77f2; font-size: 20px; margin-bottom: 12px;">FILTER I=0 → ENTANGLE: Nuclear Spin Bath + Synergy Detection</h4>
         <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 16px;">
             <div style="background-color: #0e1117; padding: 16px; border-radius: 6px;">
                 <div style="color: #00ffff; font-size: 14px; margin-bottom: 8px;">FILTER: I=0 Spin Bath Analysis</div>
                 <div style="font-size: 14px; color: #e0e0e0; line-height: 2;">
-                    1,073 → <span style="color: #00d4aa;">1,057</span> passed (i_zero &gt; 0.3)<br/>
+                    {flt['n_in']:,} → <span style="color: #00d4aa;">{flt['n_passed']:,}</span> passed (i_zero &gt; {flt['threshold']})<br/>
                     <br/>
                     Top coherence hosts:<br/>
-                    • <span style="color: #da77f2;">BaYbCuTe₃</span>: I=0 score=0.90, coherence=0.94<br/>
-                    • <span style="color: #da77f2;">Ba₃Yb₂TeO₅</span>: I=0 score=0.90, coherence=0.94<br/>
-                    • <span style="color: #da77f2;">BaSrYb₂</span>: I=0 score=0.95, coherence=0.83
+                    {_compound_lines(flt['top'], lambda r: f"I=0 score={_fmt(r['i_zero'])}, coherence={_fmt(r['coherence'])}", color="#da77f2")}
                 </div>
             </div>
             <div style="background-color: #0e1117; padding: 16px; border-radius: 6px;">
                 <div style="color: #00ffff; font-size: 14px; margin-bottom: 8px;">ENTANGLE: Multi-Agent Synergy</div>
                 <div style="font-size: 14px; color: #e0e0e0; line-height: 2;">
-                    <span style="color: #00d4aa;">26 compounds</span> where ALL THREE benefit<br/>
+                    <span style="color: #00d4aa;">{syn['count']:,} compounds</span> where ALL THREE benefit<br/>
                     <br/>
                     Top synergy compounds:<br/>
-                    • <span style="color: #00d4aa;">YbCl₃</span>: B1=0.90, B2=0.94, B3=0.90<br/>
-                    • <span style="color: #00d4aa;">YbSiO₃</span>: B1=0.90, B2=0.94, B3=0.90<br/>
-                    • <span style="color: #00d4aa;">CsYbCl₃</span>: B1=0.90, B2=0.92, B3=0.90
+                    {_compound_lines(syn['top'], lambda r: f"B1={_fmt(r['b1'])}, B2={_fmt(r['b2'])}, B3={_fmt(r['b3'])}")}
                 </div>
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
-    # INTERFERE results
-    st.markdown("""
+    interfere = f"""
     <div style="background-color: #1e2130; padding: 24px; border-radius: 10px; border-left: 6px solid #ffd43b; margin-bottom: 20px;">
-        <h4 style="color: #ffd43b; font-size: 20px; margin-bottom: 12px;">INTERFERE: Quantum Pruning — 1,073 → 25 Compounds</h4>
+        <h4 style="color: #ffd43b; font-size: 20px; margin-bottom: 12px;">INTERFERE: Quantum Pruning — {itf['n_original']:,} → {itf['n_pruned']:,} Compounds</h4>
         <p style="font-size: 15px; color: #c0c0c0; margin-bottom: 12px;">
             Care-guided interference dynamics: high-care compounds receive constructive interference (amplified),
             low-care compounds receive destructive interference (suppressed).
-            <span style="color: #00d4aa; font-weight: bold;">All 25 Care equilibria preserved. Zero false negatives.</span>
+            <span style="color: #00d4aa; font-weight: bold;">{preserved_text}</span>
         </p>
         <div style="background-color: #0e1117; padding: 16px; border-radius: 6px; font-family: monospace;">
-            <div style="color: #00ffff; font-size: 14px; margin-bottom: 8px;">TOP 5 — Post-Interference (by interference score):</div>
+            <div style="color: #00ffff; font-size: 14px; margin-bottom: 8px;">TOP {len(itf['top'])} — Post-Interference (by interference score):</div>
             <div style="font-size: 14px; color: #e0e0e0; line-height: 2;">
-                1. <span style="color: #00d4aa;">YbOF</span>: score=0.937<br/>
-                2. <span style="color: #00d4aa;">YbSiO₃</span>: score=0.936<br/>
-                3. <span style="color: #00d4aa;">YbCl₃</span>: score=0.935<br/>
-                4. <span style="color: #00d4aa;">Ba₂YbMoO₆</span>: score=0.934<br/>
-                5. <span style="color: #00d4aa;">Cs₂YbCl₄</span>: score=0.932
+                {_compound_lines(itf['top'], lambda r: f"score={_fmt(r['score'], '.3f')}", numbered=True)}
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+    return superpose, filter_entangle, interfere
 
-    st.markdown("""
+
+def render_pipeline_output():
+    summary = live_summary()
+    live = summary["source"] != "illustrative"
+    st.header("Pipeline Output: Latest Capture Run" if live else "Pipeline Output: Illustrative Examples")
+
+    if live:
+        st.markdown(f"""
+    Output of the latest capture run ({summary['generated']}) of the COGNISYN orchestration pipeline over
+    **{summary['compounds_evaluated']:,} Yb-containing compounds** cached from the
+    [Materials Project](https://materialsproject.org/).
+    Compound names and crystal structures are real. Scores are computed by H_total
+    from real structure data, not experimental discoveries.
+    """)
+    else:
+        st.markdown("""
+    The following output illustrates how the COGNISYN orchestration pipeline evaluates
+    **1,073 Yb-containing compounds** cached from the
+    [Materials Project](https://materialsproject.org/).
+    Compound names and crystal structures are real. Scores are computed by H_total
+    from real structure data. These are illustrative pipeline examples, not experimental discoveries.
+    """)
+
+    superpose, filter_entangle, interfere = pipeline_output_html(summary)
+    # SUPERPOSE results
+    st.markdown(superpose, unsafe_allow_html=True)
+    # FILTER + ENTANGLE results
+    st.markdown(filter_entangle, unsafe_allow_html=True)
+    # INTERFERE results
+    st.markdown(interfere, unsafe_allow_html=True)
+
+    st.markdown(f"""
     <div style="text-align: center; padding: 20px; background-color: #1e2130; border-radius: 8px; margin-top: 10px; margin-bottom: 10px;">
         <span style="font-size: 15px; color: #888;">
-            Illustrative pipeline output — compound names and crystal structures are real
+            {"Capture run output" if live else "Illustrative pipeline output"} — compound names and crystal structures are real
             (Materials Project, CC BY 4.0). Scores are computed, not experimental measurements.
         </span>
     </div>
@@ -602,10 +696,12 @@ Language emerges bottom-up — AI agents discover what works through doing
 
     st.markdown("---")
 
-    # ========================================================================
-    # CARE VS NASH — RESULTS COMPARISON
-    # ========================================================================
 
+# ============================================================================
+# CARE VS NASH — RESULTS COMPARISON
+# ============================================================================
+
+def render_care_vs_nash():
     st.header("The Key Insight: Care vs Nash Equilibria")
 
     col1, col2 = st.columns(2)
@@ -667,10 +763,12 @@ Language emerges bottom-up — AI agents discover what works through doing
 
     st.markdown("---")
 
-    # ========================================================================
-    # WHY RESULTS CAN'T BE HALLUCINATED (from pitch deck slide 12)
-    # ========================================================================
 
+# ============================================================================
+# WHY RESULTS CAN'T BE HALLUCINATED (from pitch deck slide 12)
+# ============================================================================
+
+def render_not_hallucinated():
     st.header("Why Results Can't Be Hallucinated")
 
     st.markdown("""
@@ -730,29 +828,35 @@ The LLMs operate the mathematics — they don't generate the answers.
 
     st.markdown("---")
 
-    # ========================================================================
-    # BY THE NUMBERS
-    # ========================================================================
+
+# ============================================================================
+# BY THE NUMBERS
+# ============================================================================
+
+def render_by_the_numbers():
+    summary = live_summary()
+    patterns = summary["strategic_patterns"]
+    patterns = f"{patterns}+" if summary["source"] == "illustrative" else f"{patterns:,}"
 
     st.header("By the Numbers")
 
-    st.markdown("""
+    st.markdown(f"""
     <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px; margin-bottom: 16px;">
         <div style="background-color: #1e2130; padding: 20px; border-radius: 10px; text-align: center;">
             <div style="font-size: 14px; color: #888;">Compounds Evaluated</div>
-            <div style="font-size: 32px; color: #00d4aa; font-weight: bold;">1,073</div>
+            <div style="font-size: 32px; color: #00d4aa; font-weight: bold;">{summary['compounds_evaluated']:,}</div>
         </div>
         <div style="background-color: #1e2130; padding: 20px; border-radius: 10px; text-align: center;">
             <div style="font-size: 14px; color: #888;">AI Agents</div>
-            <div style="font-size: 32px; color: #4dabf7; font-weight: bold;">3</div>
+            <div style="font-size: 32px; color: #4dabf7; font-weight: bold;">{summary['agents']}</div>
         </div>
         <div style="background-color: #1e2130; padding: 20px; border-radius: 10px; text-align: center;">
             <div style="font-size: 14px; color: #888;">Properties Optimized</div>
-            <div style="font-size: 32px; color: #da77f2; font-weight: bold;">3</div>
+            <div style="font-size: 32px; color: #da77f2; font-weight: bold;">{summary['properties']}</div>
         </div>
         <div style="background-color: #1e2130; padding: 20px; border-radius: 10px; text-align: center;">
             <div style="font-size: 14px; color: #888;">Strategic Patterns</div>
-            <div style="font-size: 32px; color: #ffd43b; font-weight: bold;">24+</div>
+            <div style="font-size: 32px; color: #ffd43b; font-weight: bold;">{patterns}</div>
         </div>
     </div>
     <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px;">
@@ -778,10 +882,12 @@ The LLMs operate the mathematics — they don't generate the answers.
 
     st.markdown("---")
 
-    # ========================================================================
-    # PLATFORM VALIDATION: PID CONTROL SYSTEMS (from pitch deck slide 7)
-    # ========================================================================
 
+# ============================================================================
+# PLATFORM VALIDATION: PID CONTROL SYSTEMS (from pitch deck slide 7)
+# ============================================================================
+
+def render_platform_validation():
     st.header("Platform Validation: Same Math. Different Domain.")
 
     st.markdown("""
@@ -876,10 +982,12 @@ The LLMs operate the mathematics — they don't generate the answers.
 
     st.markdown("---")
 
-    # ========================================================================
-    # MARKET EXPANSION: NOW → NEXT → FUTURE (from pitch deck slide 14)
-    # ========================================================================
 
+# ============================================================================
+# MARKET EXPANSION: NOW → NEXT → FUTURE (from pitch deck slide 14)
+# ============================================================================
+
+def render_market_expansion():
     st.header("Market Expansion: NOW → NEXT → FUTURE")
 
     st.markdown("""
@@ -949,12 +1057,12 @@ FUTURE — more "pick two" problems:
 
     st.markdown("---")
 
-    # ========================================================================
-    # ORCHESTRATION MONITOR
-    # ========================================================================
 
-    st.header("Orchestration Monitor")
+# ============================================================================
+# ORCHESTRATION MONITOR
+# ============================================================================
 
+def render_orchestration_monitor():
     st.markdown("""
     Three agents — **B1 (Host Quality)**, **B2 (Optical)**, **B3 (Coherence)** — each run
     5 examples in parallel, building from single operations to multi-stage pipelines.
@@ -1002,15 +1110,15 @@ result = await b.orchestrate_mathematics(rule, ctx, {'day': 6})
 
     col1, col2 = st.columns(2)
     with col1:
-        st.image("dashboard_overview.png", caption="System overview: 5/5 examples, 3/3 agents, 1,073 compounds, 24 patterns")
+        st.image(image_bytes("dashboard_overview.png"), caption="System overview: 5/5 examples, 3/3 agents, 1,073 compounds, 24 patterns")
     with col2:
-        st.image("dashboard_b1_examples.png", caption="B1 (Host Quality): All 5 examples — SUPERPOSE through full pipeline")
+        st.image(image_bytes("dashboard_b1_examples.png"), caption="B1 (Host Quality): All 5 examples — SUPERPOSE through full pipeline")
 
     col1, col2 = st.columns(2)
     with col1:
-        st.image("dashboard_b2_optical.png", caption="B2 (Optical): All 5 examples — evaluating from optical perspective")
+        st.image(image_bytes("dashboard_b2_optical.png"), caption="B2 (Optical): All 5 examples — evaluating from optical perspective")
     with col2:
-        st.image("dashboard_b3_coherence.png", caption="B3 (Coherence): All 5 examples — evaluating from spin coherence perspective")
+        st.image(image_bytes("dashboard_b3_coherence.png"), caption="B3 (Coherence): All 5 examples — evaluating from spin coherence perspective")
 
     st.markdown("""
     <div style="text-align: center; padding: 16px; background-color: #1e2130; border-radius: 8px;">
@@ -1034,33 +1142,38 @@ result = await b.orchestrate_mathematics(rule, ctx, {'day': 6})
     and invent new compositional rules — building cumulative intelligence across the pipeline.
     """)
 
-    st.markdown("""
+    # Counts come from the binary checkpoint headers, via the capture summary
+    summary = live_summary()
+    memory = summary.get("memory", dashboard_data.ILLUSTRATIVE_SUMMARY["memory"])
+    source = ("Illustrative test run data." if summary["source"] == "illustrative"
+              else f"Day {summary.get('day', 6)} capture run ({summary['generated']}).")
+    st.markdown(f"""
     <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px; margin-bottom: 16px;">
         <div style="background-color: #1e2130; padding: 20px; border-radius: 10px; text-align: center;">
             <div style="font-size: 14px; color: #888;">Episodic Memory</div>
-            <div style="font-size: 32px; color: #00d4aa; font-weight: bold;">100</div>
+            <div style="font-size: 32px; color: #00d4aa; font-weight: bold;">{memory['episodes']:,}</div>
             <div style="font-size: 12px; color: #666;">episodes</div>
         </div>
         <div style="background-color: #1e2130; padding: 20px; border-radius: 10px; text-align: center;">
             <div style="font-size: 14px; color: #888;">Strategic Patterns</div>
-            <div style="font-size: 32px; color: #4dabf7; font-weight: bold;">4</div>
+            <div style="font-size: 32px; color: #4dabf7; font-weight: bold;">{memory['patterns']:,}</div>
             <div style="font-size: 12px; color: #666;">discovered</div>
         </div>
         <div style="background-color: #1e2130; padding: 20px; border-radius: 10px; text-align: center;">
             <div style="font-size: 14px; color: #888;">Rules Invented</div>
-            <div style="font-size: 32px; color: #ffd43b; font-weight: bold;">5</div>
+            <div style="font-size: 32px; color: #ffd43b; font-weight: bold;">{memory['rules']:,}</div>
             <div style="font-size: 12px; color: #666;">Baba is Quantum</div>
         </div>
         <div style="background-color: #1e2130; padding: 20px; border-radius: 10px; text-align: center;">
             <div style="font-size: 14px; color: #888;">Total Memories</div>
-            <div style="font-size: 32px; color: #ff6b6b; font-weight: bold;">106</div>
+            <div style="font-size: 32px; color: #ff6b6b; font-weight: bold;">{memory['memories']:,}</div>
             <div style="font-size: 12px; color: #666;">accumulated</div>
         </div>
     </div>
     <div style="text-align: center; padding: 12px; background-color: #1e2130; border-radius: 8px;">
         <span style="font-size: 14px; color: #888;">
             Data from DynamicMemoryArchitecture checkpoint files — agents learn and retain knowledge across examples.
-            Illustrative test run data.
+            {source}
         </span>
     </div>
     """, unsafe_allow_html=True)
@@ -1123,14 +1236,12 @@ Not ephemeral sessions — learning that persists
 <span style="font-size: 15px; color: #4dabf7; font-style: italic;">One mechanism delivers all three — no hyperparameter tuning required</span>
 </div>""", unsafe_allow_html=True)
 
-    st.markdown("---")
-
-    # ========================================================================
-    # THE MATHEMATICAL FOUNDATION (from pitch deck slide 9)
-    # ========================================================================
 
-    st.header("The Mathematical Foundation")
+# ============================================================================
+# THE MATHEMATICAL FOUNDATION (from pitch deck slide 9)
+# ============================================================================
 
+def render_mathematical_foundation():
     st.markdown("""
     <div style="padding: 24px; background-color: #1e2130; border: 2px solid #4dabf7; border-radius: 10px; margin-top: 20px; margin-bottom: 20px;">
         <div style="font-size: 16px; color: #4dabf7; font-weight: 700; text-align: center; margin-bottom: 16px;">
@@ -1160,12 +1271,12 @@ Not ephemeral sessions — learning that persists
     </div>
     """, unsafe_allow_html=True)
 
-    st.markdown("---")
 
-    # ========================================================================
-    # CONTACT
-    # ========================================================================
+# ============================================================================
+# CONTACT
+# ============================================================================
 
+def render_contact():
     st.header("Contact")
 
     st.markdown("""
@@ -1177,10 +1288,11 @@ Not ephemeral sessions — learning that persists
     """)
 
 
-    # ========================================================================
-    # FOOTER (formerly sidebar)
-    # ========================================================================
+# ============================================================================
+# FOOTER (formerly sidebar)
+# ============================================================================
 
+def render_footer():
     st.markdown("---")
 
     st.markdown("""
@@ -1190,6 +1302,36 @@ Not ephemeral sessions — learning that persists
     st.caption("Powered by COGNISYN · Built with Streamlit")
 
 
+# ============================================================================
+# MAIN DASHBOARD
+# ============================================================================
+
+def main():
+    """Main dashboard application"""
+    render_styles()
+    render_header()
+    render_problem()
+    render_different_mathematics()
+    render_stag_hunt()
+    render_how_it_works()
+    render_llm_operators()
+    render_pipeline_examples()
+    render_pipeline_output()
+    render_care_vs_nash()
+    render_not_hallucinated()
+    render_by_the_numbers()
+    render_platform_validation()
+    render_market_expansion()
+    # Lower sections are the heaviest (code listing, four screenshots) and
+    # most visitors never reach them, so they render on demand
+    lazy_section("Orchestration Monitor", render_orchestration_monitor, key="show_monitor")
+    st.markdown("---")
+    lazy_section("The Mathematical Foundation", render_mathematical_foundation, key="show_foundation")
+    st.markdown("---")
+    render_contact()
+    render_footer()
+
+
 # ============================================================================
 # RUN
 # ============================================================================
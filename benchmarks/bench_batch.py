@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+A burst of agent rules: one await per rule vs one orchestrate_batch() call.
+
+Run from the repo root:
+    python benchmarks/bench_batch.py
+    python benchmarks/bench_batch.py --rules 200 --cache
+
+The burst repeats rules the way agents do within a turn (same verb and
+property, often the same triple). The orchestration cache is off unless
+--cache is given, so the batch's own deduplication is what is measured.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+VERBS = ('SUPERPOSE', 'FILTER', 'INTERFERE', 'COUPLE', 'ENTANGLE')
+
+
+def burst(harness, n, seed=0):
+    """n rules drawn from the verbs and properties the examples use."""
+    rng = np.random.default_rng(seed)
+    props = list(harness.AGENT_PROPERTIES.values())
+    rules = []
+    for _ in range(n):
+        verb = VERBS[rng.integers(len(VERBS))]
+        prop = props[rng.integers(len(props))]
+        if verb == 'FILTER':
+            rules.append(harness.make_rule('COMPOUNDS', verb, 'I=0'))
+        elif verb == 'INTERFERE':
+            rules.append(harness.make_rule('COMPOUNDS', verb, 'CARE-GUIDED'))
+        elif verb == 'COUPLE':
+            rules.append(harness.make_rule(prop, verb, 'CROSS-SCALE'))
+        elif verb == 'ENTANGLE':
+            rules.append(harness.make_rule(prop, verb, 'CARE-SYNERGY'))
+        else:
+            rules.append(harness.make_rule('COMPOUNDS', verb, prop))
+    return rules
+
+
+async def one_by_one(bridge, rules, ctx):
+    return [await bridge.orchestrate_mathematics(rule, dict(ctx), {'day': 6}) for rule in rules]
+
+
+async def batched(bridge, rules, ctx):
+    # setup_bridge() installs orchestrate_batch; the bridge validates each rule
+    out = [None] * len(rules)
+    async for item in bridge.orchestrate_batch(rules, ctx, {'day': 6}):
+        if item.error is not None:
+            raise item.error
+        out[item.index] = item.result
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rules', type=int, nargs='+', default=[10, 50, 200])
+    parser.add_argument('--agent', default='B1')
+    parser.add_argument('--cache', action='store_true', help='install the orchestration cache')
+    args = parser.parse_args()
+
+    import test_dashboard_capture_FIXED as harness
+
+    bridge = harness.setup_bridge(args.agent, cache=args.cache)
+    ctx = {'day': 6, 'agent_id': args.agent}
+    print(f"{'rules':>6} {'distinct':>9} {'sequential s':>13} {'batch s':>8} {'speedup':>8}")
+    for n in args.rules:
+        rules = burst(harness, n)
+        distinct = len({(r.subject, r.verb, r.property) for r in rules})
+        t0 = time.perf_counter()
+        seq = asyncio.run(one_by_one(bridge, rules, ctx))
+        t_seq = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        out = asyncio.run(batched(bridge, rules, ctx))
+        t_batch = time.perf_counter() - t0
+        assert [r.mathematical_state.get('type') for r in out] == [r.mathematical_state.get('type') for r in seq]
+        print(f"{n:>6} {distinct:>9} {t_seq:>13.3f} {t_batch:>8.3f} {t_seq / t_batch:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
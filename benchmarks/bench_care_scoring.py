@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Care-equilibrium detection: per-compound Python loop vs vectorized mask.
+
+Run from the repo root:
+    python benchmarks/bench_care_scoring.py
+    python benchmarks/bench_care_scoring.py --sizes 1000 100000 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from care_scoring import CARE_THRESHOLD, care_mask, synthetic_scores
+
+
+def loop_care(rows, threshold=CARE_THRESHOLD):
+    """The per-compound form: one comparison chain per compound."""
+    return [i for i, (b1, b2, b3) in enumerate(rows)
+            if b1 > threshold and b2 > threshold and b3 > threshold]
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'compounds':>10} {'loop ms':>10} {'numpy ms':>10} {'speedup':>8} {'care eq':>8}")
+    for n in args.sizes:
+        scores = synthetic_scores(n)
+        rows = scores.tolist()
+        t_loop, loop_idx = best_of(lambda: loop_care(rows), args.repeat)
+        t_vec, mask = best_of(lambda: care_mask(scores), args.repeat)
+        assert loop_idx == mask.nonzero()[0].tolist()
+        print(f"{n:>10,} {t_loop * 1e3:>10.2f} {t_vec * 1e3:>10.2f} {t_loop / t_vec:>7.1f}x {int(mask.sum()):>8,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+The five run_examples() pipelines per agent, on synthetic compound sets.
+
+Each compound-set size runs in a fresh process so peak RSS is per size.
+Every orchestrate_mathematics call is timed as a stage. Results go to a
+JSON file, and are compared against a saved baseline when there is one:
+
+    python benchmarks/bench_examples.py --save-baseline      # once, on a known-good tree
+    python benchmarks/bench_examples.py                      # later: exits 1 on regressions
+    python benchmarks/bench_examples.py --sizes 1000 10000 --agents B1
+
+Synthetic sets resample the adapter's cached compounds with new ids and
+jittered scores, so they carry whatever keys the engine reads. The
+orchestration cache is off unless --cache is given, so stage times are
+engine time.
+"""
+import argparse
+import asyncio
+import io
+import json
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from compound_store import FLOAT_COLUMNS, adapter_records
+
+RESULTS_DIR = ROOT / 'benchmarks' / 'results'
+BASELINE = ROOT / 'benchmarks' / 'baseline_examples.json'
+
+# Record keys holding 0-1 scores, jittered in synthetic compounds
+SCORE_FIELDS = frozenset(k for col in ('host_quality', 'optical', 'coherence', 'care', 'i_zero')
+                         for k in FLOAT_COLUMNS[col])
+
+# A stage or example counts as regressed when it is this much slower than
+# the baseline and at least MIN_DELTA seconds slower
+TOLERANCE = 1.25
+MIN_DELTA = 0.005
+
+
+def synthetic_compounds(base, n, seed=0, jitter=0.05):
+    """n compounds resampled from base records with unique ids."""
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(base), size=n).tolist()
+    noise = rng.normal(0.0, jitter, size=n).tolist()
+    out = []
+    for i, (p, d) in enumerate(zip(picks, noise)):
+        c = dict(base[p])
+        c['material_id'] = f"syn-{i}"
+        for k in SCORE_FIELDS.intersection(c):
+            if isinstance(c[k], (int, float)):
+                c[k] = min(1.0, max(0.0, c[k] + d))
+        out.append(c)
+    return out
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def timed_bridge(bridge, stages):
+    """Append (rule, seconds) to stages for every orchestrate_mathematics call."""
+    compute = bridge.orchestrate_mathematics
+
+    async def orchestrate_mathematics(rule, ctx, *args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return await compute(rule, ctx, *args, **kwargs)
+        finally:
+            stages.append({'rule': f"[{rule.subject}] [{rule.verb}] [{rule.property}]",
+                           'seconds': time.perf_counter() - t0})
+
+    bridge.orchestrate_mathematics = orchestrate_mathematics
+    return bridge
+
+
+async def _run_agent(harness, agent_id, compounds, cache):
+    stages, examples = [], []
+    mark = [time.perf_counter()]
+
+    def on_example(ex):
+        now = time.perf_counter()
+        examples.append({'num': ex['num'], 'title': ex['title'], 'seconds': now - mark[0],
+                         'stages': list(stages)})
+        stages.clear()
+        mark[0] = now
+
+    bridge = timed_bridge(harness.setup_bridge(agent_id, cache=cache), stages)
+    t0 = time.perf_counter()
+    await harness.run_examples(agent_id, out=io.StringIO(), on_example=on_example,
+                               compounds=compounds, bridge=bridge)
+    return {'seconds': time.perf_counter() - t0, 'examples': examples}
+
+
+def run_size(n, agents, cache, seed):
+    """Worker entry point: every agent's examples on n synthetic compounds."""
+    import test_dashboard_capture_FIXED as harness
+
+    t0 = time.perf_counter()
+    _, adapter = harness.shared_components()
+    compounds = synthetic_compounds(adapter_records(adapter), n, seed)
+    setup = time.perf_counter() - t0
+    rss_inputs = peak_rss_mb()
+    runs = {a: asyncio.run(_run_agent(harness, a, compounds, cache)) for a in agents}
+    return {'compounds': n, 'setup_seconds': setup, 'inputs_peak_rss_mb': rss_inputs,
+            'peak_rss_mb': peak_rss_mb(), 'agents': runs}
+
+
+# ============================================================================
+# BASELINE COMPARISON
+# ============================================================================
+
+def _timings(results):
+    """{(size, agent, example, stage or ''): seconds}"""
+    out = {}
+    for run in results['runs']:
+        for agent, r in run['agents'].items():
+            for ex in r['examples']:
+                out[(run['compounds'], agent, ex['num'], '')] = ex['seconds']
+                seen = {}
+                for st in ex['stages']:
+                    seen[st['rule']] = seen.get(st['rule'], 0) + 1
+                    name = st['rule'] if seen[st['rule']] == 1 else f"{st['rule']} #{seen[st['rule']]}"
+                    out[(run['compounds'], agent, ex['num'], name)] = st['seconds']
+    return out
+
+
+def compare(results, baseline, tolerance=TOLERANCE, min_delta=MIN_DELTA):
+    """Rows slower than baseline by more than tolerance, worst first."""
+    now, then = _timings(results), _timings(baseline)
+    rows = []
+    for key, t in now.items():
+        b = then.get(key)
+        if b is not None and t > b * tolerance and t - b >= min_delta:
+            rows.append((t / b if b else float('inf'), key, b, t))
+    return sorted(rows, reverse=True)
+
+
+def print_results(results):
+    print(f"{'compounds':>10} {'agent':>5} {'example / stage':<46} {'ms':>10} {'peak MB':>9}")
+    for run in results['runs']:
+        for agent, r in run['agents'].items():
+            for ex in r['examples']:
+                print(f"{run['compounds']:>10,} {agent:>5} {ex['num']}. {ex['title']:<43} "
+                      f"{ex['seconds'] * 1e3:>10.1f} {run['peak_rss_mb']:>9.0f}")
+                for st in ex['stages']:
+                    print(f"{'':>10} {'':>5}    {st['rule']:<43} {st['seconds'] * 1e3:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--agents', nargs='+', default=['B1', 'B2', 'B3'])
+    parser.add_argument('--cache', action='store_true', help="Keep the orchestration cache on")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', type=Path, help="Results file (default: benchmarks/results/examples_<time>.json)")
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="Write these results as the baseline")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    args = parser.parse_args()
+
+    results = {'generated': datetime.now().isoformat(timespec='seconds'),
+               'python': platform.python_version(), 'machine': platform.machine(),
+               'cache': args.cache, 'runs': []}
+    for n in args.sizes:
+        # A fresh process per size, so peak RSS is not carried over
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results['runs'].append(pool.submit(run_size, n, args.agents, args.cache, args.seed).result())
+    print_results(results)
+
+    out = args.out or RESULTS_DIR / f"examples_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(results, indent=2))
+    print(f"\nResults: {out}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"Baseline saved: {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline} (run with --save-baseline)")
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    if not regressions:
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.2f}x)")
+        return 0
+    print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+    for ratio, (n, agent, num, stage), b, t in regressions:
+        print(f"  {n:>10,} {agent} Ex{num} {stage or '(example)':<32} "
+              f"{b * 1e3:.1f} -> {t * 1e3:.1f} ms ({ratio:.2f}x)")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
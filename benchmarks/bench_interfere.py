@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+INTERFERE pruning: full sort vs streaming top-k selection.
+
+Run from the repo root:
+    python benchmarks/bench_interfere.py
+    python benchmarks/bench_interfere.py --sizes 1000 100000 1000000 --k 25
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from care_scoring import care_mask, synthetic_scores
+from interference_select import CHUNK_SIZE, INTERFERE_TOP_K, StreamingTopK
+
+
+def sort_select(amplitudes, care, k):
+    """The sorting form: order every amplitude, keep k, count Care in a second pass."""
+    order = np.argsort(-amplitudes, kind='stable')[:k]
+    return order.tolist(), int(care[order].sum())
+
+
+def stream_select(amplitudes, care, k):
+    sel = StreamingTopK(k)
+    for start in range(0, len(amplitudes), CHUNK_SIZE):
+        stop = start + CHUNK_SIZE
+        sel.push(np.arange(start, min(stop, len(amplitudes))), amplitudes[start:stop], care[start:stop])
+    return [i for i, _, _ in sel.result()], sel.preserved
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--k', type=int, default=INTERFERE_TOP_K)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'compounds':>10} {'sort ms':>10} {'stream ms':>10} {'speedup':>8} {'preserved':>10}")
+    for n in args.sizes:
+        scores = synthetic_scores(n)
+        care = care_mask(scores)
+        amplitudes = scores.min(axis=1)
+        t_sort, expected = best_of(lambda: sort_select(amplitudes, care, args.k), args.repeat)
+        t_stream, got = best_of(lambda: stream_select(amplitudes, care, args.k), args.repeat)
+        assert got == expected
+        print(f"{n:>10,} {t_sort * 1e3:>10.2f} {t_stream * 1e3:>10.2f} {t_sort / t_stream:>7.1f}x {got[1]:>10,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Pareto frontier and dominance ranks: pairwise O(n^2) check vs sweep.
+
+Run from the repo root:
+    python benchmarks/bench_pareto.py
+    python benchmarks/bench_pareto.py --sizes 1000 100000 1000000 --pairwise-max 20000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from care_scoring import synthetic_scores
+from pareto import care_off_frontier, pareto_frontier, pareto_ranks
+
+
+def pairwise_frontier(scores, block=2048):
+    """The O(n^2) form: test every compound against every other, in blocks."""
+    keep = np.ones(len(scores), dtype=bool)
+    for start in range(0, len(scores), block):
+        s = scores[start:start + block, None, :]
+        dominated = ((scores[None] >= s).all(axis=2) & (scores[None] > s).any(axis=2)).any(axis=1)
+        keep[start:start + block] = ~dominated
+    return np.flatnonzero(keep)
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--pairwise-max', type=int, default=20_000,
+                        help="Skip the pairwise check above this many compounds")
+    args = parser.parse_args()
+
+    print(f"{'compounds':>10} {'pairwise ms':>12} {'frontier ms':>12} {'ranks ms':>10} "
+          f"{'frontier':>9} {'fronts':>7} {'care off':>9}")
+    for n in args.sizes:
+        scores = synthetic_scores(n)
+        t_front, front = timed(lambda: pareto_frontier(scores))
+        t_ranks, ranks = timed(lambda: pareto_ranks(scores))
+        assert set(front.tolist()) == set(np.flatnonzero(ranks == 0).tolist())
+        pairwise = '-'
+        if n <= args.pairwise_max:
+            t_pair, pair = timed(lambda: pairwise_frontier(scores))
+            assert set(pair.tolist()) == set(front.tolist())
+            pairwise = f"{t_pair * 1e3:.1f}"
+        print(f"{n:>10,} {pairwise:>12} {t_front * 1e3:>12.1f} {t_ranks * 1e3:>10.1f} "
+              f"{len(front):>9,} {int(ranks.max()) + 1:>7,} {len(care_off_frontier(scores, ranks)):>9,}")
+
+
+if __name__ == '__main__':
+    main()
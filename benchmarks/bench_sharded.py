@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+SUPERPOSE and FILTER over the compound store: one process vs sharded pool.
+
+Run from the repo root:
+    python benchmarks/bench_sharded.py
+    python benchmarks/bench_sharded.py --sizes 1000000 10000000 --workers 4 16
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from care_scoring import synthetic_scores
+from compound_store import CompoundStore
+from sharded_store import ShardedStore
+
+
+def synthetic_store(n, seed=0):
+    scores = synthetic_scores(n, seed)
+    rng = np.random.default_rng(seed + 1)
+    return CompoundStore({
+        'material_id': np.char.add('syn-', np.arange(n).astype(str)),
+        'host_quality': np.ascontiguousarray(scores[:, 0]),
+        'i_zero': rng.random(n),
+    })
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, os.cpu_count() or 1])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"cores: {os.cpu_count()}")
+    print(f"{'compounds':>11} {'workers':>8} {'superpose ms':>13} {'filter ms':>10} {'speedup':>8}")
+    for n in args.sizes:
+        store = synthetic_store(n)
+        t_sup, ref = best_of(lambda: store.superpose('HOST-QUALITY'), args.repeat)
+        t_fil, mask = best_of(lambda: store.filter_mask(), args.repeat)
+        print(f"{n:>11,} {1:>8} {t_sup * 1e3:>13.1f} {t_fil * 1e3:>10.1f} {1.0:>7.1f}x")
+        for w in sorted(set(args.workers)):
+            with ShardedStore(store, w) as sharded:
+                sharded.superpose('HOST-QUALITY'), sharded.filter_mask()  # start workers, share columns
+                s_sup, out = best_of(lambda: sharded.superpose('HOST-QUALITY'), args.repeat)
+                s_fil, out_mask = best_of(lambda: sharded.filter_mask(), args.repeat)
+            assert out['top_indices'].tolist() == ref['top_indices'].tolist()
+            assert np.array_equal(out['scores'], ref['scores']) and np.array_equal(out_mask, mask)
+            print(f"{n:>11,} {w:>8} {s_sup * 1e3:>13.1f} {s_fil * 1e3:>10.1f} "
+                  f"{(t_sup + t_fil) / (s_sup + s_fil):>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+"What worked for rules like this": scanning strategy dicts vs StrategyIndex.
+
+Run from the repo root:
+    python benchmarks/bench_strategy_index.py
+    python benchmarks/bench_strategy_index.py --sizes 1000 100000 1000000 --k 10
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from strategy_index import FIELD_WEIGHTS, StrategyIndex, pattern_triple
+
+SUBJECTS = ('COMPOUNDS', 'HOST-QUALITY', 'OPTICAL', 'COHERENCE')
+VERBS = ('SUPERPOSE', 'FILTER', 'COUPLE', 'ENTANGLE', 'INTERFERE')
+PROPERTIES = ('I=0', 'CROSS-SCALE', 'CARE-SYNERGY', 'CARE-GUIDED', 'HOST-QUALITY', 'OPTICAL', 'COHERENCE')
+
+
+def synthetic_strategies(n, seed=0):
+    """n strategy dicts in the layout write_checkpoint_files() records."""
+    rng = np.random.default_rng(seed)
+    triples = zip(rng.choice(SUBJECTS, n), rng.choice(VERBS, n), rng.choice(PROPERTIES, n))
+    return [{'pattern': f"{v}_discovery", 'description': f"[{s}] [{v}] [{p}] evaluated Yb-171 compounds",
+             'success_score': round(float(score), 2)}
+            for (s, v, p), score in zip(triples, rng.random(n))]
+
+
+def scan(strategies, rule, k):
+    """The list form: parse and score every strategy, then sort."""
+    scored = []
+    for i, s in enumerate(strategies):
+        subject, verb, prop = pattern_triple(s)
+        sim = (FIELD_WEIGHTS['subject'] * (subject == rule[0]) + FIELD_WEIGHTS['verb'] * (verb == rule[1])
+               + FIELD_WEIGHTS['property'] * (prop == rule[2]))
+        if sim > 0:
+            scored.append((-sim * s['success_score'], i))
+    return [i for _, i in sorted(scored)[:k]]
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--k', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rule = ('HOST-QUALITY', 'ENTANGLE', 'CARE-SYNERGY')
+    print(f"{'patterns':>9} {'build ms':>9} {'scan ms':>9} {'query ms':>9} {'speedup':>8}")
+    for n in args.sizes:
+        strategies = synthetic_strategies(n)
+        t0 = time.perf_counter()
+        index = StrategyIndex()
+        for start in range(0, n, 1000):  # patterns arrive a day's worth at a time
+            index.sync(strategies[:start + 1000])
+        t_build = time.perf_counter() - t0
+        rows = {id(s): i for i, s in enumerate(strategies)}
+        t_scan, ref = best_of(lambda: scan(strategies, rule, args.k), max(1, args.repeat // 2))
+        t_query, hits = best_of(lambda: index.query(rule, args.k), args.repeat)
+        assert [rows[id(p)] for p, _, _ in hits] == ref
+        print(f"{n:>9,} {t_build * 1e3:>9.1f} {t_scan * 1e3:>9.2f} {t_query * 1e3:>9.3f} {t_scan / t_query:>7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Care equilibria over a threshold x C_λ grid: one care_equilibria() per point vs one sweep.
+
+Run from the repo root:
+    python benchmarks/bench_sweep.py
+    python benchmarks/bench_sweep.py --sizes 100000 1000000 --thresholds 20 --lambdas 10
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from care_scoring import care_equilibria, synthetic_scores
+from care_sweep import care_sweep
+
+
+def per_point(scores, care, thresholds, lambdas):
+    """What rerunning the pipeline per setting amounts to: one full pass per grid point."""
+    counts = np.zeros((len(thresholds), len(lambdas)), dtype=np.int64)
+    for i, t in enumerate(thresholds):
+        for j, lam in enumerate(lambdas):
+            idx = care_equilibria(scores, t)
+            counts[i, j] = len(idx) if lam is None else int((care[idx] > lam).sum())
+    return counts
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--thresholds', type=int, default=10, help="grid points between 0.5 and 0.95")
+    parser.add_argument('--lambdas', type=int, default=5, help="C_λ values (plus off) between 0.1 and 0.9")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    thresholds = np.linspace(0.5, 0.95, args.thresholds).round(4).tolist()
+    lambdas = [None] + np.linspace(0.1, 0.9, args.lambdas).round(4).tolist()
+    print(f"grid: {len(thresholds)} thresholds x {len(lambdas)} C_λ = {len(thresholds) * len(lambdas)} points")
+    print(f"{'compounds':>10} {'one run ms':>11} {'per point ms':>13} {'sweep ms':>9} {'speedup':>8}")
+    for n in args.sizes:
+        scores = synthetic_scores(n)
+        care = np.random.default_rng(1).random(n)
+        t_one, _ = best_of(lambda: care_equilibria(scores), args.repeat)
+        t_grid, ref = best_of(lambda: per_point(scores, care, thresholds, lambdas), args.repeat)
+        t_sweep, sweep = best_of(lambda: care_sweep(scores, care, thresholds, lambdas), args.repeat)
+        assert np.array_equal(sweep.counts, ref)
+        print(f"{n:>10,} {t_one * 1e3:>11.2f} {t_grid * 1e3:>13.2f} {t_sweep * 1e3:>9.2f} {t_grid / t_sweep:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
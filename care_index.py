@@ -0,0 +1,204 @@
+"""
+Incremental index of per-compound (B1, B2, B3, care) scores.
+
+A compound is a Care equilibrium when all three agents score above the
+threshold, i.e. when min(B1, B2, B3) is above it. The index keeps compounds
+sorted by that minimum, so "all three > 0.85" is one bisect plus reading
+off the tail: O(log n + k) for k matches. Inserting, updating or deleting
+a compound touches only that compound. sync() compares the index against
+a CompoundStore and rescores only compounds that were added, changed or
+removed; sync_scores() does the same for ids and a score matrix, such as
+the (B1, B2, B3) matrix built from the agents' SUPERPOSE states.
+
+    index = CareIndex.load('data/care_index.npz')   # or CareIndex()
+    index.sync_scores(ids, scores, care)           # only changed rows
+    index.above(0.85)                              # material_ids, best first
+    index.save('data/care_index.npz')
+"""
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+import numpy as np
+
+from care_scoring import CARE_THRESHOLD
+from compound_store import PROPERTY_COLUMNS
+
+SCORE_COLUMNS = (PROPERTY_COLUMNS['HOST-QUALITY'], PROPERTY_COLUMNS['OPTICAL'],
+                 PROPERTY_COLUMNS['COHERENCE'], 'care')
+
+# sync() re-sorts the whole index instead of inserting one by one past this
+REBUILD_AFTER = 1024
+
+
+def _key(row):
+    """Sort key: weakest agent score. NaN (unscored) sorts below everything."""
+    k = float(np.min(row[:3]))
+    return -np.inf if k != k else k
+
+
+class CareIndex:
+    def __init__(self):
+        self._slot = {}                       # material_id -> row in _matrix
+        self._matrix = np.empty((0, 4))       # (B1, B2, B3, care) per slot
+        self._free = []                       # slots released by delete()
+        self._keys = []                       # ascending min(B1, B2, B3)
+        self._ids = []                        # material_id for each entry of _keys
+
+    def __len__(self):
+        return len(self._slot)
+
+    def __contains__(self, material_id):
+        return material_id in self._slot
+
+    def scores(self, material_id):
+        return self._matrix[self._slot[material_id]].copy()
+
+    # ---- updates -------------------------------------------------------------
+
+    def _alloc(self):
+        if self._free:
+            return self._free.pop()
+        n = len(self._slot)
+        if n == len(self._matrix):
+            grown = np.empty((max(16, 2 * n), 4))
+            grown[:n] = self._matrix
+            self._matrix = grown
+        return n
+
+    def _unlink(self, material_id):
+        k = _key(self._matrix[self._slot[material_id]])
+        i = bisect_left(self._keys, k)
+        while self._ids[i] != material_id:
+            i += 1
+        del self._keys[i]
+        del self._ids[i]
+
+    def upsert(self, material_id, scores):
+        """Insert or replace one compound's (B1, B2, B3, care) scores.
+
+        Returns False if the compound was already indexed with these scores.
+        """
+        row = np.asarray(scores, dtype=np.float64)
+        slot = self._slot.get(material_id)
+        if slot is not None:
+            if np.array_equal(self._matrix[slot], row, equal_nan=True):
+                return False
+            self._unlink(material_id)
+        else:
+            slot = self._slot[material_id] = self._alloc()
+        self._matrix[slot] = row
+        k = _key(row)
+        i = bisect_right(self._keys, k)
+        self._keys.insert(i, k)
+        self._ids.insert(i, material_id)
+        return True
+
+    def delete(self, material_id):
+        if material_id not in self._slot:
+            return False
+        self._unlink(material_id)
+        self._free.append(self._slot.pop(material_id))
+        return True
+
+    def sync(self, store):
+        """Bring the index in line with a CompoundStore's score columns (see sync_scores)."""
+        matrix = np.column_stack([np.asarray(store[c], dtype=np.float64) for c in SCORE_COLUMNS])
+        return self.sync_scores(np.asarray(store['material_id']).tolist(), matrix[:, :3], matrix[:, 3])
+
+    def sync_scores(self, ids, scores, care=None):
+        """Bring the index in line with ids and their (N, 3) scores, touching only changes.
+
+        care is each compound's Care score (NaN where unknown, the default).
+        Ids must be distinct and non-empty: compounds sharing an id would
+        overwrite one another. Unchanged compounds are detected with one
+        vectorized comparison. Returns {'added': n, 'updated': n, 'deleted': n}.
+        """
+        ids = list(ids)
+        if any(m is None or m == '' for m in ids):
+            raise ValueError("every compound needs a material_id")
+        if len(set(ids)) != len(ids):
+            raise ValueError("material_ids must be distinct")
+        matrix = np.empty((len(ids), 4))
+        matrix[:, :3] = scores
+        matrix[:, 3] = np.nan if care is None else care
+        slots = np.fromiter((self._slot.get(m, -1) for m in ids), dtype=np.int64, count=len(ids))
+        known = slots >= 0
+        same = np.zeros(len(ids), dtype=bool)
+        cur, new = self._matrix[slots[known]], matrix[known]
+        same[known] = ((cur == new) | (np.isnan(cur) & np.isnan(new))).all(axis=1)
+
+        changed = np.flatnonzero(~same)
+        gone = set(self._slot) - set(ids) if len(self._slot) > int(known.sum()) else set()
+        counts = {'added': int((~known).sum()), 'updated': int((known & ~same).sum()), 'deleted': len(gone)}
+        if len(changed) + len(gone) > REBUILD_AFTER:
+            self._bulk_replace(ids, matrix, changed, gone)
+            return counts
+        for i in changed:
+            self.upsert(ids[i], matrix[i])
+        for mid in gone:
+            self.delete(mid)
+        return counts
+
+    def _bulk_replace(self, ids, matrix, changed, gone):
+        """Apply many changes at once and re-sort, instead of one insert each."""
+        for mid in gone:
+            self._free.append(self._slot.pop(mid))
+        for i in changed:
+            slot = self._slot.get(ids[i])
+            if slot is None:
+                slot = self._slot[ids[i]] = self._alloc()
+            self._matrix[slot] = matrix[i]
+        all_ids = list(self._slot)
+        rows = self._matrix[np.fromiter(self._slot.values(), dtype=np.int64, count=len(all_ids))]
+        keys = rows[:, :3].min(axis=1)
+        keys[np.isnan(keys)] = -np.inf
+        order = np.argsort(keys, kind='stable')
+        self._keys = keys[order].tolist()
+        self._ids = [all_ids[i] for i in order]
+
+    # ---- queries -------------------------------------------------------------
+
+    def above(self, threshold=CARE_THRESHOLD):
+        """material_ids whose three agent scores all exceed threshold, best first."""
+        return self._ids[bisect_right(self._keys, threshold):][::-1]
+
+    def count_above(self, threshold=CARE_THRESHOLD):
+        return len(self._keys) - bisect_right(self._keys, threshold)
+
+    def query(self, b1=CARE_THRESHOLD, b2=CARE_THRESHOLD, b3=CARE_THRESHOLD, care=None):
+        """Per-agent thresholds (one agent's threshold may differ from the rest).
+
+        Bisects on the lowest threshold, then checks each candidate's scores.
+        """
+        out = []
+        for mid in self.above(min(b1, b2, b3)):
+            s = self._matrix[self._slot[mid]]
+            if s[0] > b1 and s[1] > b2 and s[2] > b3 and (care is None or s[3] > care):
+                out.append(mid)
+        return out
+
+    # ---- persistence ---------------------------------------------------------
+
+    def save(self, path):
+        """Write ids and scores in sorted order, so load() needs no re-sort."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ids = np.array(self._ids, dtype=str) if self._ids else np.array([], dtype='U1')
+        scores = self._matrix[[self._slot[m] for m in self._ids]].reshape(-1, 4)
+        with open(path, 'wb') as f:
+            np.savez(f, ids=ids, scores=scores, keys=np.array(self._keys, dtype=np.float64))
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved index, or return an empty one if path does not exist."""
+        index = cls()
+        path = Path(path)
+        if not path.exists():
+            return index
+        with np.load(path) as data:
+            index._ids = data['ids'].tolist()
+            index._keys = data['keys'].tolist()
+            index._matrix = data['scores'].copy()
+        index._slot = {m: i for i, m in enumerate(index._ids)}
+        return index
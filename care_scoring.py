@@ -0,0 +1,83 @@
+"""
+Batch B1/B2/B3 scoring and Care-equilibrium detection.
+
+All compounds are scored for all three agent properties in one pass,
+giving an N x 3 matrix (columns B1 host quality, B2 optical, B3 coherence).
+A compound is a Care equilibrium when all three agents score above the
+synergy threshold. That test is a single vectorized mask, not a
+per-compound loop.
+
+    scores = score_matrix(store)              # (N, 3) float64
+    idx = care_equilibria(scores)             # indices, best first
+"""
+import numpy as np
+
+from compound_store import PROPERTY_COLUMNS
+
+AGENTS = ('B1', 'B2', 'B3')
+AGENT_PROPERTIES = ('HOST-QUALITY', 'OPTICAL', 'COHERENCE')
+
+# Every agent must score above this for a Care equilibrium
+CARE_THRESHOLD = 0.85
+
+# Keys a per-compound SUPERPOSE result may carry its property score under
+SCORE_KEYS = ('score', 'property_score', 'care_score')
+
+
+def score_matrix(store):
+    """(N, 3) score matrix from a CompoundStore (or any mapping of columns).
+
+    The matrix is column-major, so each agent's scores stay contiguous,
+    as they are in the store.
+    """
+    cols = [store[PROPERTY_COLUMNS[p]] for p in AGENT_PROPERTIES]
+    scores = np.empty((len(cols[0]), len(cols)), dtype=np.float64, order='F')
+    for j, col in enumerate(cols):
+        scores[:, j] = col
+    return scores
+
+
+def _score(c):
+    for k in SCORE_KEYS:
+        if c.get(k) is not None:
+            return c[k]
+    return np.nan
+
+
+def matrix_from_superpose(compounds_by_agent):
+    """Align each agent's SUPERPOSE compound list into one (N, 3) matrix.
+
+    compounds_by_agent maps B1/B2/B3 to the 'compounds' list from that
+    agent's SUPERPOSE state. Rows follow B1's order. Compounds missing from
+    an agent's list score NaN, and NaN never passes the Care mask.
+    Returns (ids, scores).
+    """
+    ids = [c.get('material_id', c.get('formula')) for c in compounds_by_agent[AGENTS[0]]]
+    row = {cid: i for i, cid in enumerate(ids)}
+    scores = np.full((len(ids), len(AGENTS)), np.nan, order='F')
+    for j, agent in enumerate(AGENTS):
+        for c in compounds_by_agent.get(agent, ()):
+            i = row.get(c.get('material_id', c.get('formula')))
+            if i is not None:
+                scores[i, j] = _score(c)
+    return ids, scores
+
+
+def care_mask(scores, threshold=CARE_THRESHOLD):
+    """Boolean mask of rows where every agent scores above threshold."""
+    mask = scores[:, 0] > threshold
+    for j in range(1, scores.shape[1]):
+        mask &= scores[:, j] > threshold
+    return mask
+
+
+def care_equilibria(scores, threshold=CARE_THRESHOLD):
+    """Indices of Care equilibria, ordered by their weakest agent score (best first)."""
+    idx = np.flatnonzero(care_mask(scores, threshold))
+    return idx[np.argsort(-scores[idx].min(axis=1), kind='stable')]
+
+
+def synthetic_scores(n, seed=0):
+    """Reproducible (n, 3) scores for benchmarks, about 1% Care equilibria."""
+    rng = np.random.default_rng(seed)
+    return np.asfortranarray(rng.beta(5, 2, size=(n, len(AGENTS))))
@@ -0,0 +1,112 @@
+"""
+Care equilibria across a grid of synergy thresholds and Care strengths.
+
+A compound is a Care equilibrium at (threshold, λ) when all three agents
+score above threshold and its Care score is above λ (λ = None leaves the
+Care operator off, which is care_scoring.care_equilibria()). Rerunning the
+pipeline per grid point repeats all the work. The sweep reduces the score
+matrix once instead:
+
+    - each compound's weakest agent score and its Care score are taken
+      from the matrix a single time
+    - compounds are sorted by weakest score, so for each threshold the
+      equilibria are a prefix of that order (one searchsorted per threshold)
+    - for each λ, one cumulative count over that order gives the count at
+      every threshold
+
+Only compounds that are equilibria at the loosest grid point are kept. For
+each of them, the sweep records how many thresholds and how many λ values
+it passes, which gives its membership at every grid point:
+
+    sweep = care_sweep(score_matrix(store), store['care'],
+                       thresholds=[0.8, 0.85, 0.9], lambdas=[None, 0.5, 0.7])
+    sweep.counts            # (3 thresholds, 3 λ) equilibrium counts
+    sweep.members(0.85)     # same indices, same order as care_equilibria(scores)
+    sweep.table()           # [{'threshold': .., 'lambda': .., 'care_equilibria': ..}, ...]
+"""
+import numpy as np
+
+from care_scoring import CARE_THRESHOLD
+
+DEFAULT_THRESHOLDS = (0.75, 0.8, 0.85, 0.9, 0.95)
+DEFAULT_LAMBDAS = (None, 0.5, 0.7, 0.9)
+
+
+def _sorted_grid(values, name):
+    values = list(values)
+    if not values:
+        raise ValueError(f"empty {name} grid")
+    key = [-np.inf if v is None else v for v in values]
+    if sorted(key) != key or len(set(key)) != len(key):
+        raise ValueError(f"{name} must be distinct and ascending (None first): {values}")
+    return values
+
+
+class CareSweep:
+    """Care-equilibrium counts and membership over a threshold x λ grid."""
+
+    def __init__(self, thresholds, lambdas, candidates, weakest, care, n_compounds):
+        self.thresholds = thresholds
+        self.lambdas = lambdas
+        self.candidates = candidates  # equilibria at the loosest point, best first
+        self.weakest = weakest        # their weakest agent score
+        self.care = care              # their Care score (NaN where unknown)
+        self.n_compounds = n_compounds
+
+        t = np.asarray(thresholds, dtype=np.float64)
+        lam = np.array([-np.inf if v is None else v for v in lambdas], dtype=np.float64)
+        # Thresholds and λ values each candidate passes. Grids are ascending,
+        # so it is a member at (i, j) exactly when i < t_pass and j < lam_pass.
+        self.t_pass = np.searchsorted(t, weakest, side='left').astype(np.int32)
+        care_key = np.where(np.isnan(care), -np.inf, care)
+        lam_pass = np.searchsorted(lam, care_key, side='left')
+        # λ = None passes even unknown Care scores
+        self.lam_pass = np.where(np.isnan(care) & (lam[0] == -np.inf), np.maximum(lam_pass, 1), lam_pass).astype(np.int32)
+
+        # counts[i, j]: candidates with t_pass > i and lam_pass > j
+        hist = np.zeros((len(t) + 1, len(lam) + 1), dtype=np.int64)
+        np.add.at(hist, (self.t_pass, self.lam_pass), 1)
+        self.counts = hist[::-1, ::-1].cumsum(axis=0).cumsum(axis=1)[::-1, ::-1][1:, 1:]
+
+    def _index(self, grid, value, name):
+        try:
+            return grid.index(value)
+        except ValueError:
+            raise KeyError(f"{name} {value!r} is not on the grid {grid}") from None
+
+    def count(self, threshold=CARE_THRESHOLD, lam=None):
+        return int(self.counts[self._index(self.thresholds, threshold, 'threshold'),
+                               self._index(self.lambdas, lam, 'lambda')])
+
+    def members(self, threshold=CARE_THRESHOLD, lam=None):
+        """Compound indices that are equilibria at a grid point, best first."""
+        i = self._index(self.thresholds, threshold, 'threshold')
+        j = self._index(self.lambdas, lam, 'lambda')
+        return self.candidates[(self.t_pass > i) & (self.lam_pass > j)]
+
+    def table(self):
+        """One row per grid point: threshold, λ and the equilibrium count."""
+        return [{'threshold': t, 'lambda': lam, 'care_equilibria': int(self.counts[i, j])}
+                for i, t in enumerate(self.thresholds) for j, lam in enumerate(self.lambdas)]
+
+
+def care_sweep(scores, care=None, thresholds=DEFAULT_THRESHOLDS, lambdas=DEFAULT_LAMBDAS):
+    """CareSweep for an (N, 3) score matrix and optional (N,) Care scores.
+
+    Without care, only λ = None points are allowed.
+    """
+    thresholds = _sorted_grid(thresholds, 'thresholds')
+    lambdas = _sorted_grid(lambdas, 'lambdas')
+    if care is None:
+        if lambdas != [None]:
+            raise ValueError("λ values other than None need Care scores")
+        care = np.full(len(scores), np.nan)
+    care = np.asarray(care, dtype=np.float64)
+
+    weakest = np.asarray(scores).min(axis=1)   # NaN propagates, and NaN never passes
+    keep = np.flatnonzero(weakest > thresholds[0])
+    if lambdas[0] is not None:
+        keep = keep[care[keep] > lambdas[0]]
+    # Best first, ties by index: the order care_equilibria() returns
+    keep = keep[np.argsort(-weakest[keep], kind='stable')]
+    return CareSweep(thresholds, lambdas, keep, weakest[keep], care[keep], len(scores))
@@ -0,0 +1,111 @@
+"""
+Binary checkpoint files: a counts header plus one section per memory layer.
+
+The JSON checkpoints are pretty-printed and have to be parsed whole, even
+to count episodes. A .ckpt file holds the same dict laid out as:
+
+    b'CKPT'  u16 format version  u32 header length      (10 bytes, little-endian)
+    header   JSON: {'counts': {...}, 'sections': {layer: [offset, length]}}
+    body     one zlib-compressed JSON section per top-level layer
+
+read_header() reads only the first few hundred bytes, so the dashboard
+can show episode, pattern and rule counts without touching the body.
+read_section() seeks straight to one layer (episodic, strategic, ...).
+
+    write_checkpoint('day_6_agent_B1.ckpt', log.end_of_day())
+    read_header('day_6_agent_B1.ckpt')['counts']    # {'episodes': 5, ...}
+    read_section('day_6_agent_B1.ckpt', 'strategic')
+    read_checkpoint('day_6_agent_B1.ckpt') == log.end_of_day()
+"""
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+
+MAGIC = b'CKPT'
+VERSION = 1
+_PREFIX = struct.Struct('<4sHI')
+
+SUFFIX = '.ckpt'
+
+
+def checkpoint_counts(checkpoint):
+    """Episode, pattern and rule counts of a save_checkpoint()-layout dict."""
+    episodic = checkpoint.get('episodic', {})
+    strategic = checkpoint.get('strategic', {})
+    creative = checkpoint.get('creative_composition', {})
+    counts = {
+        'episodes': len(episodic.get('episodes', ())),
+        'patterns': strategic.get('pattern_count', len(strategic.get('strategies', ()))),
+        'rules': len(creative.get('rules_invented', ())),
+        'novel_rules': len(creative.get('novel_rules_created', ())),
+        'breakthroughs': len(creative.get('creative_breakthroughs', ())),
+        'mistakes': len(checkpoint.get('learning_from_struggle', {}).get('mistakes_made', ())),
+    }
+    counts['memories'] = counts['episodes'] + counts['patterns'] + counts['rules']
+    return counts
+
+
+def write_checkpoint(path, checkpoint, meta=None):
+    """Write checkpoint (a dict of layers) atomically. Returns the path."""
+    sections, body, offset = {}, [], 0
+    for layer, value in checkpoint.items():
+        blob = zlib.compress(json.dumps(value, default=str, separators=(',', ':')).encode(), 6)
+        sections[layer] = [offset, len(blob)]
+        body.append(blob)
+        offset += len(blob)
+    header = json.dumps({'counts': checkpoint_counts(checkpoint), 'sections': sections,
+                         'meta': meta or {}}, separators=(',', ':')).encode()
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        for blob in body:
+            f.write(blob)
+    os.replace(tmp, path)
+    return path
+
+
+def _read_header(f):
+    magic, version, length = _PREFIX.unpack(f.read(_PREFIX.size))
+    if magic != MAGIC:
+        raise ValueError(f"{getattr(f, 'name', 'file')} is not a binary checkpoint")
+    if version > VERSION:
+        raise ValueError(f"checkpoint format {version} is newer than this reader ({VERSION})")
+    header = json.loads(f.read(length))
+    header['body_offset'] = _PREFIX.size + length
+    return header
+
+
+def read_header(path):
+    """Header dict: 'counts', 'sections', 'meta'. The body is not read."""
+    with open(path, 'rb') as f:
+        return _read_header(f)
+
+
+def read_section(path, layer):
+    """One memory layer, decoded on its own."""
+    with open(path, 'rb') as f:
+        header = _read_header(f)
+        if layer not in header['sections']:
+            raise KeyError(f"{layer!r} not in {path} (has {list(header['sections'])})")
+        offset, length = header['sections'][layer]
+        f.seek(header['body_offset'] + offset)
+        return json.loads(zlib.decompress(f.read(length)))
+
+
+def read_checkpoint(path, layers=None):
+    """The checkpoint dict, or just the named layers."""
+    with open(path, 'rb') as f:
+        header = _read_header(f)
+        out = {}
+        for layer, (offset, length) in header['sections'].items():
+            if layers is not None and layer not in layers:
+                continue
+            f.seek(header['body_offset'] + offset)
+            out[layer] = json.loads(zlib.decompress(f.read(length)))
+        return out
@@ -0,0 +1,176 @@
+"""
+Delta checkpoints for DynamicMemoryArchitecture state.
+
+Writing a full copy of the cumulative strategies and rules after every
+example costs O(n^2) over a run. This format writes only what each example
+adds:
+
+    deltas/day_6_agent_B1.jsonl       one line per example (append-only)
+    deltas/day_6_agent_B1.snap_4.json cumulative state after example 4
+
+A snapshot is written every SNAPSHOT_EVERY examples and records the log
+offset it covers. materialize(n) loads the nearest snapshot at or before
+n and replays the deltas after it. The result is the same dict that
+DynamicMemoryArchitecture.save_checkpoint() produces for example n.
+"""
+import json
+import os
+from pathlib import Path
+
+SNAPSHOT_EVERY = 4
+
+# delta key -> (memory layer, checkpoint key) for state that accumulates
+CUMULATIVE_FIELDS = (
+    ('strategies', 'strategic', 'strategies'),
+    ('rules', 'creative_composition', 'rules_invented'),
+    ('novel_rules', 'creative_composition', 'novel_rules_created'),
+    ('breakthroughs', 'creative_composition', 'creative_breakthroughs'),
+    ('mistakes', 'learning_from_struggle', 'mistakes_made'),
+)
+
+
+def build_checkpoint(episodes, acc):
+    """save_checkpoint() layout from episodes and accumulated delta fields."""
+    return {
+        'episodic': {'episodes': episodes},
+        'strategic': {'strategies': list(acc['strategies']), 'pattern_count': len(acc['strategies'])},
+        'creative_composition': {
+            'rules_invented': list(acc['rules']),
+            'novel_rules_created': list(acc['novel_rules']),
+            'creative_breakthroughs': list(acc['breakthroughs']),
+        },
+        'learning_from_struggle': {'mistakes_made': list(acc['mistakes'])},
+    }
+
+
+def _empty():
+    return {key: [] for key, _, _ in CUMULATIVE_FIELDS}
+
+
+class CheckpointLog:
+    """Append-only delta log plus periodic snapshots for one agent and day."""
+
+    def __init__(self, log_dir, day, agent_id, snapshot_every=SNAPSHOT_EVERY, reset=False):
+        self.dir = Path(log_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.stem = f"day_{day}_agent_{agent_id}"
+        self.path = self.dir / f"{self.stem}.jsonl"
+        self.snapshot_every = snapshot_every
+        if reset:
+            self.path.unlink(missing_ok=True)
+            for _, snap in self._snapshots():
+                snap.unlink()
+        self._acc = None  # running totals, loaded lazily for append()
+        self._last = 0
+
+    # ---- writing -----------------------------------------------------------
+
+    def append(self, example, episode, **added):
+        """Record what example adds. added uses the CUMULATIVE_FIELDS delta keys."""
+        unknown = set(added) - {key for key, _, _ in CUMULATIVE_FIELDS}
+        if unknown:
+            raise ValueError(f"unknown checkpoint fields: {sorted(unknown)}")
+        if self._acc is None:
+            self._acc, self._last, _, _ = self._replay()
+        if example <= self._last:
+            raise ValueError(f"example {example} already logged (last is {self._last})")
+
+        delta = {'example': example, 'episode': episode}
+        delta.update({k: list(v) for k, v in added.items() if v})
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(delta, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+            offset = f.tell()
+
+        for key, _, _ in CUMULATIVE_FIELDS:
+            self._acc[key].extend(delta.get(key, ()))
+        self._last = example
+        if example % self.snapshot_every == 0:
+            self._write_snapshot(example, offset, episode)
+
+    def _write_snapshot(self, example, offset, episode):
+        snap = {'example': example, 'offset': offset, 'episode': episode, 'state': self._acc}
+        path = self.dir / f"{self.stem}.snap_{example}.json"
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(snap, default=str))
+        os.replace(tmp, path)
+
+    # ---- reading -----------------------------------------------------------
+
+    def _snapshots(self):
+        """(example, path) for every snapshot, oldest first."""
+        snaps = ((int(p.stem.rsplit('_', 1)[1]), p) for p in self.dir.glob(f"{self.stem}.snap_*.json"))
+        return sorted(snaps)
+
+    def _deltas(self, offset=0):
+        if not self.path.exists():
+            return
+        with open(self.path, encoding='utf-8') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith('\n'):
+                    break  # torn write from a crash
+                yield json.loads(line)
+
+    def _replay(self, upto=None, use_snapshots=True):
+        """Replay through example upto (None = everything logged).
+
+        Returns (accumulated state, last example, its episode, episodes replayed).
+        """
+        acc, offset, last, episode = _empty(), 0, 0, None
+        if use_snapshots:
+            usable = [p for n, p in self._snapshots() if upto is None or n <= upto]
+            if usable:
+                snap = json.loads(usable[-1].read_text())
+                acc, offset = snap['state'], snap['offset']
+                last, episode = snap['example'], snap['episode']
+        episodes = []
+        for delta in self._deltas(offset):
+            if upto is not None and delta['example'] > upto:
+                break
+            for key, _, _ in CUMULATIVE_FIELDS:
+                acc[key].extend(delta.get(key, ()))
+            last, episode = delta['example'], delta['episode']
+            episodes.append(episode)
+        return acc, last, episode, episodes
+
+    def examples(self):
+        return [d['example'] for d in self._deltas()]
+
+    def materialize(self, example):
+        """Checkpoint dict as save_checkpoint() wrote it after example."""
+        acc, last, episode, _ = self._replay(example)
+        if last != example:
+            raise KeyError(f"example {example} not in {self.path}")
+        return build_checkpoint([episode], acc)
+
+    def end_of_day(self, operations=False):
+        """End-of-day checkpoint: every episode plus the full accumulated state.
+
+        Episodes keep their example and success, as save_checkpoint() writes
+        them. operations=True also keeps each episode's operation (the rule
+        verb, when logged), which memory_budget.MemoryBudget groups them by.
+        """
+        acc, _, _, episodes = self._replay(use_snapshots=False)
+        keep = ('example', 'operation', 'success') if operations else ('example', 'success')
+        return build_checkpoint([{k: e[k] for k in keep if k in e} for e in episodes], acc)
+
+
+def carry_forward(previous, checkpoint, day):
+    """Checkpoint for day: the previous day's state plus what this day added.
+
+    Episodes and every CUMULATIVE_FIELDS list are concatenated, and this
+    day's episodes are tagged with the day. previous may be None (first day).
+    """
+    previous = previous or {}
+    episodes = list(previous.get('episodic', {}).get('episodes', ()))
+    episodes += [dict(e, day=e.get('day', day)) for e in checkpoint['episodic']['episodes']]
+    acc = {key: list(previous.get(layer, {}).get(field, ())) + list(checkpoint.get(layer, {}).get(field, ()))
+           for key, layer, field in CUMULATIVE_FIELDS}
+    out = build_checkpoint(episodes, acc)
+    # Repeat counts of rules a MemoryBudget kept once
+    rule_counts = previous.get('creative_composition', {}).get('rule_counts')
+    if rule_counts:
+        out['creative_composition']['rule_counts'] = dict(rule_counts)
+    return out
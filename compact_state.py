@@ -0,0 +1,196 @@
+"""
+Compact storage for mathematical_state payloads kept across a session.
+
+A bridge result's mathematical_state is a dict whose lists of
+per-compound dicts ('compounds', 'pruned_compounds', 'synergy_compounds')
+dominate its size. Those dicts, and the keys and boxed floats inside
+them, are held for every example, every agent and every day. compact()
+turns a state into a CompactState:
+
+    - lists of per-compound dicts become a CompoundTable, with one NumPy
+      array per key (struct-of-arrays)
+    - the scalar fields (type, coupling_strength, synergy_count, ...) live
+      in __slots__
+    - anything else is kept as-is
+
+Both types read like the originals. CompactState is a Mapping, so
+state.get('compounds') and state['type'] still work. CompoundTable is a
+Sequence of dicts, built one compound at a time as they are read.
+to_dict() gives back the original state exactly, with Python int, float,
+bool and str values, and the same key order.
+
+    s = compact(r.mathematical_state)
+    s.get('type'), len(s['compounds']), s['compounds'][0]['formula']
+    s.to_dict() == r.mathematical_state   # True
+"""
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+_UNSET = object()
+
+# Scalars stored in slots rather than in a per-state dict
+SCALAR_FIELDS = ('type', 'coupling_strength', 'synergy_count', 'entanglement_measure',
+                 'n_original', 'n_compounds', 'care_equilibria_preserved')
+
+
+def _column(values):
+    """Typed array when every value has one exact type, else an object array."""
+    kinds = {type(v) for v in values}
+    if kinds == {float}:
+        return np.array(values, dtype=np.float64)
+    if kinds == {bool}:
+        return np.array(values, dtype=np.bool_)
+    if kinds == {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    elif kinds == {str}:
+        return np.array(values, dtype=str)
+    col = np.empty(len(values), dtype=object)
+    col[:] = values
+    return col
+
+
+class CompoundTable(Sequence):
+    """Struct-of-arrays list of per-compound dicts.
+
+    Each distinct key order ("shape") is stored once. Every compound keeps a
+    shape id, and every key keeps one column holding the values of the
+    compounds that have it.
+    """
+    __slots__ = ('_shapes', '_shape_ids', '_columns', '_rows')
+
+    def __init__(self, records):
+        shapes, shape_of = [], {}
+        shape_ids = np.empty(len(records), dtype=np.int32)
+        values = {}
+        for i, rec in enumerate(records):
+            keys = tuple(rec)
+            sid = shape_of.get(keys)
+            if sid is None:
+                sid = shape_of[keys] = len(shapes)
+                shapes.append(keys)
+            shape_ids[i] = sid
+            for k, v in rec.items():
+                values.setdefault(k, []).append(v)
+        self._shapes = shapes
+        self._shape_ids = shape_ids
+        self._columns = {k: _column(v) for k, v in values.items()}
+        # Per key, the row in its column for each compound (only needed when
+        # some compounds lack the key)
+        self._rows = {}
+        if len(shapes) > 1:
+            for k in self._columns:
+                has = np.array([k in s for s in shapes])[shape_ids]
+                rows = np.cumsum(has) - 1
+                self._rows[k] = np.where(has, rows, -1).astype(np.int64)
+
+    def __len__(self):
+        return len(self._shape_ids)
+
+    def _record(self, i):
+        out = {}
+        for k in self._shapes[self._shape_ids[i]]:
+            row = self._rows[k][i] if k in self._rows else i
+            col = self._columns[k]
+            out[k] = col[row] if col.dtype == object else col[row].item()
+        return out
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._record(j) for j in range(*i.indices(len(self)))]
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('CompoundTable index out of range')
+        return self._record(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._record(i)
+
+    def __eq__(self, other):
+        if isinstance(other, (CompoundTable, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"CompoundTable({len(self)} compounds, keys={list(self._columns)})"
+
+    def column(self, key):
+        """Values of key as an array (compounds without the key are skipped)."""
+        return self._columns[key]
+
+    def to_list(self):
+        return list(self)
+
+    @property
+    def nbytes(self):
+        return (self._shape_ids.nbytes + sum(c.nbytes for c in self._columns.values())
+                + sum(r.nbytes for r in self._rows.values()))
+
+
+def _is_records(value):
+    return isinstance(value, list) and value and all(isinstance(v, dict) for v in value)
+
+
+class CompactState(Mapping):
+    """Read-only mathematical_state with slotted scalars and CompoundTable lists."""
+    __slots__ = SCALAR_FIELDS + ('_keys', '_other')
+
+    def __init__(self, state):
+        self._keys = tuple(state)
+        self._other = {}
+        for name in SCALAR_FIELDS:
+            setattr(self, name, _UNSET)
+        for k, v in state.items():
+            if k in SCALAR_FIELDS:
+                setattr(self, k, v)
+            elif _is_records(v):
+                self._other[k] = CompoundTable(v)
+            else:
+                self._other[k] = v
+
+    def __getitem__(self, key):
+        if key in SCALAR_FIELDS:
+            v = getattr(self, key)
+            if v is _UNSET:
+                raise KeyError(key)
+            return v
+        return self._other[key]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"CompactState({dict(self.items())!r})"
+
+    def __reduce__(self):
+        # Pickles the tables as arrays (e.g. results returned by worker processes)
+        return _restore, (self._keys, tuple(getattr(self, name) for name in SCALAR_FIELDS), self._other)
+
+    def to_dict(self):
+        """The original state: plain dicts and lists all the way down."""
+        return {k: v.to_list() if isinstance(v, CompoundTable) else v for k, v in self.items()}
+
+
+def _restore(keys, slots, other):
+    state = CompactState.__new__(CompactState)
+    state._keys = keys
+    state._other = other
+    for name, v in zip(SCALAR_FIELDS, slots):
+        setattr(state, name, v)
+    return state
+
+
+def compact(state):
+    """CompactState for a mathematical_state dict. Other values pass through."""
+    if isinstance(state, dict):
+        return CompactState(state)
+    return state
@@ -0,0 +1,225 @@
+"""
+Columnar, memory-mapped store for the cached Yb compound data.
+
+Per-compound features live in one .npy file per column plus a meta.json,
+so opening the store is an mmap of each column rather than rebuilding
+Python objects for every compound:
+
+    data/compound_store/
+        meta.json            n, columns, data_version, content_hash
+        material_id.npy      fixed-width unicode
+        formula.npy
+        band_gap.npy         float64, NaN where unknown
+        i_zero.npy
+        ...
+
+FILTER and SUPERPOSE run as whole-column NumPy operations. records()
+turns an index array back into the per-compound dicts that
+orchestrate_mathematics expects in ctx['compounds'].
+"""
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+from orchestration_cache import adapter_data_version
+
+# Column name -> record keys it may appear under, in order of preference
+STRING_COLUMNS = {
+    'material_id': ('material_id', 'mp_id', 'id'),
+    'formula': ('formula', 'formula_pretty', 'pretty_formula'),
+}
+FLOAT_COLUMNS = {
+    'band_gap': ('band_gap',),
+    'i_zero': ('i_zero', 'i_zero_score', 'i0_score'),
+    'spin_free_abundance': ('spin_free_abundance', 'i_zero_abundance'),
+    'energy_above_hull': ('energy_above_hull', 'e_above_hull', 'stability'),
+    'host_quality': ('host_quality', 'b1'),
+    'optical': ('optical', 'b2'),
+    'coherence': ('coherence', 'b3'),
+    'care': ('care', 'care_score'),
+}
+INT_COLUMNS = {
+    'spacegroup': ('spacegroup', 'spacegroup_number', 'symmetry'),
+}
+
+# Agent property -> score column (B1, B2, B3)
+PROPERTY_COLUMNS = {
+    'HOST-QUALITY': 'host_quality',
+    'OPTICAL': 'optical',
+    'COHERENCE': 'coherence',
+}
+
+# FILTER I=0 pass mark (matches the "i_zero > 0.3" reported by the bridge)
+I_ZERO_THRESHOLD = 0.3
+
+DEFAULT_PATH = Path('data') / 'compound_store'
+
+
+def _pick(record, keys, default):
+    for k in keys:
+        v = record.get(k)
+        if v is not None:
+            return v
+    return default
+
+
+def _number(value, cast, default):
+    """value as cast (float or int), or default when it is not a number."""
+    try:
+        return cast(value)
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def adapter_records(adapter):
+    """Per-compound dicts from a MaterialsProjectAdapter's cached data."""
+    for attr in ('compounds', 'cached_compounds', '_compounds'):
+        records = getattr(adapter, attr, None)
+        if records is not None and not callable(records):
+            return list(records.values()) if isinstance(records, dict) else list(records)
+    for name in ('get_compounds', 'get_all_compounds', 'load_cached_compounds'):
+        fn = getattr(adapter, name, None)
+        if callable(fn):
+            return list(fn())
+    raise AttributeError(f"{type(adapter).__name__} does not expose its cached compounds")
+
+
+def top_indices(values, k):
+    """Indices of the k largest non-NaN values, largest first.
+
+    Ties keep the lower index, so the result does not depend on how
+    argpartition happened to split them.
+    """
+    valid = np.flatnonzero(~np.isnan(values))
+    k = min(k, len(valid))
+    if k == 0:
+        return valid[:0]
+    v = values[valid]
+    cut = v[np.argpartition(-v, k - 1)[k - 1]]
+    picked = np.concatenate([np.flatnonzero(v > cut), np.flatnonzero(v == cut)])[:k]
+    picked = picked[np.lexsort((picked, -v[picked]))]
+    return valid[picked]
+
+
+class CompoundStore:
+    """Struct-of-arrays view over N compounds. Columns may be read-only mmaps."""
+
+    def __init__(self, columns, data_version='unversioned', content_hash=None):
+        self.columns = columns
+        self.data_version = data_version
+        self._content_hash = content_hash
+
+    def __len__(self):
+        return len(self.columns['material_id'])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    # ---- building / persistence ------------------------------------------
+
+    @classmethod
+    def from_records(cls, records, data_version='unversioned'):
+        n = len(records)
+        columns = {}
+        for name, keys in STRING_COLUMNS.items():
+            values = [str(_pick(r, keys, '')) for r in records]
+            if name == 'material_id':
+                # Compounds without an id would be indistinguishable, so each gets its row
+                values = [v or f"row-{i}" for i, v in enumerate(values)]
+            columns[name] = np.array(values, dtype=f"U{max(map(len, values), default=1) or 1}")
+        for name, keys in FLOAT_COLUMNS.items():
+            columns[name] = np.fromiter((_number(_pick(r, keys, np.nan), float, np.nan) for r in records),
+                                        dtype=np.float64, count=n)
+        for name, keys in INT_COLUMNS.items():
+            columns[name] = np.fromiter((_number(_pick(r, keys, -1), int, -1) for r in records),
+                                        dtype=np.int32, count=n)
+        return cls(columns, data_version)
+
+    @classmethod
+    def from_adapter(cls, adapter):
+        return cls.from_records(adapter_records(adapter), adapter_data_version(adapter))
+
+    def save(self, path=DEFAULT_PATH):
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name, col in self.columns.items():
+            np.save(path / f"{name}.npy", np.asarray(col))
+        meta = {
+            'n': len(self),
+            'columns': list(self.columns),
+            'data_version': self.data_version,
+            'content_hash': self.content_hash(),
+        }
+        # meta.json is written last: a store without it is incomplete
+        (path / 'meta.json').write_text(json.dumps(meta, indent=2))
+        return path
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH, mmap=True):
+        path = Path(path)
+        meta = json.loads((path / 'meta.json').read_text())
+        mode = 'r' if mmap else None
+        columns = {name: np.load(path / f"{name}.npy", mmap_mode=mode) for name in meta['columns']}
+        return cls(columns, meta['data_version'], meta.get('content_hash'))
+
+    @classmethod
+    def load_or_build(cls, path, adapter):
+        """Open the store at path, rebuilding it from adapter if stale or missing.
+
+        The store is stale when adapter_data_version() has changed, which
+        without a data_version is the adapter cache file's mtime and size.
+        """
+        path = Path(path)
+        version = adapter_data_version(adapter)
+        if (path / 'meta.json').exists():
+            store = cls.load(path)
+            if store.data_version == version:
+                return store
+        cls.from_adapter(adapter).save(path)
+        return cls.load(path)
+
+    def content_hash(self):
+        """Hash of the compound identities, for cache keys."""
+        if self._content_hash is None:
+            ids = np.ascontiguousarray(self.columns['material_id'])
+            self._content_hash = hashlib.blake2b(ids.tobytes(), digest_size=16).hexdigest()
+        return self._content_hash
+
+    # ---- vectorized operations -------------------------------------------
+
+    def scores(self, prop):
+        """Score column for an agent property (HOST-QUALITY/OPTICAL/COHERENCE)."""
+        return self.columns[PROPERTY_COLUMNS.get(prop, prop)]
+
+    def filter_mask(self, column='i_zero', threshold=I_ZERO_THRESHOLD):
+        col = self.columns[column]
+        return col > threshold  # NaN compares False, so unknown values never pass
+
+    def filter_indices(self, column='i_zero', threshold=I_ZERO_THRESHOLD):
+        return np.flatnonzero(self.filter_mask(column, threshold))
+
+    def superpose(self, prop, top=5):
+        """Vectorized SUPERPOSE: every compound's score for prop plus the top-ranked indices."""
+        scores = np.asarray(self.scores(prop))
+        best = top_indices(scores, top)
+        return {'type': 'superposition', 'property': prop, 'n_compounds': len(self),
+                'scores': scores, 'top_indices': best}
+
+    def records(self, indices=None):
+        """Per-compound dicts (ctx['compounds'] shape) for indices, or all compounds."""
+        if indices is None:
+            indices = np.arange(len(self))
+        out = []
+        for i in np.asarray(indices):
+            rec = {}
+            for name, col in self.columns.items():
+                v = col[i].item()
+                if isinstance(v, float) and v != v:
+                    continue
+                if name in INT_COLUMNS and v == -1:
+                    continue
+                rec[name] = v
+            out.append(rec)
+        return out
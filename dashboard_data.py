@@ -0,0 +1,201 @@
+"""
+Summary index behind the dashboard's "Pipeline Output" and "By the Numbers".
+
+The capture harness writes data/dashboard_summary.json after each run,
+built from the agents' mathematical states and the end-of-day checkpoint
+files. The dashboard then reads one small file instead of re-parsing every
+session and checkpoint. When no capture has been run (e.g. on Streamlit
+Cloud) the dashboard falls back to ILLUSTRATIVE_SUMMARY, which holds the
+numbers shown before the sections were data-driven.
+
+No Streamlit imports here: the harness runs without it.
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from care_scoring import AGENTS, care_equilibria, matrix_from_superpose
+from checkpoint_file import SUFFIX as CKPT_SUFFIX
+from checkpoint_file import checkpoint_counts as layer_counts
+from checkpoint_file import read_header
+from compound_store import I_ZERO_THRESHOLD
+
+SUMMARY_FILE = 'dashboard_summary.json'
+
+# Per-compound keys, in order of preference
+NAME_KEYS = ('formula', 'formula_pretty', 'pretty_formula', 'material_id')
+CARE_KEYS = ('care', 'care_score')
+I_ZERO_KEYS = ('i_zero', 'i_zero_score')
+COHERENCE_KEYS = ('coherence', 'b3')
+INTERFERENCE_KEYS = ('interference_score', 'score', 'amplitude')
+
+ILLUSTRATIVE_SUMMARY = {
+    'source': 'illustrative',
+    'generated': None,
+    'compounds_evaluated': 1073,
+    'agents': 3,
+    'properties': 3,
+    'strategic_patterns': 24,
+    'memory': {'episodes': 100, 'patterns': 4, 'rules': 5, 'memories': 106},
+    'care_equilibria': 26,
+    'care_top': [
+        {'name': 'YbOF', 'care': 0.94, 'note': 'tetragonal structure'},
+        {'name': 'YbSiO₃', 'care': 0.94},
+        {'name': 'YbCl₃', 'care': 0.94},
+        {'name': 'Ba₂YbMoO₆', 'care': 0.93, 'note': 'Ba-138 I=0 (71.7%) + heavy elements'},
+        {'name': 'Cs₂YbCl₄', 'care': 0.93, 'note': 'tetragonal structure'},
+    ],
+    'filter': {
+        'n_in': 1073, 'n_passed': 1057, 'threshold': 0.3,
+        'top': [
+            {'name': 'BaYbCuTe₃', 'i_zero': 0.90, 'coherence': 0.94},
+            {'name': 'Ba₃Yb₂TeO₅', 'i_zero': 0.90, 'coherence': 0.94},
+            {'name': 'BaSrYb₂', 'i_zero': 0.95, 'coherence': 0.83},
+        ],
+    },
+    'synergy': {
+        'count': 26,
+        'top': [
+            {'name': 'YbCl₃', 'b1': 0.90, 'b2': 0.94, 'b3': 0.90},
+            {'name': 'YbSiO₃', 'b1': 0.90, 'b2': 0.94, 'b3': 0.90},
+            {'name': 'CsYbCl₃', 'b1': 0.90, 'b2': 0.92, 'b3': 0.90},
+        ],
+    },
+    'interfere': {
+        'n_original': 1073, 'n_pruned': 25, 'preserved': 25,
+        'top': [
+            {'name': 'YbOF', 'score': 0.937},
+            {'name': 'YbSiO₃', 'score': 0.936},
+            {'name': 'YbCl₃', 'score': 0.935},
+            {'name': 'Ba₂YbMoO₆', 'score': 0.934},
+            {'name': 'Cs₂YbCl₄', 'score': 0.932},
+        ],
+    },
+}
+
+_SUBSCRIPTS = str.maketrans('0123456789', '₀₁₂₃₄₅₆₇₈₉')
+
+
+def pretty_formula(formula):
+    """YbSiO3 -> YbSiO₃"""
+    return str(formula).translate(_SUBSCRIPTS)
+
+
+def _pick(c, keys, default=None):
+    for k in keys:
+        if c.get(k) is not None:
+            return c[k]
+    return default
+
+
+def _name(c):
+    return pretty_formula(_pick(c, NAME_KEYS, '?'))
+
+
+def _round(x, digits=3):
+    return None if x is None else round(float(x), digits)
+
+
+# ============================================================================
+# WRITING (capture harness)
+# ============================================================================
+
+def checkpoint_counts(cp_dir, day=6):
+    """Episodes, patterns, rules and memories summed over the end-of-day checkpoints.
+
+    Binary checkpoints are counted from their header alone; JSON ones are
+    parsed whole.
+    """
+    counts = {'episodes': 0, 'patterns': 0, 'rules': 0, 'memories': 0}
+    for agent in AGENTS:
+        stem = Path(cp_dir) / f"day_{day}_agent_{agent}"
+        binary, path = stem.with_suffix(CKPT_SUFFIX), stem.with_suffix('.json')
+        if binary.exists():
+            found = read_header(binary)['counts']
+        elif path.exists():
+            found = layer_counts(json.loads(path.read_text()))
+        else:
+            continue
+        for key in counts:
+            counts[key] += found.get(key, 0)
+    return counts
+
+
+def build_summary(examples_by_agent, cp_dir, day=6, top=5):
+    """Summary index from each agent's run_examples() output.
+
+    Examples carry 'stages', the mathematical_state of every operation, so
+    the FILTER stage of Example 3 is available alongside its ENTANGLE result.
+    """
+    first = examples_by_agent[AGENTS[0]]
+    superposed = {a: examples_by_agent[a][0]['state'].get('compounds', []) for a in AGENTS}
+    ids, scores = matrix_from_superpose(superposed)
+    care_idx = care_equilibria(scores)
+    by_row = superposed[AGENTS[0]]
+
+    care_values = np.array([_pick(by_row[i], CARE_KEYS, np.nan) for i in care_idx], dtype=float)
+    if len(care_idx) and not np.isnan(care_values).any():
+        care_idx = care_idx[np.argsort(-care_values, kind='stable')]
+
+    filter_state, entangle_state = first[2]['stages'][0], first[2]['stages'][-1]
+    filtered = filter_state.get('compounds', [])
+    filter_top = sorted(filtered, key=lambda c: -(_pick(c, COHERENCE_KEYS) or 0))[:3]
+
+    interfere = first[3]['state']
+    pruned = interfere.get('pruned_compounds', [])
+    pruned_top = sorted(pruned, key=lambda c: -(_pick(c, INTERFERENCE_KEYS) or 0))[:top]
+
+    counts = checkpoint_counts(cp_dir, day)
+    return {
+        'source': 'capture',
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'day': day,
+        'compounds_evaluated': len(ids),
+        'agents': len(AGENTS),
+        'properties': len(AGENTS),
+        'strategic_patterns': counts['patterns'],
+        'memory': counts,
+        'care_equilibria': int(len(care_idx)),
+        'care_top': [{'name': _name(by_row[i]),
+                      'care': _round(_pick(by_row[i], CARE_KEYS, scores[i].min()), 2)} for i in care_idx[:top]],
+        'filter': {
+            'n_in': len(ids), 'n_passed': len(filtered), 'threshold': I_ZERO_THRESHOLD,
+            'top': [{'name': _name(c), 'i_zero': _round(_pick(c, I_ZERO_KEYS), 2),
+                     'coherence': _round(_pick(c, COHERENCE_KEYS), 2)} for c in filter_top],
+        },
+        'synergy': {
+            'count': entangle_state.get('synergy_count', int(len(care_idx))),
+            'top': [{'name': _name(by_row[i]), 'b1': _round(scores[i, 0], 2), 'b2': _round(scores[i, 1], 2),
+                     'b3': _round(scores[i, 2], 2)} for i in care_idx[:3]],
+        },
+        'interfere': {
+            'n_original': interfere.get('n_original', len(ids)),
+            'n_pruned': len(pruned),
+            'preserved': interfere.get('care_equilibria_preserved'),
+            'top': [{'name': _name(c), 'score': _round(_pick(c, INTERFERENCE_KEYS))} for c in pruned_top],
+        },
+    }
+
+
+def write_summary(data_dir, summary):
+    path = Path(data_dir) / SUMMARY_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json.dumps(summary, indent=2, ensure_ascii=False, default=str))
+    os.replace(tmp, path)
+    return path
+
+
+# ============================================================================
+# READING (dashboard)
+# ============================================================================
+
+def load_summary(path):
+    """Summary dict from path, or ILLUSTRATIVE_SUMMARY if there is no usable file."""
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return ILLUSTRATIVE_SUMMARY
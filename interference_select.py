@@ -0,0 +1,130 @@
+"""
+Top-k and threshold selection for INTERFERE CARE-GUIDED pruning.
+
+INTERFERE keeps the strongest compounds (25 of 1,073 in the demo) and
+reports how many Care equilibria survived. Sorting every amplitude to do
+that costs O(n log n) and holds the whole amplitude array. Here compounds
+stream through in chunks: each chunk is cut to its own top k with
+np.argpartition, anything below the current k-th best is dropped with one
+comparison, and the rest go through a bounded min-heap. The survivors'
+Care-equilibrium count is kept up to date as compounds enter and leave the
+heap, so care_equilibria_preserved needs no second pass.
+
+    sel = StreamingTopK(k=25)
+    for ids, amplitudes, care in chunks:
+        sel.push(ids, amplitudes, care)
+    sel.result()        # [(id, amplitude, is_care), ...] strongest first
+    sel.preserved       # Care equilibria among the survivors
+
+Ties keep the compound seen first, as a stable descending sort would.
+"""
+import heapq
+
+import numpy as np
+
+from care_scoring import care_mask, score_matrix
+
+# Compounds kept by INTERFERE CARE-GUIDED
+INTERFERE_TOP_K = 25
+
+# Compounds read from the store per chunk
+CHUNK_SIZE = 65536
+
+
+def top_k_indices(amplitudes, k):
+    """Indices of the k largest amplitudes, largest first. O(n + k log k)."""
+    a = np.asarray(amplitudes, dtype=np.float64)
+    a = np.where(np.isnan(a), -np.inf, a)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k >= len(a):
+        return np.argsort(-a, kind='stable')
+    part = np.argpartition(-a, k - 1)[:k]
+    # argpartition breaks ties arbitrarily: rank by (amplitude desc, index asc)
+    cut = a[part].min()
+    idx = np.concatenate([np.flatnonzero(a > cut), np.flatnonzero(a == cut)])[:k]
+    return idx[np.lexsort((idx, -a[idx]))]
+
+
+class StreamingTopK:
+    """Bounded selection over chunks of (ids, amplitudes, care flags).
+
+    k bounds the survivors. threshold, if given, also drops every amplitude
+    at or below it. With k=None only the threshold applies.
+    """
+
+    def __init__(self, k=INTERFERE_TOP_K, threshold=None):
+        if k is None and threshold is None:
+            raise ValueError("StreamingTopK needs k, threshold or both")
+        self.k = k
+        self.threshold = threshold
+        self.n_seen = 0
+        self.preserved = 0
+        self._heap = []  # (amplitude, -sequence, id, is_care); smallest = weakest
+
+    def __len__(self):
+        return len(self._heap)
+
+    def _floor(self):
+        """Amplitude a compound must exceed to enter, or None."""
+        floor = self.threshold
+        if self.k is not None and len(self._heap) == self.k:
+            weakest = self._heap[0][0]
+            floor = weakest if floor is None else max(floor, weakest)
+        return floor
+
+    def push(self, ids, amplitudes, care):
+        a = np.asarray(amplitudes, dtype=np.float64)
+        a = np.where(np.isnan(a), -np.inf, a)
+        care = np.asarray(care, dtype=bool)
+        start, self.n_seen = self.n_seen, self.n_seen + len(a)
+
+        idx = np.arange(len(a)) if self.k is None else top_k_indices(a, self.k)
+        floor = self._floor()
+        if floor is not None:
+            # Equal to a full heap's weakest can still win on tie order only
+            # if seen earlier, which a later chunk never is
+            idx = idx[a[idx] > floor]
+
+        heap = self._heap
+        for i in idx.tolist():
+            item = (float(a[i]), -(start + i), ids[i], bool(care[i]))
+            if self.k is None or len(heap) < self.k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                out = heapq.heappushpop(heap, item)
+                self.preserved -= out[3]
+            else:
+                break  # idx is strongest first, so nothing later gets in
+            self.preserved += item[3]
+
+    def result(self):
+        """[(id, amplitude, is_care), ...], strongest first."""
+        return [(cid, amp, is_care) for amp, _, cid, is_care in sorted(self._heap, reverse=True)]
+
+
+def interfere_prune(store, k=INTERFERE_TOP_K, threshold=None, amplitude='care', chunk_size=CHUNK_SIZE):
+    """INTERFERE CARE-GUIDED over a CompoundStore, streamed in chunks.
+
+    Returns the keys the bridge reports in mathematical_state: type,
+    n_original, pruned_compounds (records, strongest first) and
+    care_equilibria_preserved.
+    """
+    sel = StreamingTopK(k, threshold)
+    column = store[amplitude]
+    for start in range(0, len(store), chunk_size):
+        stop = min(start + chunk_size, len(store))
+        chunk = {name: store[name][start:stop] for name in ('host_quality', 'optical', 'coherence')}
+        rows = np.arange(start, stop)
+        sel.push(rows, column[start:stop], care_mask(score_matrix(chunk)))
+
+    kept = sel.result()
+    records = store.records(np.array([row for row, _, _ in kept], dtype=np.int64))
+    for rec, (_, amp, _) in zip(records, kept):
+        rec['interference_score'] = amp
+    return {
+        'type': 'interference',
+        'n_original': sel.n_seen,
+        'pruned_compounds': records,
+        'care_equilibria_preserved': sel.preserved,
+    }
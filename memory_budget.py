@@ -0,0 +1,175 @@
+"""
+Memory-budgeted checkpoints: decaying episodes, compacted into patterns.
+
+Without a budget every day adds its episodes, strategies and rules to the
+checkpoint, so a campaign's checkpoints grow linearly. MemoryBudget.apply()
+keeps one agent's checkpoint within max_memories:
+
+    - every episode has an amplitude (1.0 when recorded) and a phase (0 for
+      a success, π for a failure). The amplitude halves every half_life days.
+    - episodes of the same operation interfere: their amplitudes are summed
+      as complex numbers, so matching outcomes reinforce and conflicting
+      ones cancel, and they become one episode carrying a count
+    - an episode whose amplitude falls below cutoff is compacted into its
+      operation's strategic pattern (episode count and success rate)
+    - repeated strategies are kept once, with a 'count'; repeated rules are
+      kept once, with their counts in creative_composition['rule_counts']
+    - if the checkpoint is still over budget, the weakest episodes are
+      compacted (the strongest one is always kept), then memories are
+      dropped until it fits: compacted patterns first, then rules (least
+      repeated first; each is also in its strategy's description), and
+      learned strategies last, lowest success_score first
+
+    budget = MemoryBudget(max_memories=64)
+    checkpoint = budget.apply(carry_forward(previous, today, day), day)
+
+Every memory counts towards max_memories: episodes, strategies and rules.
+The result keeps the save_checkpoint() layout. Episodes gain 'amplitude',
+'phase', 'count' and 'successes'; compacted patterns gain 'episodes'.
+"""
+import cmath
+import math
+
+MAX_MEMORIES = 64
+HALF_LIFE_DAYS = 2.0
+AMPLITUDE_CUTOFF = 0.25
+
+
+def _episode_key(episode):
+    """The operation (rule verb) an episode ran."""
+    return str(episode.get('operation') or 'unknown')
+
+
+def _is_compacted(strategy):
+    return 'episodes' in strategy
+
+
+def _dedupe(items, key):
+    """Items with repeats merged into the first occurrence, which gains 'count'."""
+    out, seen = [], {}
+    for item in items:
+        k = key(item)
+        if k in seen:
+            first = out[seen[k]]
+            if isinstance(first, dict):
+                first['count'] = first.get('count', 1) + item.get('count', 1)
+            continue
+        seen[k] = len(out)
+        out.append(dict(item) if isinstance(item, dict) else item)
+    return out
+
+
+def _count_rules(rules, counts):
+    """(distinct rules in first-seen order, {rule: count}).
+
+    counts holds the counts of rules kept once already (a carried-forward
+    checkpoint's rule_counts); every further occurrence adds one.
+    """
+    distinct, out = [], {}
+    for rule in map(str, rules):
+        if rule in out:
+            out[rule] += 1
+        else:
+            distinct.append(rule)
+            out[rule] = counts.get(rule, 1)
+    return distinct, out
+
+
+class MemoryBudget:
+    """Decay, interference and compaction policy for one agent's checkpoint."""
+
+    def __init__(self, max_memories=MAX_MEMORIES, half_life=HALF_LIFE_DAYS, cutoff=AMPLITUDE_CUTOFF):
+        self.max_memories = max_memories
+        self.half_life = half_life
+        self.cutoff = cutoff
+
+    def amplitude(self, episode, day):
+        """Complex amplitude of an episode as of day."""
+        age = max(day - episode.get('day', day), 0)
+        magnitude = episode.get('amplitude', 1.0) * 0.5 ** (age / self.half_life)
+        phase = episode.get('phase', 0.0 if episode.get('success', True) else math.pi)
+        return cmath.rect(magnitude, phase)
+
+    def interfere(self, episodes, day):
+        """One episode per operation, with amplitudes summed as of day."""
+        merged = {}
+        for e in episodes:
+            m = merged.setdefault(_episode_key(e), [dict(e), 0j, 0, 0])
+            m[1] += self.amplitude(e, day)
+            m[2] += e.get('count', 1)
+            m[3] += e.get('successes', e.get('count', 1) if e.get('success', True) else 0)
+        out = []
+        for episode, amp, count, successes in merged.values():
+            episode.update(day=day, amplitude=abs(amp), phase=cmath.phase(amp) if amp else 0.0,
+                           count=count, successes=successes, success=abs(cmath.phase(amp)) < math.pi / 2)
+            out.append(episode)
+        return out
+
+    def _compact(self, episode, strategies):
+        """Fold an episode into its operation's strategic pattern."""
+        pattern = f"episodes_{_episode_key(episode)}"
+        for s in strategies:
+            if s.get('pattern') == pattern:
+                break
+        else:
+            s = {'pattern': pattern, 'description': f"compacted episodes of {_episode_key(episode)}",
+                 'success_score': 0.0, 'episodes': 0, 'successes': 0}
+            strategies.append(s)
+        s['episodes'] += episode.get('count', 1)
+        s['successes'] += episode.get('successes', 0)
+        s['success_score'] = round(s['successes'] / s['episodes'], 4)
+
+    def apply(self, checkpoint, day):
+        """checkpoint as of day, within the budget. The input is not modified."""
+        strategic = checkpoint.get('strategic', {})
+        strategies = _dedupe(strategic.get('strategies', ()), lambda s: (s.get('pattern'), s.get('description')))
+        episodes = []
+        for e in self.interfere(checkpoint.get('episodic', {}).get('episodes', ()), day):
+            if e['amplitude'] < self.cutoff:
+                self._compact(e, strategies)
+            else:
+                episodes.append(e)
+
+        creative = dict(checkpoint.get('creative_composition', {}))
+        rules, counts = _count_rules(creative.get('rules_invented', ()), creative.get('rule_counts', {}))
+
+        over = len(episodes) + len(strategies) + len(rules) - self.max_memories
+        if over > 0:
+            # Weakest first, down to the strongest episode
+            weakest = sorted(range(len(episodes)), key=lambda i: episodes[i]['amplitude'])[:-1]
+            compacted = set()
+            for i in weakest:
+                if over <= 0:
+                    break
+                before = len(strategies)
+                self._compact(episodes[i], strategies)
+                compacted.add(i)
+                over -= 1 - (len(strategies) - before)
+            episodes = [e for i, e in enumerate(episodes) if i not in compacted]
+        if over > 0:
+            # Compacted patterns go first, then rules, then learned strategies
+            drop = sorted((i for i, s in enumerate(strategies) if _is_compacted(s)),
+                          key=lambda i: strategies[i]['success_score'])[:over]
+            over -= len(drop)
+            if over > 0:
+                # Least repeated rules first, the older of equal ones first
+                trimmed = set(sorted(range(len(rules)), key=lambda i: counts[rules[i]])[:over])
+                over -= len(trimmed)
+                rules = [r for i, r in enumerate(rules) if i not in trimmed]
+            if over > 0:
+                learned = sorted((i for i, s in enumerate(strategies) if not _is_compacted(s)),
+                                 key=lambda i: (strategies[i].get('success_score', 0), strategies[i].get('count', 1)))
+                drop += learned[:over]
+                over -= len(learned[:over])
+            drop = set(drop)
+            strategies = [s for i, s in enumerate(strategies) if i not in drop]
+        if over > 0:
+            episodes = episodes[over:]  # only when max_memories < 1
+
+        creative['rules_invented'] = rules
+        creative['rule_counts'] = {r: counts[r] for r in rules}
+        out = dict(checkpoint)
+        out['episodic'] = {'episodes': episodes}
+        out['strategic'] = {'strategies': strategies, 'pattern_count': len(strategies)}
+        out['creative_composition'] = creative
+        return out
@@ -4,12 +4,23 @@ COGNISYN UI/UX Slides — for CodeLaunch "Mockups/Wireframes" upload.
 Run locally: streamlit run mockup_slides.py
 Screenshot each slide → paste into Google Slides → export as PDF.
 Formatted for 16:9 aspect ratio — one screenshot per Google Slide.
+
+Slides are registered with @slide(title, images=...) and looked up by the
+selector, so a slide switch runs only that slide's function. Slide images
+are read once per server process and kept in memory, every registered
+image is checked when the server starts (a missing one is shown as a
+placeholder instead of failing the slide), and the next slide's images are
+loaded after each render so stepping through the deck never waits on disk.
 """
+from pathlib import Path
+
 import streamlit as st
 
 st.set_page_config(page_title="COGNISYN UI/UX", page_icon="🔬", layout="wide", initial_sidebar_state="collapsed")
 
-st.markdown("""
+ASSET_DIR = Path(__file__).resolve().parent
+
+CSS = """
 <style>
 .main {background-color: #0e1117;}
 h1, h2, h3 {color: #00ffff;}
@@ -20,27 +31,84 @@ p, li, .stMarkdown {font-size: 18px !important; line-height: 1.6;}
 footer {visibility: hidden;}
 header {visibility: hidden;}
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# Top-level slide selector (no sidebar)
-slide = st.selectbox("Slide", [
-    "1. Orchestration Monitor — Overview",
-    "2. Orchestration Monitor — B1 & B2",
-    "3. Orchestration Monitor — B2 & B3",
-    "4. Pipeline Test Code — Setup & SUPERPOSE",
-    "5. Pipeline Test Code — Multi-Stage Operations",
-    "6. System Overview",
-    "7. Three-Agent Architecture",
-    "8. Baba is Quantum Grammar",
-    "9. Pipeline Progression",
-    "10. Pipeline Output — SUPERPOSE & ENTANGLE",
-    "11. Pipeline Output — INTERFERE & Care vs Nash",
-    "12. Care vs Nash Equilibria",
-    "13. Agent Learning System",
-])
-
-if slide.startswith("1."):
-    # ---- SLIDE 1: ORCHESTRATION MONITOR — OVERVIEW ----
+
+# ============================================================================
+# SLIDE REGISTRY
+# ============================================================================
+
+# Selector title -> (render function, image files it shows), in deck order
+SLIDES = {}
+
+
+def slide(title, images=()):
+    """Register the decorated function as the slide shown for title."""
+    def register(render):
+        SLIDES[title] = (render, tuple(images))
+        return render
+    return register
+
+
+@st.cache_resource
+def image_bytes(name):
+    """PNG bytes read once per server process, shared by every session."""
+    return (ASSET_DIR / name).read_bytes()
+
+
+@st.cache_resource
+def missing_assets():
+    """Registered slide images not on disk, checked once at server start."""
+    names = dict.fromkeys(name for _, images in SLIDES.values() for name in images)
+    return [name for name in names if not (ASSET_DIR / name).is_file()]
+
+
+def slide_image(name, caption):
+    if name in missing_assets():
+        st.markdown(f"""
+        <div style="padding: 80px 20px; background-color: #1e2130; border: 2px dashed #444; border-radius: 8px; text-align: center;">
+            <span style="font-size: 16px; color: #888;">Screenshot not available: {name}</span>
+        </div>
+        <div style="font-size: 14px; color: #888; text-align: center; margin-top: 6px;">{caption}</div>
+        """, unsafe_allow_html=True)
+    else:
+        st.image(image_bytes(name), caption=caption)
+
+
+PROGRESSION_EXAMPLES = [
+    ("1", "SUPERPOSE", "Cooperative Parallel Evaluation", "Evaluate all 1,073 compounds", "#00d4aa"),
+    ("2", "COUPLE", "Scale Coupling Analysis", "Cross-scale: host quality ↔ optical", "#4dabf7"),
+    ("3", "FILTER → ENTANGLE", "Nuclear Spin Bath + Synergy", "Two-stage: I=0 filter then synergy detection", "#da77f2"),
+    ("4", "INTERFERE", "Quantum Pruning", "1,073 → 25 compounds, zero Care equilibria lost", "#ffd43b"),
+    ("5", "FILTER → COUPLE → ENTANGLE", "Full Pipeline", "Three-stage discovery workflow", "#ff6b6b"),
+]
+
+
+@st.cache_resource
+def progression_cards():
+    """Slide 9's example cards, formatted once per server process."""
+    return [
+        f"""
+        <div style="background-color: #1e2130; padding: 20px 28px; border-radius: 10px; border-left: 6px solid {color}; margin: 0 40px 12px 40px; display: flex; align-items: center; gap: 24px;">
+            <div style="font-size: 36px; color: {color}; font-weight: bold; min-width: 40px;">Ex {num}</div>
+            <div>
+                <div style="font-size: 18px; color: #e0e0e0; font-weight: bold;">{title}</div>
+                <code style="font-size: 15px; color: #00ffff;">{ops}</code>
+                <div style="font-size: 14px; color: #888; margin-top: 4px;">{desc}</div>
+            </div>
+        </div>
+        """
+        for num, ops, title, desc, color in PROGRESSION_EXAMPLES
+    ]
+
+
+# ============================================================================
+# SLIDES
+# ============================================================================
+
+# ---- SLIDE 1: ORCHESTRATION MONITOR — OVERVIEW ----
+@slide("1. Orchestration Monitor — Overview", images=("dashboard_overview.png",))
+def slide_1():
     st.markdown("""
     <div style="padding: 20px 40px 10px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 8px;">
@@ -52,7 +120,7 @@ if slide.startswith("1."):
     </div>
     """, unsafe_allow_html=True)
 
-    st.image("dashboard_overview.png", caption="System overview: 5/5 examples complete, 3/3 agents, 1,073 compounds evaluated, 24 strategic patterns learned")
+    slide_image("dashboard_overview.png", caption="System overview: 5/5 examples complete, 3/3 agents, 1,073 compounds evaluated, 24 strategic patterns learned")
 
     st.markdown("""
     <div style="text-align: center; padding: 12px; background-color: #1e2130; border-radius: 8px; margin-top: 10px;">
@@ -62,8 +130,10 @@ if slide.startswith("1."):
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("2."):
-    # ---- SLIDE 2: ORCHESTRATION MONITOR — B1 & B2 ----
+
+# ---- SLIDE 2: ORCHESTRATION MONITOR — B1 & B2 ----
+@slide("2. Orchestration Monitor — B1 & B2", images=("dashboard_b1_examples.png", "dashboard_b1_b2.png"))
+def slide_2():
     st.markdown("""
     <div style="padding: 20px 40px 10px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 8px;">
@@ -77,9 +147,9 @@ elif slide.startswith("2."):
 
     col1, col2 = st.columns(2)
     with col1:
-        st.image("dashboard_b1_examples.png", caption="B1 (Host Quality): All 5 examples — SUPERPOSE to full 3-stage pipeline")
+        slide_image("dashboard_b1_examples.png", caption="B1 (Host Quality): All 5 examples — SUPERPOSE to full 3-stage pipeline")
     with col2:
-        st.image("dashboard_b1_b2.png", caption="B1 completes, B2 (Optical) begins — same grammar, different perspective")
+        slide_image("dashboard_b1_b2.png", caption="B1 completes, B2 (Optical) begins — same grammar, different perspective")
 
     st.markdown("""
     <div style="text-align: center; padding: 12px; background-color: #1e2130; border-radius: 8px; margin-top: 10px;">
@@ -89,8 +159,10 @@ elif slide.startswith("2."):
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("3."):
-    # ---- SLIDE 3: ORCHESTRATION MONITOR — B2 & B3 ----
+
+# ---- SLIDE 3: ORCHESTRATION MONITOR — B2 & B3 ----
+@slide("3. Orchestration Monitor — B2 & B3", images=("dashboard_b2_b3.png", "dashboard_b3_coherence.png"))
+def slide_3():
     st.markdown("""
     <div style="padding: 20px 40px 10px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 8px;">
@@ -104,9 +176,9 @@ elif slide.startswith("3."):
 
     col1, col2 = st.columns(2)
     with col1:
-        st.image("dashboard_b2_b3.png", caption="B2 complete, B3 (Coherence) begins — each agent evaluates from its own property perspective")
+        slide_image("dashboard_b2_b3.png", caption="B2 complete, B3 (Coherence) begins — each agent evaluates from its own property perspective")
     with col2:
-        st.image("dashboard_b3_coherence.png", caption="B3 complete — where all three score above threshold, that's a Care equilibrium")
+        slide_image("dashboard_b3_coherence.png", caption="B3 complete — where all three score above threshold, that's a Care equilibrium")
 
     st.markdown("""
     <div style="text-align: center; padding: 16px; background-color: #1e2130; border-radius: 8px; margin-top: 16px;">
@@ -122,8 +194,10 @@ elif slide.startswith("3."):
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("4."):
-    # ---- SLIDE 4: PIPELINE TEST CODE — SETUP & SUPERPOSE ----
+
+# ---- SLIDE 4: PIPELINE TEST CODE — SETUP & SUPERPOSE ----
+@slide("4. Pipeline Test Code — Setup & SUPERPOSE")
+def slide_4():
     st.markdown("""
     <div style="padding: 20px 40px 10px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 8px;">
@@ -169,8 +243,10 @@ result = await b.orchestrate_mathematics(rule, ctx, {'day': 6})
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("5."):
-    # ---- SLIDE 5: PIPELINE TEST CODE — PIPELINE & RESULTS ----
+
+# ---- SLIDE 5: PIPELINE TEST CODE — PIPELINE & RESULTS ----
+@slide("5. Pipeline Test Code — Multi-Stage Operations")
+def slide_5():
     st.markdown("""
     <div style="padding: 20px 40px 10px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 8px;">
@@ -211,8 +287,10 @@ result = await b.orchestrate_mathematics(rule, ctx, {'day': 6})
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("6."):
-    # ---- SLIDE 6: SYSTEM OVERVIEW ----
+
+# ---- SLIDE 6: SYSTEM OVERVIEW ----
+@slide("6. System Overview")
+def slide_6():
     st.markdown("""
     <div style="text-align: center; padding: 60px 40px;">
         <h1 style="font-size: 48px; color: #00ffff; margin-bottom: 20px;">🔬 COGNISYN</h1>
@@ -247,8 +325,10 @@ elif slide.startswith("6."):
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("7."):
-    # ---- SLIDE 7: THREE-AGENT ARCHITECTURE ----
+
+# ---- SLIDE 7: THREE-AGENT ARCHITECTURE ----
+@slide("7. Three-Agent Architecture")
+def slide_7():
     st.markdown("""
     <div style="padding: 40px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 30px;">
@@ -301,8 +381,10 @@ elif slide.startswith("7."):
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("8."):
-    # ---- SLIDE 8: BABA IS QUANTUM GRAMMAR ----
+
+# ---- SLIDE 8: BABA IS QUANTUM GRAMMAR ----
+@slide("8. Baba is Quantum Grammar")
+def slide_8():
     st.markdown("""
     <div style="padding: 40px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 30px;">
@@ -341,8 +423,10 @@ elif slide.startswith("8."):
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("9."):
-    # ---- SLIDE 9: PIPELINE PROGRESSION ----
+
+# ---- SLIDE 9: PIPELINE PROGRESSION ----
+@slide("9. Pipeline Progression")
+def slide_9():
     st.markdown("""
     <div style="padding: 40px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 30px;">
@@ -354,25 +438,8 @@ elif slide.startswith("9."):
     </div>
     """, unsafe_allow_html=True)
 
-    examples = [
-        ("1", "SUPERPOSE", "Cooperative Parallel Evaluation", "Evaluate all 1,073 compounds", "#00d4aa"),
-        ("2", "COUPLE", "Scale Coupling Analysis", "Cross-scale: host quality ↔ optical", "#4dabf7"),
-        ("3", "FILTER → ENTANGLE", "Nuclear Spin Bath + Synergy", "Two-stage: I=0 filter then synergy detection", "#da77f2"),
-        ("4", "INTERFERE", "Quantum Pruning", "1,073 → 25 compounds, zero Care equilibria lost", "#ffd43b"),
-        ("5", "FILTER → COUPLE → ENTANGLE", "Full Pipeline", "Three-stage discovery workflow", "#ff6b6b"),
-    ]
-
-    for num, ops, title, desc, color in examples:
-        st.markdown(f"""
-        <div style="background-color: #1e2130; padding: 20px 28px; border-radius: 10px; border-left: 6px solid {color}; margin: 0 40px 12px 40px; display: flex; align-items: center; gap: 24px;">
-            <div style="font-size: 36px; color: {color}; font-weight: bold; min-width: 40px;">Ex {num}</div>
-            <div>
-                <div style="font-size: 18px; color: #e0e0e0; font-weight: bold;">{title}</div>
-                <code style="font-size: 15px; color: #00ffff;">{ops}</code>
-                <div style="font-size: 14px; color: #888; margin-top: 4px;">{desc}</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    for card in progression_cards():
+        st.markdown(card, unsafe_allow_html=True)
 
     st.markdown("""
     <div style="text-align: center; margin: 20px 40px 0; padding: 16px; background-color: #1e2130; border-radius: 8px;">
@@ -383,8 +450,10 @@ elif slide.startswith("9."):
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("10."):
-    # ---- SLIDE 10: PIPELINE OUTPUT — SUPERPOSE & ENTANGLE ----
+
+# ---- SLIDE 10: PIPELINE OUTPUT — SUPERPOSE & ENTANGLE ----
+@slide("10. Pipeline Output — SUPERPOSE & ENTANGLE")
+def slide_10():
     st.markdown("""
     <div style="padding: 30px 40px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 10px;">
@@ -419,8 +488,10 @@ elif slide.startswith("10."):
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("11."):
-    # ---- SLIDE 11: PIPELINE OUTPUT — INTERFERE & CARE VS NASH ----
+
+# ---- SLIDE 11: PIPELINE OUTPUT — INTERFERE & CARE VS NASH ----
+@slide("11. Pipeline Output — INTERFERE & Care vs Nash")
+def slide_11():
     st.markdown("""
     <div style="padding: 30px 40px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 10px;">
@@ -453,8 +524,10 @@ elif slide.startswith("11."):
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("12."):
-    # ---- SLIDE 12: CARE VS NASH FULL ----
+
+# ---- SLIDE 12: CARE VS NASH FULL ----
+@slide("12. Care vs Nash Equilibria")
+def slide_12():
     st.markdown("""
     <div style="padding: 40px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 30px;">
@@ -495,8 +568,10 @@ elif slide.startswith("12."):
     </div>
     """, unsafe_allow_html=True)
 
-elif slide.startswith("13."):
-    # ---- SLIDE 13: AGENT LEARNING ----
+
+# ---- SLIDE 13: AGENT LEARNING ----
+@slide("13. Agent Learning System")
+def slide_13():
     st.markdown("""
     <div style="padding: 40px;">
         <h2 style="font-size: 36px; color: #00ffff; text-align: center; margin-bottom: 30px;">
@@ -536,3 +611,26 @@ elif slide.startswith("13."):
         </div>
     </div>
     """, unsafe_allow_html=True)
+
+
+# ============================================================================
+# DECK
+# ============================================================================
+
+st.markdown(CSS, unsafe_allow_html=True)
+
+missing = missing_assets()
+if missing and not st.session_state.get("asset_warning_shown"):
+    st.session_state["asset_warning_shown"] = True
+    st.toast(f"Missing slide images: {', '.join(missing)}")
+
+# Top-level slide selector (no sidebar)
+titles = list(SLIDES)
+selected = st.selectbox("Slide", titles)
+SLIDES[selected][0]()
+
+# Load the next slide's images now, so switching to it is served from memory
+upcoming = titles[(titles.index(selected) + 1) % len(titles)]
+for name in SLIDES[upcoming][1]:
+    if name not in missing:
+        image_bytes(name)
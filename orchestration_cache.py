@@ -0,0 +1,258 @@
+"""
+Content-addressed memo layer for OrchestrationBridge.orchestrate_mathematics.
+
+Results are keyed on the rule triple (subject, verb, property), a hash of
+the input compound set and the adapter's data version, so identical
+operations are computed once per process no matter which agent or example
+asks for them. One SHARED_CACHE is used by every bridge in the process.
+
+    b = setup_bridge('B1')
+    install(b, record=episode_recorder(memory))   # memoized for this agent
+    r = await b.orchestrate_mathematics(rule, ctx, {'day': 6})
+    SHARED_CACHE.stats()            # {'hits': .., 'misses': .., 'size': .., ...}
+
+orchestrate_mathematics also records an episode in the calling agent's
+memory. A result served from the cache never reaches the bridge, so the
+record callback writes that episode instead (episode_recorder documents
+its schema). A bridge installed without one computes every rule, as if it
+were uncached, and install() warns once that caching is off. Every caller
+gets its own copy of the result, so changing one agent's state cannot leak
+into another's. With a result_cache.DiskResultCache set as cache.disk, memory
+misses are looked up on disk, and fresh results are written there for
+later runs, unless the adapter's data version is unknown.
+"""
+import asyncio
+import copy
+import hashlib
+import json
+import warnings
+from collections import OrderedDict
+from pathlib import Path
+
+from compact_state import CompactState, CompoundTable, compact
+
+# Verbs whose output depends only on the rule triple and the input compound
+# set. Other verbs also read agent state, so they always go to the bridge.
+CACHEABLE_VERBS = frozenset({'FILTER', 'SUPERPOSE', 'INTERFERE'})
+
+DEFAULT_MAXSIZE = 256
+
+# adapter_data_version() when the adapter's data cannot be versioned
+UNVERSIONED = 'unversioned'
+
+# Memory methods an episode write can be replayed through, tried in order.
+# DynamicMemoryArchitecture's episode API is not part of this tree, so
+# these are the names it is looked up under; see episode_recorder().
+EPISODE_METHODS = ('record_episode', 'add_episode', 'store_episode')
+
+
+def _compound_token(c):
+    if isinstance(c, dict):
+        mid = c.get('material_id')
+        if mid is not None:
+            return str(mid)
+        return json.dumps(c, sort_keys=True, default=str)
+    return str(c)
+
+
+def compound_set_hash(compounds):
+    """Order-sensitive hash of a compound list (material_id where available)."""
+    h = hashlib.blake2b(digest_size=16)
+    for c in compounds:
+        h.update(_compound_token(c).encode())
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def adapter_data_version(adapter):
+    """Best-effort version stamp for the adapter's compound data.
+
+    Uses the adapter's own data_version if it has one, otherwise the mtime
+    and size of its cache file, so a refreshed cache invalidates old entries.
+    """
+    if adapter is None:
+        return 'no-adapter'
+    version = getattr(adapter, 'data_version', None)
+    if version is not None:
+        return str(version)
+    for attr in ('cache_file', 'cache_path'):
+        path = getattr(adapter, attr, None)
+        if path and Path(path).exists():
+            st = Path(path).stat()
+            return f"{st.st_mtime_ns}:{st.st_size}"
+    return UNVERSIONED
+
+
+def episode_recorder(memory):
+    """record(rule, ctx, result) writing a cache hit's episode into memory, or None.
+
+    The episode passed to the memory method is one dict:
+
+        operation     rule verb ('FILTER', ...)
+        rule          '[subject] [verb] [property]'
+        day           ctx['day']
+        success       True (only successful results are cached)
+        description   the result's mathematical_state_description
+
+    operation and success are the fields save_checkpoint() episodes carry.
+    None when memory has none of EPISODE_METHODS: the bridge's own write
+    cannot be replayed, so rules for that agent are left uncached.
+    """
+    for name in EPISODE_METHODS:
+        method = getattr(memory, name, None)
+        if callable(method):
+            break
+    else:
+        return None
+
+    def record(rule, ctx, result):
+        method({'operation': rule.verb, 'rule': f"[{rule.subject}] [{rule.verb}] [{rule.property}]",
+                'day': ctx.get('day'), 'success': True,
+                'description': getattr(result, 'mathematical_state_description', None)})
+    return record
+
+
+def pack_result(result):
+    """(result without its state, compacted state): what the cache keeps."""
+    shell = copy.copy(result)
+    shell.mathematical_state = None
+    return shell, compact(result.mathematical_state)
+
+
+def unpack_result(entry):
+    """A result rebuilt from a cache entry, with its own mathematical_state.
+
+    The state is expanded into fresh dicts, so one caller can change it
+    without affecting any other.
+    """
+    shell, state = entry
+    out = copy.copy(shell)
+    if isinstance(state, CompactState):
+        state = {k: v.to_list() if isinstance(v, CompoundTable) else copy.deepcopy(v) for k, v in state.items()}
+    else:
+        state = copy.deepcopy(state)
+    out.mathematical_state = state
+    return out
+
+
+class OrchestrationCache:
+    """LRU cache of orchestrate_mathematics results with hit/miss counters.
+
+    Entries hold each state compacted (compact_state.compact), and every
+    lookup expands a fresh copy of it.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, cacheable_verbs=CACHEABLE_VERBS, disk=None):
+        self.maxsize = maxsize
+        self.cacheable_verbs = frozenset(cacheable_verbs)
+        self.disk = disk
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.warned = False
+
+    def key(self, rule, ctx, adapter):
+        compounds = ctx.get('compounds')
+        input_hash = 'adapter:all' if compounds is None else compound_set_hash(compounds)
+        return (rule.subject, rule.verb, rule.property, input_hash, adapter_data_version(adapter))
+
+    def get(self, key):
+        """Cache entry (see pack_result) for key, or None."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        return None
+
+    def put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def orchestrate(self, bridge, compute, rule, ctx, *args, record=None, **kwargs):
+        """Return a copy of the cached result for rule, or await compute() and store it.
+
+        record(rule, ctx, result) is called for every result not computed by
+        the bridge (memory, in-flight or disk hits). Without it the rule is
+        always computed. Concurrent requests for the same key share one
+        in-flight computation.
+        """
+        if rule.verb not in self.cacheable_verbs or record is None:
+            self.bypassed += 1
+            return await compute(rule, ctx, *args, **kwargs)
+
+        key = self.key(rule, ctx, getattr(bridge, 'materials_adapter', None))
+        entry = self.get(key)
+        if entry is None and key in self._inflight:
+            entry = await asyncio.shield(self._inflight[key])
+        if entry is not None:
+            self.hits += 1
+            result = unpack_result(entry)
+            record(rule, ctx, result)
+            return result
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        # An unversioned entry would outlive any change to the adapter's data
+        disk = self.disk if key[-1] != UNVERSIONED else None
+        try:
+            result = disk.get(key) if disk is not None else None
+            if result is None:
+                result = await compute(rule, ctx, *args, **kwargs)
+                if disk is not None:
+                    disk.put(key, result)
+            else:
+                record(rule, ctx, result)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved; waiters re-raise it themselves
+            raise
+        else:
+            entry = pack_result(result)
+            self.put(key, entry)
+            future.set_result(entry)
+            return unpack_result(entry)
+        finally:
+            del self._inflight[key]
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.bypassed = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'bypassed': self.bypassed,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+SHARED_CACHE = OrchestrationCache()
+
+
+def install(bridge, cache=SHARED_CACHE, record=None):
+    """Route bridge.orchestrate_mathematics through cache. Returns the bridge.
+
+    record replays the bridge's memory write for cache hits (see
+    episode_recorder). Without it nothing is served from the cache, and
+    the first such install() warns.
+    """
+    if record is None and not cache.warned:
+        cache.warned = True
+        warnings.warn("orchestration cache disabled: the agent memory has none of "
+                      f"{', '.join(EPISODE_METHODS)}(), so cache hits could not record their episode",
+                      RuntimeWarning, stacklevel=2)
+    compute = bridge.orchestrate_mathematics
+
+    async def orchestrate_mathematics(rule, ctx, *args, **kwargs):
+        return await cache.orchestrate(bridge, compute, rule, ctx, *args, record=record, **kwargs)
+
+    bridge.orchestrate_mathematics = orchestrate_mathematics
+    return bridge
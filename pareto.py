@@ -0,0 +1,163 @@
+"""
+Pareto frontier and dominance ranks over the (N, 3) B1/B2/B3 score matrix.
+
+Compound a dominates b when a scores at least as high as b for every agent
+and higher for at least one. The frontier is the set of compounds nothing
+dominates (rank 0); rank k is the frontier left after removing ranks
+0..k-1. Higher scores are better and NaN counts as the worst score.
+
+Both use a sweep rather than pairwise checks: compounds are visited in
+descending B1 order, so anything that could dominate the current compound
+has already been seen, and what remains is a 2D question about (B2, B3).
+Each rank keeps its (B2, B3) staircase as two sorted lists, so the test is
+a bisect. Ranks are nested (whatever rank k dominates, rank k-1 dominates
+too), so a compound's rank is a binary search over the staircases. That is
+O(n log n) for the frontier and O(n log n log R) for R ranks.
+
+    front = pareto_frontier(scores)          # indices of rank-0 compounds
+    ranks = pareto_ranks(scores)             # (N,) int, 0 = frontier
+    off = care_off_frontier(scores, ranks)   # Care equilibria that are dominated
+"""
+from bisect import bisect_left
+
+import numpy as np
+
+from care_scoring import CARE_THRESHOLD, care_equilibria
+
+# Points taken from the top of each column by pareto_frontier() to discard
+# dominated compounds with whole-column comparisons before the sweep
+PREFILTER_POINTS = 8
+
+
+class _Staircase:
+    """Non-dominated (y, z) points: y ascending, z descending."""
+    __slots__ = ('ys', 'zs')
+
+    def __init__(self):
+        self.ys = []
+        self.zs = []
+
+    def dominates(self, y, z):
+        i = bisect_left(self.ys, y)
+        return i < len(self.ys) and self.zs[i] >= z
+
+    def add(self, y, z):
+        """Insert (y, z), which dominates() has just rejected."""
+        ys, zs = self.ys, self.zs
+        hi = lo = bisect_left(ys, y)
+        if hi < len(ys) and ys[hi] == y:
+            hi += 1  # same y, lower z
+        while lo > 0 and zs[lo - 1] <= z:
+            lo -= 1
+        ys[lo:hi] = [y]
+        zs[lo:hi] = [z]
+
+
+def _sweep_order(scores):
+    """Rows in descending lexicographic (B1, B2, B3) order, NaN as -inf.
+
+    In this order no compound can be dominated by one visited after it, and
+    identical rows are adjacent.
+    """
+    s = np.where(np.isnan(scores), -np.inf, scores)
+    order = np.lexsort((-s[:, 2], -s[:, 1], -s[:, 0]))
+    return order, s[order, 1].tolist(), s[order, 2].tolist(), s[order]
+
+
+def _sweep(scores, max_rank=None):
+    """Rank of each row. Rows past max_rank (if given) get max_rank + 1."""
+    n = len(scores)
+    ranks = np.empty(n, dtype=np.int64)
+    if n == 0:
+        return ranks
+    order, ys, zs, s = _sweep_order(scores)
+    same = np.zeros(n, dtype=bool)
+    same[1:] = (s[1:] == s[:-1]).all(axis=1)
+    same = same.tolist()
+
+    fronts = []
+    out = [0] * n
+    limit = n if max_rank is None else max_rank + 1
+    for i in range(n):
+        if same[i]:
+            # Identical rows do not dominate each other
+            out[i] = out[i - 1]
+            continue
+        y, z = ys[i], zs[i]
+        lo, hi = 0, len(fronts)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if fronts[mid].dominates(y, z):
+                lo = mid + 1
+            else:
+                hi = mid
+        out[i] = lo
+        if lo < limit:
+            if lo == len(fronts):
+                fronts.append(_Staircase())
+            fronts[lo].add(y, z)
+    ranks[order] = np.minimum(out, limit)
+    return ranks
+
+
+def _prefilter(scores):
+    """Mask of rows not strictly dominated by a few strong rows.
+
+    Only strict domination is used, so no frontier row is ever removed.
+    """
+    s = np.where(np.isnan(scores), -np.inf, scores)
+    keep = np.ones(len(s), dtype=bool)
+    picks = set()
+    for col in (s.sum(axis=1), s.min(axis=1), s[:, 0], s[:, 1], s[:, 2]):
+        k = min(PREFILTER_POINTS, len(s))
+        picks.update(np.argpartition(-col, k - 1)[:k].tolist())
+    for p in picks:
+        dominated = s[:, 0] < s[p, 0]
+        for j in range(1, s.shape[1]):
+            dominated &= s[:, j] < s[p, j]
+        keep &= ~dominated
+    return keep
+
+
+def pareto_frontier(scores):
+    """Indices of non-dominated compounds, in descending B1 order."""
+    scores = np.asarray(scores, dtype=np.float64)
+    if len(scores) == 0:
+        return np.empty(0, dtype=np.int64)
+    candidates = np.flatnonzero(_prefilter(scores))
+    ranks = _sweep(scores[candidates], max_rank=0)
+    front = candidates[ranks == 0]
+    return front[np.lexsort((-scores[front, 2], -scores[front, 1], -scores[front, 0]))]
+
+
+def pareto_ranks(scores, max_rank=None):
+    """(N,) dominance rank per compound: 0 on the frontier, 1 on the next, ...
+
+    With max_rank, ranks above it are reported as max_rank + 1, which saves
+    building the deeper fronts when only the top few are needed.
+    """
+    return _sweep(np.asarray(scores, dtype=np.float64), max_rank)
+
+
+def care_off_frontier(scores, ranks=None, threshold=CARE_THRESHOLD):
+    """Care equilibria that some other compound dominates, best first."""
+    if ranks is None:
+        ranks = pareto_ranks(scores, max_rank=0)
+    idx = care_equilibria(scores, threshold)
+    return idx[ranks[idx] > 0]
+
+
+def pareto_summary(scores, threshold=CARE_THRESHOLD):
+    """Counts for reports: frontier size, fronts, and where Care equilibria sit."""
+    ranks = pareto_ranks(scores)
+    care = care_equilibria(scores, threshold)
+    off = care[ranks[care] > 0]
+    return {
+        'compounds': len(ranks),
+        'frontier': int((ranks == 0).sum()),
+        'fronts': int(ranks.max()) + 1 if len(ranks) else 0,
+        'care_equilibria': len(care),
+        'care_on_frontier': len(care) - len(off),
+        'care_off_frontier': off,
+        'ranks': ranks,
+    }
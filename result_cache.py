@@ -0,0 +1,151 @@
+"""
+On-disk tier for the orchestration cache, so re-running the capture reuses
+results from earlier runs.
+
+Each result is one file under data/result_cache/, named by a hash of its
+key: the rule triple, the input compound hash, the adapter data version
+(all from OrchestrationCache.key) and the engine version. The body is a
+4-byte magic followed by a zlib-compressed pickle of the whole result
+object. Files are written to a temp name and renamed into place, so
+concurrent worker processes never see a partial file. When the directory
+grows past max_bytes the least recently used files are removed; a hit
+refreshes the file's mtime. Results whose adapter data has no version
+stamp are not persisted (see OrchestrationCache.orchestrate), since such
+an entry could never be invalidated.
+
+    disk = DiskResultCache('data/result_cache', engine_version(OrchestrationBridge))
+    SHARED_CACHE.disk = disk         # memory misses now fall through to disk
+"""
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import zlib
+from pathlib import Path
+
+MAGIC = b'OCR1'
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+def _package_stamp(module):
+    """Digest of the mtime and size of every .py file in module's top-level package.
+
+    A module outside any package is stamped on its own file.
+    """
+    top = sys.modules.get(module.__name__.partition('.')[0], module)
+    roots = [Path(p) for p in getattr(top, '__path__', ())]
+    files = [f for root in roots for f in sorted(root.rglob('*.py'))]
+    if not files:
+        files = [Path(inspect.getsourcefile(module))]
+    h = hashlib.blake2b(digest_size=8)
+    for f in files:
+        st = f.stat()
+        h.update(f"{f}:{st.st_mtime_ns}:{st.st_size};".encode())
+    return h.hexdigest()
+
+
+def engine_version(*classes):
+    """Version stamp for the engine: package __version__ or a digest of its sources.
+
+    Without a __version__, editing any module in the package a class comes
+    from (its helpers included) invalidates every entry written before.
+    Code the engine imports from outside those packages is not covered.
+    """
+    parts = []
+    for cls in classes:
+        module = sys.modules.get(cls.__module__)
+        top = sys.modules.get(cls.__module__.partition('.')[0])
+        version = getattr(module, '__version__', None) or getattr(top, '__version__', None)
+        if version is None:
+            try:
+                version = _package_stamp(module)
+            except (TypeError, OSError):
+                version = 'unknown'
+        parts.append(f"{cls.__module__}.{cls.__qualname__}={version}")
+    return ';'.join(parts)
+
+
+class DiskResultCache:
+    """Size-bounded directory of pickled orchestrate_mathematics results."""
+
+    def __init__(self, path, engine_version='unversioned', max_bytes=DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.engine_version = engine_version
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evicted = 0
+
+    def _file(self, key):
+        digest = hashlib.blake2b(repr((key, self.engine_version)).encode(), digest_size=16).hexdigest()
+        return self.path / f"{digest}.bin"
+
+    def get(self, key):
+        """Cached result for key, or None. Unreadable files count as misses."""
+        path = self._file(key)
+        try:
+            blob = path.read_bytes()
+            if not blob.startswith(MAGIC):
+                raise ValueError("bad magic")
+            result = pickle.loads(zlib.decompress(blob[len(MAGIC):]))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, zlib.error, pickle.UnpicklingError, AttributeError, ImportError, EOFError):
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """Store result. Results that cannot be pickled are skipped."""
+        try:
+            blob = MAGIC + zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        path = self._file(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(blob)
+        os.replace(tmp, path)
+        self.writes += 1
+        self.evict()
+        return True
+
+    def evict(self):
+        """Remove least recently used files until the total fits max_bytes."""
+        files = []
+        total = 0
+        for p in self.path.glob('*.bin'):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue  # removed by another process
+            files.append((st.st_mtime_ns, st.st_size, p))
+            total += st.st_size
+        for _, size, p in sorted(files):
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            self.evicted += 1
+        return total
+
+    def clear(self):
+        for p in self.path.glob('*.bin'):
+            p.unlink(missing_ok=True)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'evicted': self.evicted,
+            'files': sum(1 for _ in self.path.glob('*.bin')),
+            'bytes': sum(p.stat().st_size for p in self.path.glob('*.bin')),
+            'max_bytes': self.max_bytes,
+        }
@@ -0,0 +1,95 @@
+"""
+Batched orchestration: submit a burst of rules, get results as they finish.
+
+When an agent proposes many rules in one turn, awaiting
+orchestrate_mathematics once per rule runs them one after another.
+orchestrate_batch() takes the whole list in one call:
+
+    - rules repeated in the batch are computed once and share the result.
+      The bridge then records one memory episode for them, not one per
+      repeat.
+    - the distinct rules are all in flight at once (or max_concurrency of
+      them), in the order they were first submitted
+
+Each rule is validated by the bridge itself, as a single
+orchestrate_mathematics call would be; a rule that fails comes back as an
+error. The distinct rules still run one H_total evaluation each: running
+them concurrently overlaps their awaits, not their CPU time.
+
+Results are yielded in completion order as BatchItems, whose index is the
+rule's position in the submitted list:
+
+    async for item in orchestrate_batch(b, rules, ctx, {'day': 6}):
+        if item.error is None:
+            use(rules[item.index], item.result.mathematical_state)
+
+Repeats of a rule share one result object, which must be treated as
+read-only.
+"""
+import asyncio
+import contextlib
+
+
+class BatchItem:
+    __slots__ = ('index', 'rule', 'result', 'error')
+
+    def __init__(self, index, rule, result=None, error=None):
+        self.index = index
+        self.rule = rule
+        self.result = result
+        self.error = error
+
+    def __repr__(self):
+        status = 'ok' if self.error is None else f"error={self.error!r}"
+        return f"BatchItem({self.index}, [{self.rule.subject}] [{self.rule.verb}] [{self.rule.property}], {status})"
+
+
+def rule_key(rule):
+    return (rule.subject, rule.verb, rule.property)
+
+
+def distinct_rules(rules):
+    """{rule triple: [indices]}, in first-seen order."""
+    distinct = {}
+    for i, rule in enumerate(rules):
+        distinct.setdefault(rule_key(rule), []).append(i)
+    return distinct
+
+
+async def orchestrate_batch(bridge, rules, ctx, meta=None, max_concurrency=None):
+    """Async iterator of BatchItems for rules, in completion order.
+
+    max_concurrency caps the rules computed at once (default: all). A rule
+    that raises (including failing the bridge's validation) yields an item
+    with error set; the batch continues.
+    """
+    rules = list(rules)
+    limit = asyncio.Semaphore(max_concurrency) if max_concurrency else contextlib.nullcontext()
+
+    async def compute(rule, indices):
+        try:
+            async with limit:
+                return indices, await bridge.orchestrate_mathematics(rule, dict(ctx), dict(meta or {})), None
+        except Exception as e:
+            return indices, None, e
+
+    tasks = [asyncio.ensure_future(compute(rules[indices[0]], indices))
+             for indices in distinct_rules(rules).values()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            indices, result, error = await next_done
+            for i in indices:
+                yield BatchItem(i, rules[i], result, error)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def install(bridge, max_concurrency=None):
+    """Add bridge.orchestrate_batch(rules, ctx, meta=None). Returns the bridge."""
+
+    def batch(rules, ctx, meta=None):
+        return orchestrate_batch(bridge, rules, ctx, meta, max_concurrency)
+
+    bridge.orchestrate_batch = batch
+    return bridge
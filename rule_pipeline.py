@@ -0,0 +1,103 @@
+"""
+Declarative pipelines of Baba is Quantum rules.
+
+A pipeline is written in the same bracket notation the agents use, with
+-> for "feeds into" and {a, b} for stages that share one input:
+
+    [COMPOUNDS] [FILTER] [I=0] -> {[HOST-QUALITY] [COUPLE] [CROSS-SCALE],
+                                   [HOST-QUALITY] [ENTANGLE] [CARE-SYNERGY]}
+
+Each stage starts as soon as the stages it depends on have finished, so
+independent stages (COUPLE and ENTANGLE above) run concurrently. A stage
+receives the 'compounds' of its nearest upstream stage that produced any,
+passed by reference rather than copied, falling back to ctx['compounds'].
+Stages run through bridge.orchestrate_mathematics, so a bridge with
+orchestration_cache installed reuses cached FILTER results across pipelines.
+"""
+import asyncio
+import re
+
+_TRIPLE = re.compile(r'\[([^\]]+)\]\s*\[([^\]]+)\]\s*\[([^\]]+)\]')
+
+
+class Stage:
+    __slots__ = ('name', 'rule', 'after')
+
+    def __init__(self, name, rule, after=()):
+        self.name = name
+        self.rule = rule
+        self.after = tuple(after)
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, after={list(self.after)})"
+
+
+def rule_text(rule):
+    return f"[{rule.subject}] [{rule.verb}] [{rule.property}]"
+
+
+class RulePipeline:
+    """A DAG of rule stages, kept in topological order."""
+
+    def __init__(self, stages):
+        names = set()
+        for stage in stages:
+            missing = [d for d in stage.after if d not in names]
+            if missing:
+                raise ValueError(f"stage {stage.name!r} depends on unknown or later stage(s) {missing}")
+            if stage.name in names:
+                raise ValueError(f"duplicate stage name {stage.name!r}")
+            names.add(stage.name)
+        self.stages = list(stages)
+
+    @classmethod
+    def parse(cls, text, rule_factory):
+        """Build a pipeline from '->' / '{a, b}' notation.
+
+        rule_factory(subject, verb, property) returns a BabaIsQuantumRule.
+        Stages repeated in one pipeline are named '<rule> #2', '<rule> #3', ...
+        """
+        stages, previous, seen = [], [], {}
+        for step in text.split('->'):
+            step = step.strip()
+            if step.startswith('{') and step.endswith('}'):
+                step = step[1:-1]
+            triples = _TRIPLE.findall(step)
+            if not triples:
+                raise ValueError(f"no [SUBJECT] [VERB] [PROPERTY] rule in {step!r}")
+            current = []
+            for subject, verb, prop in triples:
+                rule = rule_factory(subject.strip(), verb.strip(), prop.strip())
+                name = rule_text(rule)
+                seen[name] = seen.get(name, 0) + 1
+                if seen[name] > 1:
+                    name = f"{name} #{seen[name]}"
+                stages.append(Stage(name, rule, after=previous))
+                current.append(name)
+            previous = current
+        return cls(stages)
+
+    async def run(self, bridge, ctx, meta=None):
+        """Run every stage on bridge. Returns {stage name: result} in stage order."""
+        tasks = {}
+
+        async def run_stage(stage):
+            # Each task yields (result, compounds passed downstream)
+            parents = [await tasks[d] for d in stage.after]
+            compounds = next((c for _, c in parents if c is not None), ctx.get('compounds'))
+            stage_ctx = dict(ctx)
+            if compounds is not None:
+                stage_ctx['compounds'] = compounds
+            result = await bridge.orchestrate_mathematics(stage.rule, stage_ctx, dict(meta or {}))
+            produced = result.mathematical_state.get('compounds')
+            return result, produced if produced is not None else compounds
+
+        for stage in self.stages:
+            tasks[stage.name] = asyncio.ensure_future(run_stage(stage))
+        try:
+            outputs = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return {name: result for name, (result, _) in zip(tasks, outputs)}
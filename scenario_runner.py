@@ -0,0 +1,149 @@
+"""
+Multi-day scenarios: replay days first..last, one agent-day at a time.
+
+Every day runs each agent's examples and writes that day's checkpoints.
+Day N's checkpoint carries day N-1's forward (checkpoint_log.carry_forward).
+Progress is recorded in <state_dir>/progress.json after each agent-day is
+written, so a crashed campaign resumes at the first agent-day it had not
+finished instead of starting again from day one.
+
+An agent-day is recomputed only when its inputs have changed. The inputs
+are the agent's rule set, the compound set, the engine version and the
+memory the day starts from, and the caller folds them into one
+fingerprint string. The examples of an
+agent's latest computed day are kept in <state_dir>; when the next day's
+fingerprint matches, those examples are reused as they are.
+
+    runner = ScenarioRunner(BASE / 'data' / 'scenario', compute, write, fingerprint)
+    await runner.run(['B1', 'B2', 'B3'], first=1, last=7)
+
+    compute(agent_id, day)                      -> examples   (coroutine)
+    write(agent_id, day, examples, previous)    -> checkpoint dict (previous may be None)
+    fingerprint(agent_id, day)                  -> str
+"""
+import json
+import os
+import pickle
+from pathlib import Path
+
+
+def _write_atomic(path, data):
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class ScenarioRunner:
+    """Resumable day-by-day runner with per-agent input fingerprints."""
+
+    def __init__(self, state_dir, compute, write, fingerprint, load_checkpoint=None, out=None):
+        self.dir = Path(state_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.compute = compute
+        self.write = write
+        self.fingerprint = fingerprint
+        self.load_checkpoint = load_checkpoint
+        self.out = out
+        self.progress_path = self.dir / 'progress.json'
+        self.progress = self._load_progress()
+        self.computed = 0
+        self.reused = 0
+        self.skipped = 0
+
+    # ---- state -------------------------------------------------------------
+
+    def _load_progress(self):
+        if self.progress_path.exists():
+            return json.loads(self.progress_path.read_text())
+        return {'done': {}}
+
+    def _save_progress(self):
+        _write_atomic(self.progress_path, json.dumps(self.progress, indent=2).encode())
+
+    def reset(self):
+        """Forget all progress and kept examples (the next run starts over)."""
+        self.progress = {'done': {}}
+        self.progress_path.unlink(missing_ok=True)
+        for p in self.dir.glob('agent_*.examples.pkl'):
+            p.unlink()
+
+    def is_done(self, agent_id, day):
+        return agent_id in self.progress['done'].get(str(day), {})
+
+    def last_completed_day(self, agents):
+        days = [int(d) for d, done in self.progress['done'].items() if all(a in done for a in agents)]
+        return max(days, default=None)
+
+    def _examples_path(self, agent_id):
+        return self.dir / f"agent_{agent_id}.examples.pkl"
+
+    def examples(self, agent_id):
+        """Examples of the agent's latest computed day, or None."""
+        return self._kept(agent_id)[1]
+
+    def _kept(self, agent_id):
+        """(fingerprint, examples) of the agent's latest computed day, or (None, None)."""
+        path = self._examples_path(agent_id)
+        if not path.exists():
+            return None, None
+        try:
+            kept = pickle.loads(path.read_bytes())
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None, None
+        return kept['fingerprint'], kept['examples']
+
+    def _keep(self, agent_id, day, fingerprint, examples):
+        _write_atomic(self._examples_path(agent_id), pickle.dumps(
+            {'day': day, 'fingerprint': fingerprint, 'examples': examples}, protocol=pickle.HIGHEST_PROTOCOL))
+
+    # ---- running -----------------------------------------------------------
+
+    def _log(self, text):
+        if self.out is not None:
+            print(text, file=self.out)
+
+    async def run_day(self, agent_id, day):
+        """Run (or reuse) one agent-day and write its checkpoint. Returns the checkpoint."""
+        fingerprint = self.fingerprint(agent_id, day)
+        kept_fingerprint, examples = self._kept(agent_id)
+        if examples is not None and kept_fingerprint == fingerprint:
+            self.reused += 1
+            self._log(f"  day {day} {agent_id}: inputs unchanged, reusing results")
+        else:
+            examples = await self.compute(agent_id, day)
+            self._keep(agent_id, day, fingerprint, examples)
+            self.computed += 1
+            self._log(f"  day {day} {agent_id}: computed {len(examples)} examples")
+
+        previous = self.load_checkpoint(agent_id, day - 1) if self.load_checkpoint else None
+        checkpoint = self.write(agent_id, day, examples, previous)
+        self.progress['done'].setdefault(str(day), {})[agent_id] = fingerprint
+        self._save_progress()
+        return checkpoint
+
+    async def run(self, agents, first, last):
+        """Days first..last for every agent, skipping agent-days already written.
+
+        Returns {agent_id: last day's checkpoint} for the agent-days run now.
+        """
+        checkpoints = {}
+        for day in range(first, last + 1):
+            for agent_id in agents:
+                if self.is_done(agent_id, day):
+                    self.skipped += 1
+                    continue
+                checkpoints[agent_id] = await self.run_day(agent_id, day)
+        return checkpoints
+
+    async def latest_examples(self, agent_id, day):
+        """Examples of the agent's latest computed day, computing day if none are kept."""
+        examples = self.examples(agent_id)
+        if examples is None:
+            self._log(f"  day {day} {agent_id}: no kept results, recomputing")
+            examples = await self.compute(agent_id, day)
+            self._keep(agent_id, day, self.fingerprint(agent_id, day), examples)
+            self.computed += 1
+        return examples
+
+    def stats(self):
+        return {'computed': self.computed, 'reused': self.reused, 'resumed_past': self.skipped}
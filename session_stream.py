@@ -0,0 +1,109 @@
+"""
+Append-only JSONL session files.
+
+Each line is one JSON record. The first is a header, and every message
+after it is written as it is produced:
+
+    {"kind": "header", "session_id": ..., "agent_id": ..., "session_start": ...}
+    {"kind": "message", "role": "user", "content": ...}
+    {"kind": "message", "role": "assistant", "content": ...}
+
+Lines are flushed as they are written and fsync'd at example boundaries
+(sync()). A crash loses at most the example in progress, and the reader
+skips a torn final line. read_session() rebuilds the session_data dict
+that ConversationalLLMAPI.save_conversation() writes and
+dashboard_monitor.py reads.
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+# Matches the harness's original accounting: 500 tokens per message
+TOKENS_PER_MESSAGE = 500
+
+
+class SessionWriter:
+    """Stream one session's messages to <session_dir>/<session_id>.jsonl."""
+
+    def __init__(self, session_dir, session_id, agent_id):
+        self.path = Path(session_dir) / f"{session_id}.jsonl"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = open(self.path, 'a', encoding='utf-8')
+        self.count = 0
+        self._write({
+            'kind': 'header',
+            'session_id': session_id,
+            'agent_id': agent_id,
+            'session_start': datetime.now().isoformat(),
+        })
+        self.sync()
+
+    def _write(self, record):
+        self._f.write(json.dumps(record, default=str) + '\n')
+        self._f.flush()
+
+    def append(self, role, content):
+        self._write({'kind': 'message', 'role': role, 'content': content})
+        self.count += 1
+
+    def sync(self):
+        """Make everything written so far durable (call at example boundaries)."""
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self, export_json=True):
+        """Sync and close. export_json also writes the legacy <session_id>.json."""
+        if self._f.closed:
+            return None
+        self.sync()
+        self._f.close()
+        if export_json:
+            return export_session_json(self.path)
+        return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close(export_json=exc[0] is None)
+
+
+def iter_records(path):
+    """Yield complete records from a session .jsonl, ignoring a torn last line."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.endswith('\n'):
+                break
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                break
+
+
+def read_session(path):
+    """Rebuild the save_conversation() session_data dict from a .jsonl file."""
+    session_data = None
+    messages = []
+    for record in iter_records(path):
+        kind = record.pop('kind', None)
+        if kind == 'header':
+            session_data = record
+        elif kind == 'message':
+            messages.append(record)
+    if session_data is None:
+        raise ValueError(f"{path}: no session header")
+    session_data['messages'] = messages
+    session_data['total_tokens'] = len(messages) * TOKENS_PER_MESSAGE
+    return session_data
+
+
+def export_session_json(path):
+    """Write <session_id>.json next to the .jsonl for readers of the old format."""
+    path = Path(path)
+    out = path.with_suffix('.json')
+    tmp = out.with_suffix('.json.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(read_session(path), f, indent=2, default=str)
+    os.replace(tmp, out)
+    return out
@@ -0,0 +1,157 @@
+"""
+SUPERPOSE and FILTER over a CompoundStore, sharded across a process pool.
+
+The columns an operation reads are copied once into shared memory, and
+workers attach to them by name. A task names a column and a row range, so
+no compound list is pickled. For FILTER each worker writes its rows of the
+mask into a shared output buffer. For SUPERPOSE it only returns its
+chunk's top-k row numbers, and the parent merges those; the scores are the
+store's column itself, as in CompoundStore.superpose(). Chunks are merged
+in row order and ties go to the lower row, so results match
+CompoundStore.superpose() / filter_mask() exactly whatever the worker
+count or chunk size.
+
+Starting the pool and copying columns costs more than the NumPy work
+saved until a store has about MIN_ROWS compounds, so callers shard only
+when should_shard() says so:
+
+    if should_shard(len(store), workers):
+        with ShardedStore(store, workers) as sharded:
+            state = sharded.superpose('HOST-QUALITY')     # same dict as store.superpose()
+            passed = sharded.filter_indices()             # same as store.filter_indices()
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from compound_store import I_ZERO_THRESHOLD, PROPERTY_COLUMNS, top_indices
+
+# Rows per task
+CHUNK_SIZE = 262144
+
+# Smallest store worth sharding
+MIN_ROWS = 4 * CHUNK_SIZE
+
+# Worker-side attachments, by shared memory name
+_ATTACHED = {}
+_WORKER = {'own_tracker': False}
+
+
+def _init_worker(own_tracker):
+    _WORKER['own_tracker'] = own_tracker
+
+
+def _attach(spec):
+    """ndarray over the shared block described by spec = (name, dtype, shape)."""
+    name, dtype, shape = spec
+    if name not in _ATTACHED:
+        shm = shared_memory.SharedMemory(name=name)
+        if _WORKER['own_tracker']:
+            # The parent owns the block; stop this worker's tracker unlinking it.
+            # Forked workers share the parent's tracker, which unlink() clears.
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        _ATTACHED[name] = shm
+    return np.ndarray(shape, dtype=dtype, buffer=_ATTACHED[name].buf)
+
+
+def _superpose_chunk(start, stop, column, top):
+    """Top rows of rows [start, stop) of the score column."""
+    return start + top_indices(_attach(column)[start:stop], top)
+
+
+def _filter_chunk(start, stop, column, out, threshold):
+    _attach(out)[start:stop] = _attach(column)[start:stop] > threshold
+    return None
+
+
+def should_shard(n_rows, workers, min_rows=MIN_ROWS):
+    """Whether a store of n_rows is large enough to gain from workers processes."""
+    return workers > 1 and n_rows >= min_rows
+
+
+class ShardedStore:
+    """Process-pool SUPERPOSE/FILTER over a CompoundStore's columns."""
+
+    def __init__(self, store, workers=None, chunk_size=CHUNK_SIZE):
+        self.store = store
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool = None
+        self._blocks = {}  # column name -> (SharedMemory, spec)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for shm, _ in self._blocks.values():
+            shm.close()
+            shm.unlink()
+        self._blocks.clear()
+
+    # ---- shared buffers --------------------------------------------------------
+
+    def _new_block(self, key, dtype, shape):
+        size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        spec = (shm.name, np.dtype(dtype).str, shape)
+        self._blocks[key] = (shm, spec)
+        return np.ndarray(shape, dtype=dtype, buffer=shm.buf), spec
+
+    def _column(self, name):
+        """Shared copy of a store column, made on first use."""
+        if name not in self._blocks:
+            col = np.asarray(self.store[name])
+            arr, _ = self._new_block(name, col.dtype, col.shape)
+            arr[:] = col
+        return self._blocks[name][1]
+
+    def _output(self, key, dtype):
+        """Shared output buffer, reused by later calls (results are copied out)."""
+        if key in self._blocks:
+            shm, spec = self._blocks[key]
+            return np.ndarray(spec[2], dtype=spec[1], buffer=shm.buf), spec
+        return self._new_block(key, dtype, (len(self.store),))
+
+    def _chunks(self):
+        n = len(self.store)
+        return [(start, min(start + self.chunk_size, n)) for start in range(0, n, self.chunk_size)]
+
+    def _map(self, fn, *args):
+        """fn(start, stop, *args) for every chunk, results in chunk order."""
+        if self._pool is None:
+            method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+            self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=multiprocessing.get_context(method),
+                                             initializer=_init_worker, initargs=(method != 'fork',))
+        futures = [self._pool.submit(fn, start, stop, *args) for start, stop in self._chunks()]
+        return [f.result() for f in futures]
+
+    # ---- operations ------------------------------------------------------------
+
+    def superpose(self, prop, top=5):
+        name = PROPERTY_COLUMNS.get(prop, prop)
+        candidates = np.concatenate(self._map(_superpose_chunk, self._column(name), top)
+                                    or [np.empty(0, np.int64)])
+        scores = np.asarray(self.store[name])
+        # Candidates are in row order, so top_indices' tie rule still picks the lower row
+        best = candidates[top_indices(scores[candidates], top)]
+        return {'type': 'superposition', 'property': prop, 'n_compounds': len(self.store),
+                'scores': scores, 'top_indices': best}
+
+    def filter_mask(self, column='i_zero', threshold=I_ZERO_THRESHOLD):
+        spec = self._column(column)
+        mask, out = self._output(':filter', np.bool_)
+        self._map(_filter_chunk, spec, out, threshold)
+        return mask.copy()
+
+    def filter_indices(self, column='i_zero', threshold=I_ZERO_THRESHOLD):
+        return np.flatnonzero(self.filter_mask(column, threshold))
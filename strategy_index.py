@@ -0,0 +1,170 @@
+"""
+Nearest-neighbour recall over strategic memory patterns.
+
+Strategic memory is a list of {'pattern', 'description', 'success_score'}
+dicts, and answering "what worked for rules like this" meant scanning
+every dict. The index keeps one row per pattern in NumPy arrays:
+
+    verb, property, subject   int32 codes of the pattern's rule triple
+    success                   float32 success_score
+
+A query rule is encoded the same way. Similarity is the weighted share of
+triple fields that match (verb 0.5, property 0.3, subject 0.2), and
+results are ranked by similarity x success_score, ties to the earlier
+pattern. Patterns sharing a triple share a similarity, so the index also
+groups rows by triple. A query scores the groups (a few hundred at most,
+however many patterns there are), then reads the best patterns of the
+most promising groups until no remaining group can beat the k-th result.
+Patterns are appended incrementally: arrays grow geometrically and only
+the groups that gained patterns are re-sorted, on their next query.
+
+    index = StrategyIndex()
+    index.sync(checkpoint['strategic']['strategies'])   # only new patterns
+    index.query(('COMPOUNDS', 'FILTER', 'I=0'), k=5)     # [(pattern, similarity, score), ...]
+"""
+import re
+
+import numpy as np
+
+# Share of the similarity each matching triple field contributes
+FIELD_WEIGHTS = {'verb': 0.5, 'property': 0.3, 'subject': 0.2}
+
+_TRIPLE = re.compile(r'\[([^\]]+)\]\s*\[([^\]]+)\]\s*\[([^\]]+)\]')
+
+
+def pattern_triple(pattern):
+    """(subject, verb, property) a strategy was learned from, or Nones.
+
+    Taken from its 'rule' or the bracketed rule in its description, else
+    the verb from a '<VERB>_discovery' pattern name.
+    """
+    for text in (pattern.get('rule'), pattern.get('description')):
+        m = _TRIPLE.search(text or '')
+        if m:
+            return tuple(part.strip() for part in m.groups())
+    name = pattern.get('pattern') or ''
+    if name.endswith('_discovery'):
+        return None, name[:-len('_discovery')], None
+    return None, None, None
+
+
+def _triple(rule):
+    if isinstance(rule, (tuple, list)):
+        return tuple(rule)
+    return rule.subject, rule.verb, rule.property
+
+
+class StrategyIndex:
+    """Append-only index of strategic patterns keyed by rule-triple features."""
+
+    def __init__(self):
+        self.patterns = []
+        self._vocab = {field: {} for field in FIELD_WEIGHTS}
+        self._success = np.empty(0, dtype=np.float64)
+        self._group = np.empty(0, dtype=np.int32)   # group of each pattern
+        self._group_of = {}                         # (subject, verb, property) codes -> group
+        self._group_codes = {field: [] for field in FIELD_WEIGHTS}
+        self._members = []                          # pattern rows of each group
+        self._ranked = []                           # members by success, best first (None = stale)
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def _code(self, field, value, grow):
+        """Code of a field value. Missing values are -1 and match nothing."""
+        if value is None:
+            return -1
+        vocab = self._vocab[field]
+        code = vocab.get(value)
+        if code is None:
+            if not grow:
+                return -2  # unseen in any pattern, so it cannot match
+            code = vocab[value] = len(vocab)
+        return code
+
+    def _reserve(self, n):
+        if n <= len(self._success):
+            return
+        size = max(64, 2 * len(self._success), n)
+        used = len(self.patterns)
+        success, group = np.zeros(size), np.zeros(size, dtype=np.int32)
+        success[:used], group[:used] = self._success[:used], self._group[:used]
+        self._success, self._group = success, group
+
+    def add(self, pattern):
+        self.extend([pattern])
+
+    def extend(self, patterns):
+        """Append patterns (strategy dicts) to the index."""
+        patterns = list(patterns)
+        start = len(self.patterns)
+        self._reserve(start + len(patterns))
+        for i, p in enumerate(patterns, start):
+            subject, verb, prop = pattern_triple(p)
+            codes = (self._code('subject', subject, True), self._code('verb', verb, True),
+                     self._code('property', prop, True))
+            g = self._group_of.get(codes)
+            if g is None:
+                g = self._group_of[codes] = len(self._members)
+                for field, code in zip(('subject', 'verb', 'property'), codes):
+                    self._group_codes[field].append(code)
+                self._members.append([])
+                self._ranked.append(None)
+            self._members[g].append(i)
+            self._ranked[g] = None
+            self._group[i] = g
+            self._success[i] = p.get('success_score', 0.0) or 0.0
+        self.patterns.extend(patterns)
+
+    def sync(self, strategies):
+        """Index strategies appended since the last sync. Returns how many.
+
+        Strategy lists normally only grow. One that no longer starts with
+        the indexed patterns was rewritten (e.g. compacted by a
+        MemoryBudget), so the index is rebuilt from it.
+        """
+        n = len(self.patterns)
+        if len(strategies) < n or (n and strategies[n - 1] != self.patterns[n - 1]):
+            self.__init__()
+        added = len(strategies) - len(self.patterns)
+        if added > 0:
+            self.extend(strategies[len(self.patterns):])
+        return added
+
+    def _group_similarity(self, rule):
+        sim = np.zeros(len(self._members))
+        for field, value in zip(('subject', 'verb', 'property'), _triple(rule)):
+            code = self._code(field, value, grow=False)
+            if code >= 0:
+                sim += FIELD_WEIGHTS[field] * (np.asarray(self._group_codes[field]) == code)
+        return sim
+
+    def _ranking(self, g):
+        if self._ranked[g] is None:
+            rows = np.asarray(self._members[g])
+            self._ranked[g] = rows[np.lexsort((rows, -self._success[rows]))]
+        return self._ranked[g]
+
+    def similarity(self, rule):
+        """Similarity of every indexed pattern to rule."""
+        return self._group_similarity(rule)[self._group[:len(self.patterns)]]
+
+    def query(self, rule, k=5, min_similarity=0.0):
+        """Top k [(pattern, similarity, score)] for a rule or (subject, verb, property).
+
+        k <= 0 returns [].
+        """
+        if k <= 0:
+            return []
+        gsim = self._group_similarity(rule)
+        groups = np.flatnonzero(gsim > min_similarity)
+        best = np.array([self._success[self._ranking(g)[0]] for g in groups])
+        bound = gsim[groups] * best
+        found = []  # (-score, row, similarity)
+        for g, b in zip(groups[np.argsort(-bound, kind='stable')], np.sort(bound)[::-1]):
+            if len(found) >= k and b < -found[k - 1][0]:
+                break  # no pattern in this or any later group can make the top k
+            for row in self._ranking(g)[:k]:
+                found.append((-gsim[g] * self._success[row], int(row), gsim[g]))
+            found.sort()
+        return [(self.patterns[row], float(sim), -neg) for neg, row, sim in found[:k]]
@@ -7,13 +7,29 @@ Zero tokens.
 FIXED: Each agent now uses its own property (HOST-QUALITY/OPTICAL/COHERENCE)
 instead of hardcoding HOST-QUALITY for all agents.
 Matches scenarios/quantum_rps.py AGENT_PROPERTIES mapping.
+
+Usage:
+    python test_dashboard_capture_FIXED.py               # agents one after another
+    python test_dashboard_capture_FIXED.py --workers 3   # agents concurrently
+    python test_dashboard_capture_FIXED.py --trace       # also write data/traces/
+    python test_dashboard_capture_FIXED.py --no-result-cache   # recompute every rule
+    python test_dashboard_capture_FIXED.py --days 7      # replay days 1..7, resuming after a crash
 """
+import argparse
 import asyncio
+import hashlib
+import inspect
+import io
 import json
+import resource
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, '/mnt/cognisyn/COGNISYN_DGX')
 
 from framework.orchestration_engine import OrchestrationBridge, BabaIsQuantumRule
@@ -22,7 +38,33 @@ from memory.dynamic_memory_architecture import DynamicMemoryArchitecture
 from validation.rule_validation import OrchestrationValidator
 from materials_project_adapter_CORRECT import MaterialsProjectAdapter
 
+from care_index import CareIndex
+from care_scoring import AGENTS, care_equilibria, matrix_from_superpose
+from care_sweep import care_sweep
+from checkpoint_file import SUFFIX as CKPT_SUFFIX
+from checkpoint_file import read_checkpoint, write_checkpoint
+from checkpoint_log import CheckpointLog, carry_forward
+from compact_state import compact
+from compound_store import FLOAT_COLUMNS, CompoundStore
+from dashboard_data import build_summary, write_summary
+from memory_budget import MemoryBudget
+from orchestration_cache import SHARED_CACHE, adapter_data_version, episode_recorder, install
+from pareto import pareto_summary
+from rule_batch import install as install_batch
+from rule_pipeline import RulePipeline
+from result_cache import DiskResultCache, engine_version
+from scenario_runner import ScenarioRunner
+from session_stream import SessionWriter
+from sharded_store import ShardedStore, should_shard
+from strategy_index import StrategyIndex
+from tracing import CATEGORIES, TRACER
+
 BASE = Path('/mnt/cognisyn/COGNISYN_DGX')
+STORE_DIR = BASE / 'data' / 'compound_store'
+CARE_INDEX_PATH = BASE / 'data' / 'care_index.npz'
+TRACE_DIR = BASE / 'data' / 'traces'
+RESULT_CACHE_DIR = BASE / 'data' / 'result_cache'
+SCENARIO_DIR = BASE / 'data' / 'scenario'
 TODAY = datetime.now().strftime("%m%d")
 
 # Each agent evaluates from its own property perspective (matches scenarios/quantum_rps.py)
@@ -40,228 +82,620 @@ COUPLE_TARGETS = {
 }
 
 
-def setup_bridge(agent_id):
-    H = UnifiedStrategicMathematics()
+def make_rule(subject, verb, prop):
+    return BabaIsQuantumRule(subject=subject, verb=verb, property=prop, category="strategy")
+
+
+def rss_mb():
+    """Current resident set size in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# H_total engine and compound cache are read-only during a run, so one copy
+# per process is shared by every agent's bridge. Memory stays per agent.
+_SHARED = {}
+SHARED_SETUP = {'seconds': 0.0, 'rss_mb': 0.0, 'bridges': 0}
+
+
+def shared_components():
+    if not _SHARED:
+        t0, m0 = time.perf_counter(), rss_mb()
+        _SHARED['H'] = UnifiedStrategicMathematics()
+        _SHARED['adapter'] = MaterialsProjectAdapter(use_cached=True)
+        SHARED_SETUP['seconds'] = time.perf_counter() - t0
+        SHARED_SETUP['rss_mb'] = rss_mb() - m0
+    return _SHARED['H'], _SHARED['adapter']
+
+
+def shared_store():
+    """Columnar mmap view of the adapter's compounds, rebuilt when the data changes."""
+    if 'store' not in _SHARED:
+        _, adapter = shared_components()
+        _SHARED['store'] = CompoundStore.load_or_build(STORE_DIR, adapter)
+    return _SHARED['store']
+
+
+def shared_setup_savings(setups=None):
+    """Measured shared-component builds, and the startup time and RSS they saved.
+
+    setups are the SHARED_SETUP dicts of every process that ran agents
+    (default: this one's). Each process builds the engine and adapter once
+    and that build is measured. The savings are estimates: every bridge
+    after a process's first is assumed to have cost one more build of the
+    same size.
+    """
+    setups = setups or [SHARED_SETUP]
+    return {
+        'builds': sum(1 for st in setups if st['seconds']),
+        'bridges': sum(st['bridges'] for st in setups),
+        'setup_seconds': round(sum(st['seconds'] for st in setups), 3),
+        'setup_rss_mb': round(sum(st['rss_mb'] for st in setups), 1),
+        'est_saved_seconds': round(sum(max(st['bridges'] - 1, 0) * st['seconds'] for st in setups), 3),
+        'est_saved_rss_mb': round(sum(max(st['bridges'] - 1, 0) * st['rss_mb'] for st in setups), 1),
+    }
+
+
+def use_result_cache():
+    """Back SHARED_CACHE with the on-disk result cache (once per process)."""
+    if SHARED_CACHE.disk is None:
+        version = engine_version(OrchestrationBridge, UnifiedStrategicMathematics, OrchestrationValidator)
+        SHARED_CACHE.disk = DiskResultCache(RESULT_CACHE_DIR, version)
+    return SHARED_CACHE.disk
+
+
+def restore_memory(memory, checkpoint):
+    """Load a save_checkpoint() dict back into memory.
+
+    Uses DynamicMemoryArchitecture.load_checkpoint(checkpoint), the
+    counterpart of save_checkpoint(). Raises RuntimeError if memory has no
+    such method: a day that starts from empty memory would not be the day
+    its checkpoint files describe.
+    """
+    load = getattr(memory, 'load_checkpoint', None)
+    if not callable(load):
+        raise RuntimeError(f"{type(memory).__name__} has no load_checkpoint(checkpoint); "
+                           "cannot start a day from the previous day's memory")
+    load(checkpoint)
+
+
+def setup_bridge(agent_id, cache=True, checkpoint=None):
+    """Bridge for one agent. checkpoint, if given, is restored into its memory."""
+    H, adapter = shared_components()
     m = DynamicMemoryArchitecture(agent_id=agent_id)
+    if checkpoint is not None:
+        restore_memory(m, checkpoint)
     v = OrchestrationValidator()
     b = OrchestrationBridge(H, m, v)
-    b.materials_adapter = MaterialsProjectAdapter(use_cached=True)
+    b.materials_adapter = adapter
+    SHARED_SETUP['bridges'] += 1
+    # FILTER/SUPERPOSE/INTERFERE results are shared across examples and agents;
+    # a hit still records its episode in this agent's memory
+    if cache:
+        install(b, record=episode_recorder(m))
+    # Agent turns that propose several rules use b.orchestrate_batch(rules, ctx)
+    install_batch(b)
+    if TRACER.enabled:
+        for component, category in ((v, 'validation'), (H, 'h_total'), (adapter, 'adapter'), (m, 'memory')):
+            TRACER.instrument(component, category)
+        n = len(_SHARED['store']) if 'store' in _SHARED else None
+        TRACER.trace_bridge(b, agent_id, n)
     return b
 
 
-async def run_examples(agent_id):
-    """Exact orchestration calls from proven tests."""
-    b = setup_bridge(agent_id)
-    ctx = {'day': 6, 'agent_id': agent_id}
+async def run_examples(agent_id, out=sys.stdout, on_example=None, compounds=None, bridge=None, day=6):
+    """Exact orchestration calls from proven tests.
+
+    on_example, if given, is called with each example as soon as it completes.
+    compounds replaces the adapter's cached set (benchmarks pass synthetic
+    sets here) and bridge replaces the one setup_bridge() would build.
+    """
+    b = bridge or setup_bridge(agent_id)
+    ctx = {'day': day, 'agent_id': agent_id}
+    if compounds is not None:
+        ctx['compounds'] = compounds
     prop = AGENT_PROPERTIES[agent_id]
     cross = COUPLE_TARGETS[agent_id]
     results = []
 
+    def done(ex):
+        # Examples are kept for the whole run, so their states are stored compactly
+        state = ex['state']
+        ex['state'] = compact(state)
+        ex['stages'] = [ex['state'] if st is state else compact(st) for st in ex['stages']]
+        results.append(ex)
+        if on_example:
+            on_example(ex)
+
     # EXAMPLE 1: SUPERPOSE — from Examples 1-3 test
-    print(f"  Ex1 SUPERPOSE...", end=" ")
+    print(f"  Ex1 SUPERPOSE...", end=" ", file=out)
     rule = BabaIsQuantumRule(subject="COMPOUNDS", verb="SUPERPOSE", property=prop, category="strategy")
-    r = await b.orchestrate_mathematics(rule, dict(ctx), {'day': 6})
+    r = await b.orchestrate_mathematics(rule, dict(ctx), {'day': day})
     s = r.mathematical_state
-    print(f"type={s.get('type')}")
-    results.append({
+    print(f"type={s.get('type')}", file=out)
+    done({
         'num': 1, 'title': 'Cooperative Parallel Evaluation',
         'ops': [{'subject': 'COMPOUNDS', 'verb': 'SUPERPOSE', 'property': prop}],
-        'state': s, 'desc': r.mathematical_state_description
+        'state': s, 'stages': [s], 'desc': r.mathematical_state_description
     })
 
     # EXAMPLE 2: COUPLE — from Examples 1-3 test
-    print(f"  Ex2 COUPLE...", end=" ")
+    print(f"  Ex2 COUPLE...", end=" ", file=out)
     rule = BabaIsQuantumRule(subject=prop, verb="COUPLE", property=cross, category="strategy")
-    r = await b.orchestrate_mathematics(rule, dict(ctx), {'day': 6})
+    r = await b.orchestrate_mathematics(rule, dict(ctx), {'day': day})
     s = r.mathematical_state
-    print(f"type={s.get('type')}, coupling_strength={s.get('coupling_strength', 'MISSING')}")
-    results.append({
+    print(f"type={s.get('type')}, coupling_strength={s.get('coupling_strength', 'MISSING')}", file=out)
+    done({
         'num': 2, 'title': 'Scale Coupling Analysis',
         'ops': [{'subject': prop, 'verb': 'COUPLE', 'property': cross}],
-        'state': s, 'desc': r.mathematical_state_description
+        'state': s, 'stages': [s], 'desc': r.mathematical_state_description
     })
 
     # EXAMPLE 3: FILTER -> ENTANGLE — from Examples 1-3 test + pipeline test
-    print(f"  Ex3 FILTER->ENTANGLE...", end=" ")
-    rule3a = BabaIsQuantumRule(subject="COMPOUNDS", verb="FILTER", property="I=0", category="strategy")
-    r3a = await b.orchestrate_mathematics(rule3a, dict(ctx), {'day': 6})
+    print(f"  Ex3 FILTER->ENTANGLE...", end=" ", file=out)
+    r3a, r3b = (await RulePipeline.parse(
+        f"[COMPOUNDS] [FILTER] [I=0] -> [{prop}] [ENTANGLE] [CARE-SYNERGY]", make_rule
+    ).run(b, ctx, {'day': day})).values()
     compounds = r3a.mathematical_state.get('compounds', [])
-    print(f"FILTER:{len(compounds)}", end=" -> ")
-
-    ctx3 = dict(ctx)
-    ctx3['compounds'] = compounds
-    rule3b = BabaIsQuantumRule(subject=prop, verb="ENTANGLE", property="CARE-SYNERGY", category="strategy")
-    r3b = await b.orchestrate_mathematics(rule3b, ctx3, {'day': 6})
+    print(f"FILTER:{len(compounds)}", end=" -> ", file=out)
     s3 = r3b.mathematical_state
-    print(f"synergy={s3.get('synergy_count')}, measure={s3.get('entanglement_measure', 0):.4f}")
+    print(f"synergy={s3.get('synergy_count')}, measure={s3.get('entanglement_measure', 0):.4f}", file=out)
 
     filter_desc = r3a.mathematical_state_description or ''
     entangle_desc = r3b.mathematical_state_description or ''
-    results.append({
+    done({
         'num': 3, 'title': 'Nuclear Spin Bath Analysis',
         'ops': [
             {'subject': 'COMPOUNDS', 'verb': 'FILTER', 'property': 'I=0'},
             {'subject': prop, 'verb': 'ENTANGLE', 'property': 'CARE-SYNERGY'}
         ],
-        'state': s3, 'desc': filter_desc + '\n\n' + entangle_desc
+        'state': s3, 'stages': [r3a.mathematical_state, s3],
+        'desc': filter_desc + '\n\n' + entangle_desc
     })
 
     # EXAMPLE 4: INTERFERE — from Example 4 INTERFERE test
-    print(f"  Ex4 INTERFERE...", end=" ")
+    print(f"  Ex4 INTERFERE...", end=" ", file=out)
     rule = BabaIsQuantumRule(subject="COMPOUNDS", verb="INTERFERE", property="CARE-GUIDED", category="strategy")
-    r = await b.orchestrate_mathematics(rule, dict(ctx), {'day': 6})
+    r = await b.orchestrate_mathematics(rule, dict(ctx), {'day': day})
     s = r.mathematical_state
     pruned = s.get('pruned_compounds', [])
-    print(f"type={s.get('type')}, {s.get('n_original','?')}->{len(pruned)} compounds, care_eq={s.get('care_equilibria_preserved','?')}")
-    results.append({
+    print(f"type={s.get('type')}, {s.get('n_original','?')}->{len(pruned)} compounds, care_eq={s.get('care_equilibria_preserved','?')}", file=out)
+    done({
         'num': 4, 'title': 'Interference Pruning',
         'ops': [{'subject': 'COMPOUNDS', 'verb': 'INTERFERE', 'property': 'CARE-GUIDED'}],
-        'state': s, 'desc': r.mathematical_state_description
+        'state': s, 'stages': [s], 'desc': r.mathematical_state_description
     })
 
     # EXAMPLE 5: FILTER -> COUPLE -> ENTANGLE — from Example 5 pipeline test
-    print(f"  Ex5 FILTER->COUPLE->ENTANGLE...", end=" ")
-    r5a = await b.orchestrate_mathematics(
-        BabaIsQuantumRule(subject="COMPOUNDS", verb="FILTER", property="I=0", category="strategy"),
-        dict(ctx), {'day': 6})
-    compounds5 = r5a.mathematical_state.get('compounds', [])
-
-    ctx5 = dict(ctx)
-    ctx5['compounds'] = compounds5
-    r5b = await b.orchestrate_mathematics(
-        BabaIsQuantumRule(subject=prop, verb="COUPLE", property="CROSS-SCALE", category="strategy"),
-        ctx5, {'day': 6})
-
-    ctx5c = dict(ctx)
-    ctx5c['compounds'] = compounds5
-    r5c = await b.orchestrate_mathematics(
-        BabaIsQuantumRule(subject=prop, verb="ENTANGLE", property="CARE-SYNERGY", category="strategy"),
-        ctx5c, {'day': 6})
+    print(f"  Ex5 FILTER->COUPLE->ENTANGLE...", end=" ", file=out)
+    # COUPLE and ENTANGLE both take the FILTER output, so they run concurrently
+    r5a, r5b, r5c = (await RulePipeline.parse(
+        f"[COMPOUNDS] [FILTER] [I=0] -> {{[{prop}] [COUPLE] [CROSS-SCALE], [{prop}] [ENTANGLE] [CARE-SYNERGY]}}",
+        make_rule
+    ).run(b, ctx, {'day': day})).values()
     s5 = r5c.mathematical_state
-    print(f"synergy={s5.get('synergy_count')}")
+    print(f"synergy={s5.get('synergy_count')}", file=out)
 
     descs = [d for d in [r5a.mathematical_state_description, r5b.mathematical_state_description, r5c.mathematical_state_description] if d]
-    results.append({
+    done({
         'num': 5, 'title': 'Pipeline Execution',
         'ops': [
             {'subject': 'COMPOUNDS', 'verb': 'FILTER', 'property': 'I=0'},
             {'subject': prop, 'verb': 'COUPLE', 'property': 'CROSS-SCALE'},
             {'subject': prop, 'verb': 'ENTANGLE', 'property': 'CARE-SYNERGY'}
         ],
-        'state': s5, 'desc': '\n\n'.join(descs)
+        'state': s5, 'stages': [r5a.mathematical_state, r5b.mathematical_state, s5],
+        'desc': '\n\n'.join(descs)
     })
 
+    print(f"  Result cache: {SHARED_CACHE.stats()}", file=out)
+    if SHARED_CACHE.disk is not None:
+        print(f"  Disk result cache: {SHARED_CACHE.disk.stats()}", file=out)
     return results
 
 
-def write_session_file(agent_id, examples):
-    """Same structure as ConversationalLLMAPI.save_conversation()"""
+def example_messages(ex):
+    """The (role, content) messages one example contributes to the session."""
+    yield 'user', f"## Example {ex['num']}: {ex['title']}\n\n[Operational sequence]"
+    yield 'assistant', json.dumps({
+        'response': f"We observe that H_total returned {ex['state'].get('type', 'results')} "
+                   f"for {len(ex['ops'])} operation(s) on Yb-171 compounds.",
+        'operations': ex['ops']
+    })
+    if ex['desc']:
+        yield 'system', f"[MATHEMATICAL STATE]\n{ex['desc']}"
+
+
+def open_session(agent_id, day=None):
+    """Start a streaming session file (same records as ConversationalLLMAPI.save_conversation())
+
+    day, for scenario runs, keeps each day's session in its own file.
+    """
     session_dir = BASE / 'Dailies' / TODAY / 'sessions' / agent_id
-    session_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    session_id = f"{agent_id}_day{day}_{stamp}" if day is not None else f"{agent_id}_{stamp}"
+    return SessionWriter(session_dir, session_id, agent_id)
 
-    session_id = f"{agent_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    messages = []
 
-    for ex in examples:
-        messages.append({
-            'role': 'user',
-            'content': f"## Example {ex['num']}: {ex['title']}\n\n[Operational sequence]"
-        })
-        messages.append({
-            'role': 'assistant',
-            'content': json.dumps({
-                'response': f"We observe that H_total returned {ex['state'].get('type', 'results')} "
-                           f"for {len(ex['ops'])} operation(s) on Yb-171 compounds.",
-                'operations': ex['ops']
-            })
-        })
-        if ex['desc']:
-            messages.append({
-                'role': 'system',
-                'content': f"[MATHEMATICAL STATE]\n{ex['desc']}"
-            })
-
-    session_data = {
-        'session_id': session_id,
-        'agent_id': agent_id,
-        'session_start': datetime.now().isoformat(),
-        'messages': messages,
-        'total_tokens': len(messages) * 500
-    }
+def append_session_example(session, ex):
+    for role, content in example_messages(ex):
+        session.append(role, content)
+    session.sync()
 
-    path = session_dir / f"{session_id}.json"
-    with open(path, 'w') as f:
-        json.dump(session_data, f, indent=2, default=str)
+
+def close_session(session):
+    path = session.close()
+    print(f"  {session.path}")
     print(f"  {path}")
 
 
-def write_checkpoint_files(agent_id, examples):
-    """Same structure as DynamicMemoryArchitecture.save_checkpoint()"""
+def write_session_file(agent_id, examples, day=None):
+    """Write a whole session at once (used when examples ran in another process)"""
+    session = open_session(agent_id, day)
+    for ex in examples:
+        append_session_example(session, ex)
+    close_session(session)
+
+
+def write_checkpoint_files(agent_id, examples, legacy=False, day=6, previous=None, budget=None):
+    """Same structure as DynamicMemoryArchitecture.save_checkpoint(), stored as deltas.
+
+    Each example appends only the strategies and rules it adds to
+    checkpoints/deltas/. legacy=True also materializes the old per-example
+    day_{day}_agent_{id}_example_{n}.json files. previous, the day before's
+    checkpoint, is carried forward into the end-of-day one, and a
+    MemoryBudget, if given, bounds it. Returns the end-of-day checkpoint.
+    """
     cp_dir = BASE / 'data' / 'checkpoints'
     cp_dir.mkdir(parents=True, exist_ok=True)
-
-    cumulative_strategies = []
-    cumulative_rules = []
+    log = CheckpointLog(cp_dir / 'deltas', day=day, agent_id=agent_id, reset=True)
 
     for ex in examples:
-        for op in ex['ops']:
-            cumulative_strategies.append({
+        log.append(
+            ex['num'],
+            {'example': ex['num'], 'operation': ex['ops'][0]['verb'], 'success': True},
+            strategies=[{
                 'pattern': f"{op['verb']}_discovery",
                 'description': f"[{op['subject']}] [{op['verb']}] [{op['property']}] evaluated Yb-171 compounds",
                 'success_score': 0.85
-            })
-            cumulative_rules.append(f"[{op['subject']}] [{op['verb']}] [{op['property']}]")
-
-        cp = {
-            'episodic': {'episodes': [{'example': ex['num'], 'operation': ex['ops'][0]['verb'], 'success': True}]},
-            'strategic': {'strategies': list(cumulative_strategies), 'pattern_count': len(cumulative_strategies)},
-            'creative_composition': {'rules_invented': list(cumulative_rules), 'novel_rules_created': [], 'creative_breakthroughs': []},
-            'learning_from_struggle': {'mistakes_made': []}
-        }
-        path = cp_dir / f"day_6_agent_{agent_id}_example_{ex['num']}.json"
-        with open(path, 'w') as f:
-            json.dump(cp, f, indent=2, default=str)
-        print(f"  {path}")
-
-    eod = {
-        'episodic': {'episodes': [{'example': i+1, 'success': True} for i in range(5)]},
-        'strategic': {'strategies': cumulative_strategies, 'pattern_count': len(cumulative_strategies)},
-        'creative_composition': {'rules_invented': cumulative_rules, 'novel_rules_created': [], 'creative_breakthroughs': []},
-        'learning_from_struggle': {'mistakes_made': []}
-    }
-    path = cp_dir / f"day_6_agent_{agent_id}.json"
+            } for op in ex['ops']],
+            rules=[f"[{op['subject']}] [{op['verb']}] [{op['property']}]" for op in ex['ops']],
+        )
+        if legacy:
+            path = cp_dir / f"day_{day}_agent_{agent_id}_example_{ex['num']}.json"
+            with open(path, 'w') as f:
+                json.dump(log.materialize(ex['num']), f, indent=2, default=str)
+            print(f"  {path}")
+    print(f"  {log.path}")
+
+    # The budget groups episodes by operation; without one the layout stays save_checkpoint()'s
+    checkpoint = log.end_of_day(operations=budget is not None)
+    if previous is not None:
+        checkpoint = carry_forward(previous, checkpoint, day)
+    if budget is not None:
+        checkpoint = budget.apply(checkpoint, day)
+    path = cp_dir / f"day_{day}_agent_{agent_id}.json"
     with open(path, 'w') as f:
-        json.dump(eod, f, indent=2, default=str)
+        json.dump(checkpoint, f, indent=2, default=str)
     print(f"  {path}")
-
-
-async def main():
+    # Same checkpoint with a counts header and per-layer sections, for partial loads
+    print(f"  {write_checkpoint(path.with_suffix(CKPT_SUFFIX), checkpoint, {'agent_id': agent_id, 'day': day})}")
+    return checkpoint
+
+
+def load_day_checkpoint(agent_id, day):
+    """An agent's end-of-day checkpoint (binary if present), or None."""
+    stem = BASE / 'data' / 'checkpoints' / f"day_{day}_agent_{agent_id}"
+    if stem.with_suffix(CKPT_SUFFIX).exists():
+        return read_checkpoint(stem.with_suffix(CKPT_SUFFIX))
+    if stem.with_suffix('.json').exists():
+        return json.loads(stem.with_suffix('.json').read_text())
+    return None
+
+
+def _run_agent(agent_id, trace=False, result_cache=True):
+    """Process-pool entry point: run one agent's examples in its own process.
+
+    Output is buffered and returned with the results so main() can print
+    it in agent order, exactly as the serial run would. Trace spans
+    recorded in the worker come back too.
+    """
+    TRACER.enabled = trace
+    if result_cache:
+        # main() has already reported the cache path
+        use_result_cache()
+    out = io.StringIO()
+    examples = asyncio.run(run_examples(agent_id, out=out))
+    return examples, out.getvalue(), TRACER.spans, dict(SHARED_SETUP)
+
+
+async def run_agents_concurrently(agent_ids, workers, trace=False, result_cache=True):
+    """Run every agent's examples across a process pool.
+
+    H_total is CPU-bound, so each agent runs in its own process and the
+    futures are awaited together with asyncio.gather. Results come back
+    in agent_ids order regardless of which agent finishes first.
+    """
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=min(workers, len(agent_ids))) as pool:
+        return await asyncio.gather(*[
+            loop.run_in_executor(pool, _run_agent, agent_id, trace, result_cache) for agent_id in agent_ids
+        ])
+
+
+def write_agent_files(agent_id, examples, session=None, legacy_checkpoints=False, budget=None):
+    print(f"\n  Writing session file...")
+    if session is None:
+        write_session_file(agent_id, examples)
+    else:
+        close_session(session)
+
+    print(f"  Writing checkpoint files...")
+    write_checkpoint_files(agent_id, examples, legacy=legacy_checkpoints, budget=budget)
+
+
+def scenario_fingerprint(agent_id, day):
+    """Hash of everything an agent-day's examples depend on.
+
+    That includes the day and the day before's checkpoint, the memory the
+    day starts from, so one day's results are never reused for another.
+    Rules that do not read memory are still reused across days, one by one,
+    through the result cache.
+    """
+    _, adapter = shared_components()
+    previous = json.dumps(load_day_checkpoint(agent_id, day - 1), sort_keys=True, default=str).encode()
+    try:
+        compounds = shared_store().content_hash()
+    except AttributeError:
+        compounds = 'adapter:all'
+    parts = (agent_id, day, hashlib.blake2b(previous, digest_size=16).hexdigest(),
+             AGENT_PROPERTIES[agent_id], COUPLE_TARGETS[agent_id], compounds,
+             adapter_data_version(adapter),
+             engine_version(OrchestrationBridge, UnifiedStrategicMathematics, OrchestrationValidator),
+             inspect.getsource(run_examples))
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+async def run_scenario(agent_ids, last_day, restart=False, budget=None):
+    """Days 1..last_day for every agent, each day carrying the previous checkpoint forward.
+
+    Progress is kept in data/scenario/, so a rerun after a crash picks up
+    at the first agent-day not yet written. A computed day starts from the
+    day before's checkpoint, loaded into the agent's memory (restore_memory).
+    FILTER, SUPERPOSE and INTERFERE results come from the result cache when
+    their inputs are unchanged; COUPLE and ENTANGLE read that memory and are
+    computed every day. Returns the examples of each agent's latest
+    computed day.
+    """
+    streamed = set()  # agent-days whose session was written while computing
+
+    async def compute(agent_id, day):
+        bridge = setup_bridge(agent_id, checkpoint=load_day_checkpoint(agent_id, day - 1))
+        session = open_session(agent_id, day)
+        examples = await run_examples(agent_id, out=io.StringIO(), bridge=bridge, day=day,
+                                      on_example=lambda ex: append_session_example(session, ex))
+        close_session(session)
+        streamed.add((agent_id, day))
+        return examples
+
+    def write(agent_id, day, examples, previous):
+        if (agent_id, day) not in streamed:
+            write_session_file(agent_id, examples, day)
+        # Day 1 goes through carry_forward too, so every episode is tagged with its day
+        return write_checkpoint_files(agent_id, examples, day=day, previous=previous or {}, budget=budget)
+
+    runner = ScenarioRunner(SCENARIO_DIR, compute, write, scenario_fingerprint, load_day_checkpoint, out=sys.stdout)
+    if restart:
+        runner.reset()
+    done = runner.last_completed_day(agent_ids)
+    print(f"\nScenario: days 1-{last_day}" + (f", resuming after day {done}" if done else ""))
+    await runner.run(agent_ids, 1, last_day)
+    # Every day may have been written by an earlier run whose kept examples are gone
+    examples = {agent_id: await runner.latest_examples(agent_id, last_day) for agent_id in agent_ids}
+    print(f"Scenario agent-days: {runner.stats()}")
+    return examples
+
+
+def report_care_equilibria(examples_by_agent):
+    """Care equilibria across agents, from each agent's Example 1 SUPERPOSE scores."""
+    superposed = {a: examples_by_agent[a][0]['state'].get('compounds', []) for a in AGENTS}
+    ids, scores = matrix_from_superpose(superposed)
+    idx = care_equilibria(scores)
+    print(f"\nCare equilibria (all three agents above threshold): {len(idx)} of {len(ids)}")
+    for i in idx[:5]:
+        b1, b2, b3 = scores[i]
+        print(f"  {ids[i]}: B1={b1:.2f}, B2={b2:.2f}, B3={b3:.2f}")
+
+    pareto = pareto_summary(scores)
+    print(f"Pareto frontier: {pareto['frontier']} compounds across {pareto['fronts']} fronts; "
+          f"{pareto['care_on_frontier']} of {pareto['care_equilibria']} Care equilibria on it")
+    for i in pareto['care_off_frontier'][:5]:
+        print(f"  off frontier: {ids[i]} (rank {pareto['ranks'][i]})")
+
+
+def superpose_scores(examples_by_agent):
+    """(ids, (N, 3) scores, (N,) Care scores) from each agent's Example 1 SUPERPOSE state."""
+    superposed = {a: examples_by_agent[a][0]['state'].get('compounds', []) for a in AGENTS}
+    ids, scores = matrix_from_superpose(superposed)
+    care_keys = FLOAT_COLUMNS['care']
+    care = np.array([next((c[k] for k in care_keys if c.get(k) is not None), np.nan)
+                     for c in superposed[AGENTS[0]]], dtype=np.float64)
+    return ids, scores, care
+
+
+def report_care_index(examples_by_agent):
+    """Update the persistent Care index from this run's SUPERPOSE scores."""
+    ids, scores, care = superpose_scores(examples_by_agent)
+    # Compounds without an id cannot be tracked from run to run
+    keep = [i for i, m in enumerate(ids) if m not in (None, '')]
+    index = CareIndex.load(CARE_INDEX_PATH)
+    changes = index.sync_scores([ids[i] for i in keep], scores[keep], care[keep])
+    index.save(CARE_INDEX_PATH)
+    print(f"Care index: {index.count_above()} above threshold, "
+          f"{changes['added']} added, {changes['updated']} updated, {changes['deleted']} removed"
+          + (f", {len(ids) - len(keep)} without an id skipped" if len(keep) < len(ids) else ""))
+    return index
+
+
+def report_care_sweep(examples_by_agent):
+    """Care-equilibrium counts over the default threshold x C_λ grid, from one score matrix."""
+    ids, scores, care = superpose_scores(examples_by_agent)
+    sweep = care_sweep(scores, care)
+    print(f"\nCare sweep over {len(ids)} compounds (rows: threshold, columns: C_λ):")
+    print("  " + " " * 9 + "".join(f"{'off' if lam is None else lam:>8}" for lam in sweep.lambdas))
+    for t, row in zip(sweep.thresholds, sweep.counts):
+        print(f"  {t:>9}" + "".join(f"{n:>8}" for n in row))
+    return sweep
+
+
+def report_strategy_recall(agent_ids, day):
+    """Per agent, the strategic patterns that best match its ENTANGLE rule."""
+    print(f"\nStrategic recall (day {day}):")
+    for agent_id in agent_ids:
+        checkpoint = load_day_checkpoint(agent_id, day)
+        if checkpoint is None:
+            continue
+        index = StrategyIndex()
+        index.sync(checkpoint.get('strategic', {}).get('strategies', []))
+        rule = (AGENT_PROPERTIES[agent_id], 'ENTANGLE', 'CARE-SYNERGY')
+        t0 = time.perf_counter()
+        hits = index.query(rule, k=3)
+        ms = (time.perf_counter() - t0) * 1e3
+        print(f"  {agent_id}: {len(index)} patterns, top {len(hits)} for [{rule[0]}] [ENTANGLE] in {ms:.2f} ms")
+        for pattern, similarity, score in hits:
+            print(f"    {pattern.get('pattern')}: similarity={similarity:.2f}, score={score:.2f}")
+
+
+def write_trace_files():
+    """Trace spans as JSONL and Chrome trace format, plus time per verb."""
+    stem = TRACE_DIR / f"trace_{TODAY}_{datetime.now().strftime('%H%M%S')}"
+    jsonl = TRACER.write_jsonl(stem.with_suffix('.jsonl'))
+    chrome = TRACER.write_chrome(stem.with_suffix('.chrome.json'))
+    print(f"\nTrace: {len(TRACER.spans)} spans -> {jsonl}")
+    print(f"       chrome://tracing -> {chrome}")
+    print(f"  {'verb':<10}" + "".join(f"{c:>13}" for c in CATEGORIES) + "   (ms)")
+    for verb, by_cat in sorted(TRACER.summary().items()):
+        print(f"  {verb:<10}" + "".join(f"{by_cat[c] * 1e3:>13.1f}" for c in CATEGORIES))
+
+
+async def main(workers=1, legacy_checkpoints=False, trace=False, result_cache=True, sweep=False,
+               days=None, restart=False, memory_budget=None):
+    started = time.perf_counter()
     print("=" * 60)
     print("DASHBOARD CAPTURE TEST")
     print("Proven orchestration calls + file writing for dashboard")
     print("Zero tokens — cached compounds only")
     print("=" * 60)
 
-    for agent_id in ['B1', 'B2', 'B3']:
-        print(f"\n--- {agent_id} ({AGENT_PROPERTIES[agent_id]}) ---")
-        examples = await run_examples(agent_id)
-
-        print(f"\n  Writing session file...")
-        write_session_file(agent_id, examples)
-
-        print(f"  Writing checkpoint files...")
-        write_checkpoint_files(agent_id, examples)
+    agent_ids = ['B1', 'B2', 'B3']
+    TRACER.enabled = trace
+    if result_cache:
+        # Rules computed by an earlier run (same compounds, engine and adapter data) are read back
+        print(f"\nResult cache: {use_result_cache().path}")
+
+    try:
+        store = shared_store()
+        if should_shard(len(store), workers):
+            # Large stores shard FILTER's columns across the same number of processes
+            with ShardedStore(store, workers) as sharded:
+                passed = sharded.filter_indices()
+        else:
+            passed = store.filter_indices()
+        print(f"\nCompound store: {len(store)} compounds, {len(passed)} pass I=0 ({STORE_DIR})")
+    except (AttributeError, TypeError, ValueError) as e:
+        print(f"\nCompound store skipped: {e}")
+
+    examples_by_agent = {}
+    day = days or 6
+    # Decayed episodes are compacted into strategic patterns to stay within the budget
+    budget = MemoryBudget(memory_budget) if memory_budget else None
+    setups = [SHARED_SETUP]  # concurrent runs add one per worker process
+    if days:
+        examples_by_agent = await run_scenario(agent_ids, days, restart, budget)
+    elif workers <= 1:
+        for agent_id in agent_ids:
+            print(f"\n--- {agent_id} ({AGENT_PROPERTIES[agent_id]}) ---")
+            # Session messages are streamed to disk as each example finishes
+            session = open_session(agent_id)
+            examples = examples_by_agent[agent_id] = await run_examples(
+                agent_id, on_example=lambda ex: append_session_example(session, ex))
+            write_agent_files(agent_id, examples, session, legacy_checkpoints, budget)
+    else:
+        print(f"\nRunning {len(agent_ids)} agents concurrently ({workers} workers)...")
+        runs = await run_agents_concurrently(agent_ids, workers, trace, result_cache)
+        # Files are written in agent order once every run has finished, so the
+        # session and checkpoint output matches the serial run exactly.
+        for agent_id, (examples, log, spans, setup) in zip(agent_ids, runs):
+            TRACER.spans.extend(spans)
+            setups.append(setup)
+            print(f"\n--- {agent_id} ({AGENT_PROPERTIES[agent_id]}) ---")
+            print(log, end="")
+            write_agent_files(agent_id, examples, legacy_checkpoints=legacy_checkpoints, budget=budget)
+            examples_by_agent[agent_id] = examples
+
+    print(f"\nShared H_total + compound cache (savings estimated): {shared_setup_savings(setups)}")
+
+    report_care_equilibria(examples_by_agent)
+    # Only compounds added or changed since the last run are re-indexed
+    report_care_index(examples_by_agent)
+    if sweep:
+        report_care_sweep(examples_by_agent)
+    report_strategy_recall(agent_ids, day)
+
+    if trace:
+        write_trace_files()
+
+    summary = build_summary(examples_by_agent, BASE / 'data' / 'checkpoints', day)
+    print(f"\nDashboard summary: {write_summary(BASE / 'data', summary)}")
+    # Only FILTER, SUPERPOSE and INTERFERE are reused across runs: COUPLE and
+    # ENTANGLE read agent memory, and the engine is still built every run
+    print(f"Capture wall time: {time.perf_counter() - started:.2f}s (orchestration cache in this process: {SHARED_CACHE.stats()})")
 
     print("\n" + "=" * 60)
     print("DONE — all files written")
     print("=" * 60)
     print(f"\nLaunch dashboard:")
     print(f"  streamlit run dashboard_monitor.py --server.port 8502")
-    print(f"  Date: {TODAY}  |  Day: 6")
+    print(f"  COGNISYN_DATA_DIR={BASE / 'data'} streamlit run app.py")
+    print(f"  Date: {TODAY}  |  Day: {day}")
     print(f"\nCleanup after:")
     print(f"  rm -rf {BASE}/Dailies/{TODAY}")
-    print(f"  rm {BASE}/data/checkpoints/day_6_agent_*_example_*.json")
-    print(f"  rm {BASE}/data/checkpoints/day_6_agent_B?.json")
+    stem = 'day_*' if days else f"day_{day}"
+    if days:
+        print(f"  rm -rf {SCENARIO_DIR}")
+    print(f"  rm {BASE}/data/checkpoints/{stem}_agent_*_example_*.json")
+    print(f"  rm {BASE}/data/checkpoints/{stem}_agent_B?.json {BASE}/data/checkpoints/{stem}_agent_B?.ckpt")
+    print(f"  rm {BASE}/data/checkpoints/deltas/{stem}_agent_*")
     print("=" * 60)
 
-asyncio.run(main())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dashboard capture test")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Processes to run agents in (1 = serial, 3 = one per agent)")
+    parser.add_argument('--legacy-checkpoints', action='store_true',
+                        help="Also write full per-example checkpoint JSON files")
+    parser.add_argument('--no-result-cache', action='store_true',
+                        help="Recompute every rule instead of reusing data/result_cache/ (entries are "
+                             "invalidated by edits to the engine's packages, not to modules they import "
+                             "from elsewhere)")
+    parser.add_argument('--trace', action='store_true',
+                        help="Record per-stage spans to data/traces/ (JSONL + Chrome trace)")
+    parser.add_argument('--sweep', action='store_true',
+                        help="Also count Care equilibria over a grid of thresholds and C_λ strengths")
+    parser.add_argument('--days', type=int,
+                        help="Replay days 1..DAYS, resuming after the last day written (data/scenario/). "
+                             "Each day starts from the previous day's checkpoint, loaded into the agents' "
+                             "memory with DynamicMemoryArchitecture.load_checkpoint()")
+    parser.add_argument('--restart', action='store_true',
+                        help="With --days, discard scenario progress and start again from day 1")
+    parser.add_argument('--memory-budget', type=int, metavar='N',
+                        help="Cap each agent's checkpoint at N memories, compacting decayed episodes")
+    args = parser.parse_args()
+    asyncio.run(main(workers=args.workers, legacy_checkpoints=args.legacy_checkpoints, trace=args.trace,
+                     result_cache=not args.no_result_cache, sweep=args.sweep, days=args.days,
+                     restart=args.restart, memory_budget=args.memory_budget))
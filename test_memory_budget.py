@@ -0,0 +1,59 @@
+"""
+MemoryBudget over a multi-day campaign shaped like the capture harness's.
+
+    python -m pytest test_memory_budget.py
+"""
+from checkpoint_log import CheckpointLog, carry_forward
+from memory_budget import MemoryBudget
+
+# (verb of each op) per example, as run_examples() logs them
+EXAMPLES = [['SUPERPOSE'], ['COUPLE'], ['FILTER', 'ENTANGLE'], ['INTERFERE'], ['FILTER', 'COUPLE', 'ENTANGLE']]
+
+
+def day_checkpoint(log_dir, day):
+    log = CheckpointLog(log_dir, day=day, agent_id='B1', reset=True)
+    for num, verbs in enumerate(EXAMPLES, 1):
+        log.append(
+            num,
+            {'example': num, 'operation': verbs[0], 'success': True},
+            strategies=[{'pattern': f"{v}_discovery", 'description': f"[COMPOUNDS] [{v}] [I=0] evaluated",
+                         'success_score': 0.85} for v in verbs],
+            rules=[f"[COMPOUNDS] [{v}] [I=0]" for v in verbs],
+        )
+    return log.end_of_day(operations=True)
+
+
+def campaign(tmp_path, budget, days=8):
+    checkpoint = None
+    for day in range(1, days + 1):
+        checkpoint = budget.apply(carry_forward(checkpoint, day_checkpoint(tmp_path, day), day), day)
+    return checkpoint
+
+
+def total_memories(checkpoint):
+    return (len(checkpoint['episodic']['episodes']) + len(checkpoint['strategic']['strategies'])
+            + len(checkpoint['creative_composition']['rules_invented']))
+
+
+def test_budget_is_enforced_and_keeps_an_episode(tmp_path):
+    for max_memories in (2, 4, 10, 17, 64):
+        checkpoint = campaign(tmp_path, MemoryBudget(max_memories))
+        assert total_memories(checkpoint) <= max_memories
+        episodes = checkpoint['episodic']['episodes']
+        assert episodes
+        assert {e['operation'] for e in episodes} <= {'SUPERPOSE', 'COUPLE', 'FILTER', 'INTERFERE'}
+
+
+def test_learned_strategies_outlast_compacted_patterns(tmp_path):
+    checkpoint = campaign(tmp_path, MemoryBudget(10))
+    patterns = [s['pattern'] for s in checkpoint['strategic']['strategies']]
+    assert not any(p.startswith('episodes_') for p in patterns)
+    assert 'ENTANGLE_discovery' in patterns
+
+
+def test_repeated_rules_keep_their_count(tmp_path):
+    checkpoint = campaign(tmp_path, MemoryBudget(64), days=3)
+    creative = checkpoint['creative_composition']
+    assert len(creative['rules_invented']) == len(set(creative['rules_invented']))
+    assert creative['rule_counts']['[COMPOUNDS] [FILTER] [I=0]'] == 6
+    assert creative['rule_counts']['[COMPOUNDS] [SUPERPOSE] [I=0]'] == 3
@@ -0,0 +1,157 @@
+"""
+Structured timing spans for orchestrate_mathematics and the components it calls.
+
+The bridge's internals are not ours to edit, so spans are added from the
+outside. trace_bridge() wraps orchestrate_mathematics in one span per rule,
+and instrument() wraps the public methods of the objects handed to the
+bridge (validator, H_total engine, adapter, memory). Calls they make
+during a rule become child spans of it. Each span carries the rule triple,
+agent id and compound count of the rule it ran under; these are held in a
+context variable, so concurrent pipeline stages keep them apart.
+
+    TRACER.enabled = True
+    TRACER.instrument(validator, 'validation')
+    TRACER.trace_bridge(bridge, 'B1')
+    ...
+    TRACER.write_jsonl('data/traces/run.jsonl')          # one span per line
+    TRACER.write_chrome('data/traces/run.chrome.json')   # chrome://tracing, Perfetto
+
+When TRACER.enabled is False nothing is wrapped and there is no overhead.
+"""
+import contextvars
+import inspect
+import itertools
+import json
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+# Span categories, in report order
+CATEGORIES = ('orchestrate', 'validation', 'h_total', 'adapter', 'memory')
+
+# (rule, agent_id, n_compounds, parent span id) of the rule being run
+_CURRENT = contextvars.ContextVar('trace_current', default=(None, None, None, None))
+
+
+def _rule_text(rule):
+    return f"[{rule.subject}] [{rule.verb}] [{rule.property}]"
+
+
+class Tracer:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.spans = []
+        self._ids = itertools.count(1)
+        self._instrumented = set()
+
+    @contextmanager
+    def span(self, name, category, rule=None, agent_id=None, n_compounds=None):
+        """Record one span. Unset fields come from the enclosing rule's span."""
+        cur_rule, cur_agent, cur_n, parent = _CURRENT.get()
+        span_id = next(self._ids)
+        record = {
+            'name': name, 'category': category,
+            'rule': rule or cur_rule, 'agent_id': agent_id or cur_agent,
+            'n_compounds': n_compounds if n_compounds is not None else cur_n,
+            'span_id': span_id, 'parent': parent, 'pid': os.getpid(),
+        }
+        token = _CURRENT.set((record['rule'], record['agent_id'], record['n_compounds'], span_id))
+        record['start'] = time.time()
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - t0
+            _CURRENT.reset(token)
+            self.spans.append(record)
+
+    # ---- wrapping ------------------------------------------------------------
+
+    def _wrap(self, fn, name, category):
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def traced(*args, **kwargs):
+                with self.span(name, category):
+                    return await fn(*args, **kwargs)
+        else:
+            @wraps(fn)
+            def traced(*args, **kwargs):
+                with self.span(name, category):
+                    return fn(*args, **kwargs)
+        return traced
+
+    def instrument(self, obj, category, methods=None):
+        """Wrap obj's public methods (or just methods) so each call is a span.
+
+        Methods are replaced on the instance, so isinstance checks still
+        pass. Instrumenting the same object twice is a no-op.
+        """
+        if obj is None or id(obj) in self._instrumented:
+            return obj
+        self._instrumented.add(id(obj))
+        if methods is None:
+            methods = [n for n, f in inspect.getmembers(type(obj), inspect.isfunction) if not n.startswith('_')]
+        for name in methods:
+            fn = getattr(obj, name, None)
+            if callable(fn):
+                setattr(obj, name, self._wrap(fn, f"{type(obj).__name__}.{name}", category))
+        return obj
+
+    def trace_bridge(self, bridge, agent_id, n_compounds=None):
+        """One 'orchestrate' span per orchestrate_mathematics call.
+
+        n_compounds is reported when ctx carries no 'compounds' (the bridge
+        then reads the adapter's full cached set).
+        """
+        compute = bridge.orchestrate_mathematics
+
+        async def orchestrate_mathematics(rule, ctx, *args, **kwargs):
+            compounds = ctx.get('compounds')
+            n = len(compounds) if compounds is not None else n_compounds
+            with self.span(_rule_text(rule), 'orchestrate', _rule_text(rule), agent_id, n):
+                return await compute(rule, ctx, *args, **kwargs)
+
+        bridge.orchestrate_mathematics = orchestrate_mathematics
+        return bridge
+
+    # ---- export --------------------------------------------------------------
+
+    def write_jsonl(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for span in sorted(self.spans, key=lambda s: s['start']):
+                f.write(json.dumps(span, default=str) + '\n')
+        return path
+
+    def write_chrome(self, path):
+        """Chrome trace event format: one complete ('X') event per span, one row per agent."""
+        agents = sorted({s['agent_id'] or '-' for s in self.spans})
+        tid = {a: i for i, a in enumerate(agents, 1)}
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid[a], 'args': {'name': a}}
+                  for pid in sorted({s['pid'] for s in self.spans}) for a in agents]
+        for s in sorted(self.spans, key=lambda s: s['start']):
+            events.append({
+                'name': s['name'], 'cat': s['category'], 'ph': 'X',
+                'ts': s['start'] * 1e6, 'dur': s['seconds'] * 1e6,
+                'pid': s['pid'], 'tid': tid[s['agent_id'] or '-'],
+                'args': {'rule': s['rule'], 'agent_id': s['agent_id'], 'n_compounds': s['n_compounds']},
+            })
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'}))
+        return path
+
+    def summary(self):
+        """{verb: {category: seconds}} summed over spans."""
+        out = {}
+        for s in self.spans:
+            verb = s['rule'].split('] [')[1] if s['rule'] else '-'
+            by_cat = out.setdefault(verb, dict.fromkeys(CATEGORIES, 0.0))
+            by_cat[s['category']] = by_cat.get(s['category'], 0.0) + s['seconds']
+        return out
+
+
+TRACER = Tracer()